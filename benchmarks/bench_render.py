@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: screen render + downscale time per render scale.
+
+Renders every screen with sample data at each supersampling factor (4x, 2x,
+1x), downscales to the 250x122 panel image the way Display.prepare does, and
+reports the time per screen plus the share of panel pixels that differ from
+the 4x LANCZOS reference.
+
+Run with: python3 benchmarks/bench_render.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)  # fonts/ is resolved relative to the working directory
+
+from PIL import ImageChops  # noqa: E402
+
+from display import downscale  # noqa: E402
+from models import BatteryData, EnergyDetails, EnergyHistory, ForecastData  # noqa: E402
+from rendering.canvas import set_render_scale  # noqa: E402
+from screens import get_screens  # noqa: E402
+
+WIDTH, HEIGHT = 250, 122
+ROUNDS = 5
+
+SAMPLE_DATA = {
+    "energy": EnergyDetails(production=23.4, self_consumption=9.8, feed_in=11.2, consumption=14.1, purchased=4.3),
+    "battery": BatteryData(state_of_charge=76, status="Charge", internal_temp=24.0, available_energy=7.6, power=1.8),
+    "history": EnergyHistory(
+        dates=[f"2026-10-{day:02d}" for day in range(1, 15)],
+        production=[12.0, 18.5, 3.2, 25.1, 22.0, 9.9, 0.0, 14.2, 19.7, 21.3, 8.8, 16.0, 23.4, 11.1],
+        consumption=[10.1, 9.8, 12.4, 11.0, 10.5, 13.2, 14.8, 9.1, 10.0, 11.7, 12.9, 10.2, 14.1, 9.5],
+    ),
+    "forecast": ForecastData(today_kwh=26.0, tomorrow_kwh=18.5, actual_production=23.4),
+}
+
+
+def render_panel_images(scale):
+    """Render all screens at a scale; return ({name: panel image}, seconds per screen)."""
+    set_render_scale(scale)
+    screens = get_screens(has_battery=True, has_forecast_config=True)
+    images = {}
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for render_fn, data_key, name in screens:
+            images[name] = downscale(render_fn(SAMPLE_DATA[data_key]), WIDTH, HEIGHT)
+    elapsed = (time.perf_counter() - start) / (ROUNDS * len(screens))
+    return images, elapsed
+
+
+def pixel_diff(a, b):
+    """Share of differing pixels between two 1-bit images."""
+    diff = ImageChops.logical_xor(a, b)
+    return sum(1 for v in diff.getdata() if v) / (a.width * a.height)
+
+
+def main():
+    # Warm font caches so the first scale is not penalized
+    render_panel_images(4)
+
+    reference, ref_time = render_panel_images(4)
+    print(f"{'scale':<8} {'ms/screen':>10} {'speedup':>8} {'avg diff':>9} {'max diff':>9}")
+    for scale in (4, 2, 1):
+        images, elapsed = (reference, ref_time) if scale == 4 else render_panel_images(scale)
+        diffs = [pixel_diff(reference[name], images[name]) for name in reference]
+        print(
+            f"{scale}x{'':<6} {elapsed * 1000:10.1f} {ref_time / elapsed:7.1f}x "
+            f"{sum(diffs) / len(diffs):8.1%} {max(diffs):8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: e-ink framebuffer transfer, per-byte vs batched SPI writes.
+
+Runs the real epd2in13_V3 driver against a fake spidev/gpiozero and compares
+the old per-byte transfer (one send_data call per framebuffer byte) with the
+batched send_data2 path now used by EPD.display and EPD.Lut.
+
+Reports the measured Python time per frame on this machine and a modeled
+Pi Zero time from the counted syscalls and GPIO toggles.
+
+Run with: python3 benchmarks/bench_spi.py
+"""
+
+import time
+
+from fake_hardware import install
+
+counters = install()
+
+from waveshare_epd import epd2in13_V3  # noqa: E402
+
+# Rough Pi Zero costs: spidev ioctl syscall, gpiozero pin write, 4 MHz SPI clock
+SYSCALL_US = 60.0
+GPIO_WRITE_US = 25.0
+SPI_BYTE_US = 8 / 4.0
+
+FRAMES = 20
+
+
+def legacy_display(epd, image):
+    """Pre-batching EPD.display: one send_data (DC/CS toggle + syscall) per byte."""
+    linewidth = (epd.width + 7) // 8
+    epd.send_command(0x24)
+    for j in range(0, epd.height):
+        for i in range(0, linewidth):
+            epd.send_data(image[i + j * linewidth])
+    epd.TurnOnDisplay()
+
+
+def legacy_lut(epd, lut):
+    """Pre-batching EPD.Lut: one send_data per LUT byte."""
+    epd.send_command(0x32)
+    for i in range(0, 153):
+        epd.send_data(lut[i])
+    epd.ReadBusy()
+
+
+def run(label, fn, epd, frame):
+    counters.reset()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn(epd, frame)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / FRAMES
+    calls = counters.spi_calls / FRAMES
+    gpio = counters.gpio_writes / FRAMES
+    nbytes = counters.spi_bytes / FRAMES
+    modeled_ms = (calls * SYSCALL_US + gpio * GPIO_WRITE_US + nbytes * SPI_BYTE_US) / 1000
+    print(f"{label:<24} {elapsed_ms:9.2f} ms {calls:9.0f} {gpio:9.0f} {nbytes:9.0f} {modeled_ms:12.1f} ms")
+    return modeled_ms
+
+
+def main():
+    epd = epd2in13_V3.EPD()
+    epd.init()
+    frame = bytearray(range(256)) * 16  # 4096 bytes, display() sends the first 4000
+    lut = epd.lut_full_update
+
+    print(f"{'path':<24} {'host time':>12} {'syscalls':>9} {'gpio':>9} {'bytes':>9} {'Pi Zero est.':>15}")
+    before = run("display (per-byte)", legacy_display, epd, frame)
+    after = run("display (batched)", lambda e, f: e.display(f), epd, frame)
+    lut_before = run("Lut (per-byte)", lambda e, f: legacy_lut(e, lut), epd, frame)
+    lut_after = run("Lut (batched)", lambda e, f: e.Lut(lut), epd, frame)
+    print()
+    print(f"frame transfer: {before:.1f} ms -> {after:.1f} ms ({before / after:.0f}x)")
+    print(f"LUT upload:     {lut_before:.1f} ms -> {lut_after:.1f} ms ({lut_before / lut_after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: startup time to main() and its import cost.
+
+Starts a fresh interpreter with `python -X importtime -c "import main"`
+several times and reports the median wall time of the process (interpreter
+startup plus all module-level imports, i.e. the time before main() can
+run), the cumulative import time of main, and the packages that spend the
+most self time importing.
+
+Results can be recorded in benchmarks/startup_times.json so a regression
+shows up against the last recorded run (the Pi Zero is roughly 10x slower
+than a desktop, so a few ms here are noticeable on the device):
+
+Run with: python3 benchmarks/bench_startup.py [--record LABEL]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS = ROOT / "benchmarks" / "startup_times.json"
+ROUNDS = 7
+TOP = 8
+
+
+def run_once():
+    """Import main in a fresh interpreter; return (wall ms, main cumulative ms, self ms per package)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    main_ms = 0.0
+    packages = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        packages[name.split(".")[0]] += int(self_us) / 1000
+        if name == "main":
+            main_ms = int(cumulative_us) / 1000
+    return wall_ms, main_ms, packages
+
+
+def measure():
+    """Median wall and import times over ROUNDS runs (after one warm-up for the bytecode cache)."""
+    run_once()
+    runs = [run_once() for _ in range(ROUNDS)]
+    packages = defaultdict(list)
+    for _, _, per_package in runs:
+        for name, ms in per_package.items():
+            packages[name].append(ms)
+    top = sorted(((statistics.median(v), k) for k, v in packages.items()), reverse=True)[:TOP]
+    return {
+        "wall_ms": round(statistics.median(r[0] for r in runs), 1),
+        "import_main_ms": round(statistics.median(r[1] for r in runs), 1),
+        "top_packages_ms": {name: round(ms, 1) for ms, name in top},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure startup time to main()")
+    parser.add_argument("--record", metavar="LABEL", help=f"Append the result to {RESULTS.name}")
+    args = parser.parse_args()
+
+    result = measure()
+    print(f"time to main (process wall): {result['wall_ms']:7.1f} ms")
+    print(f"import main (cumulative):    {result['import_main_ms']:7.1f} ms")
+    print(f"\n{'package':<24} {'self ms':>8}")
+    for name, ms in result["top_packages_ms"].items():
+        print(f"{name:<24} {ms:8.1f}")
+
+    history = json.loads(RESULTS.read_text()) if RESULTS.exists() else []
+    if history:
+        last = history[-1]
+        print(
+            f"\nvs. '{last['label']}' ({last['date']}): "
+            f"wall {result['wall_ms'] - last['wall_ms']:+.1f} ms, "
+            f"import main {result['import_main_ms'] - last['import_main_ms']:+.1f} ms"
+        )
+    if args.record:
+        history.append({
+            "label": args.record,
+            "date": date.today().isoformat(),
+            "python": sys.version.split()[0],
+            **result,
+        })
+        RESULTS.write_text(json.dumps(history, indent=2) + "\n")
+        print(f"Recorded as '{args.record}' in {RESULTS.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
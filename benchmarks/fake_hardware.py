@@ -0,0 +1,121 @@
+"""
+Fake Raspberry Pi hardware for driving the waveshare_epd driver off-device.
+
+Installs stand-ins for spidev and gpiozero and makes epdconfig pick its
+RaspberryPi implementation, so the real driver code runs unchanged while
+every SPI syscall and GPIO toggle is counted instead of performed.
+
+Usage:
+    from fake_hardware import install
+    counters = install()
+    from waveshare_epd import epd2in13_V3
+"""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+# Repo root and bundled driver
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "lib"))
+
+
+class Counters:
+    """Call counters shared by all fake devices."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.spi_calls = 0
+        self.spi_bytes = 0
+        self.gpio_writes = 0
+
+
+counters = Counters()
+
+
+class FakeSpiDev:
+    def __init__(self):
+        self.max_speed_hz = 0
+        self.mode = 0
+
+    def open(self, bus, device):
+        pass
+
+    def close(self):
+        pass
+
+    def writebytes(self, data):
+        counters.spi_calls += 1
+        counters.spi_bytes += len(data)
+
+    def writebytes2(self, data):
+        counters.spi_calls += 1
+        counters.spi_bytes += len(data)
+
+
+class FakeLED:
+    def __init__(self, pin):
+        self.pin = pin
+        self.value = 0
+
+    def on(self):
+        counters.gpio_writes += 1
+        self.value = 1
+
+    def off(self):
+        counters.gpio_writes += 1
+        self.value = 0
+
+    def close(self):
+        pass
+
+
+class FakeButton:
+    """BUSY input: always idle, or released at once when waited on."""
+
+    def __init__(self, pin, pull_up=False):
+        self.pin = pin
+        self.value = 0
+
+    def wait_for_inactive(self, timeout=None):
+        self.value = 0
+        return True
+
+    def close(self):
+        pass
+
+
+def install() -> Counters:
+    """Install the fake modules (idempotent) and return the shared counters."""
+    if "spidev" not in sys.modules:
+        spidev = types.ModuleType("spidev")
+        spidev.SpiDev = FakeSpiDev
+        sys.modules["spidev"] = spidev
+
+        gpiozero = types.ModuleType("gpiozero")
+        gpiozero.LED = FakeLED
+        gpiozero.Button = FakeButton
+        sys.modules["gpiozero"] = gpiozero
+
+    if "waveshare_epd.epdconfig" not in sys.modules:
+        # epdconfig picks its backend by grepping /proc/cpuinfo at import time
+        real_popen = subprocess.Popen
+
+        class _CpuinfoPopen:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def communicate(self):
+                return "Model : Raspberry Pi Zero W Rev 1.1\n", ""
+
+        subprocess.Popen = _CpuinfoPopen
+        try:
+            import waveshare_epd.epdconfig  # noqa: F401
+        finally:
+            subprocess.Popen = real_popen
+
+    return counters
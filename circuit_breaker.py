@@ -0,0 +1,117 @@
+"""
+Circuit breaker for the SolarEdge API transport.
+
+During an outage every request would otherwise run the full retry backoff
+and timeouts, blocking the poll for minutes and spending quota on requests
+that are certain to fail. The breaker tracks consecutive failed requests:
+
+- closed: requests go out normally
+- open: after failure_threshold failures in a row, requests fail fast
+  (no network traffic) for a cool-down period
+- half-open: after the cool-down one cheap probe request is sent; on
+  success the breaker closes, on failure it opens again with a doubled
+  cool-down (up to max_cooldown_seconds)
+
+The state is published with each DataSnapshot so the display loop can show
+the error screen while the API is known to be down.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker (requests run on the fetcher's worker pool).
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the breaker
+        cooldown_seconds: Initial time the breaker stays open before probing
+        max_cooldown_seconds: Upper bound for the doubled cool-down
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 60,
+                 max_cooldown_seconds: float = 900):
+        """Create a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown_seconds: Initial open period before the first probe
+            max_cooldown_seconds: Longest open period after repeated failed probes
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._cooldown = cooldown_seconds
+        self._open_until = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        return self._state
+
+    def allow_request(self, probe: Callable[[], bool]) -> bool:
+        """
+        Decide whether a request may be sent now.
+
+        When the cool-down has expired, the calling thread runs probe() while
+        the breaker is half-open; concurrent callers fail fast meanwhile.
+
+        Args:
+            probe: Callable sending one cheap request, returning True on success
+
+        Returns:
+            True if the request may be sent, False to fail fast
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN or time.monotonic() < self._open_until:
+                return False
+            self._state = HALF_OPEN
+
+        logging.info("Circuit breaker half-open, probing API")
+        ok = probe()
+        with self._lock:
+            if ok:
+                self._close()
+            else:
+                self._cooldown = min(self._cooldown * 2, self.max_cooldown_seconds)
+                self._open("probe failed")
+        return ok
+
+    def record_success(self) -> None:
+        """Record a request that reached the API (resets the failure count)."""
+        with self._lock:
+            if self._state != CLOSED:
+                self._close()
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request (timeout, connection error, 5xx/429)."""
+        with self._lock:
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open(f"{self._failures} consecutive failures")
+
+    def _open(self, reason: str) -> None:
+        # Caller holds the lock
+        self._state = OPEN
+        self._open_until = time.monotonic() + self._cooldown
+        logging.warning(f"Circuit breaker open ({reason}), failing fast for {self._cooldown:.0f}s")
+
+    def _close(self) -> None:
+        # Caller holds the lock
+        if self._state != CLOSED:
+            logging.info("Circuit breaker closed, API reachable again")
+        self._state = CLOSED
+        self._failures = 0
+        self._cooldown = self.cooldown_seconds
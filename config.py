@@ -13,10 +13,19 @@ Usage:
 """
 
 from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
 from typing import Optional
+from zoneinfo import ZoneInfo
 import os
 import logging
 
+from sun import is_daylight, is_polar_night, sun_times
+
+# Local timezone of the sleep window and the daily API quota
+TIMEZONE = "Europe/Berlin"
+
+SLEEP_MODES = ("fixed", "sun")
+
 
 @dataclass
 class Config:
@@ -30,10 +39,23 @@ class Config:
 
     Optional fields (with defaults):
         - poll_interval: Minutes between API polls (default: 5, minimum: 1)
+        - poll_min: Shortest adaptive poll interval in minutes (default: poll_interval)
+        - poll_max: Longest adaptive poll interval in minutes (default: poll_interval or poll_min
+          if longer, i.e. adaptive polling is off unless configured)
         - sleep_start_hour: Hour to pause polling, 0-23 (default: 0 = midnight)
         - sleep_end_hour: Hour to resume polling, 0-23 (default: 6 = 6 AM)
+        - sleep_mode: "fixed" (sleep_start/end hours) or "sun" (dark between
+          sunset and sunrise at FORECAST_LAT/LON) (default: fixed)
+        - sunrise_offset: Minutes after sunrise to wake in sun mode, negative = before (default: 0)
+        - sunset_offset: Minutes after sunset to sleep in sun mode, negative = before (default: 30)
         - debug: Enable debug mode (default: False)
         - log_level: Logging level (default: INFO)
+        - refresh_mode: E-ink refresh mode, "full" or "partial" (default: full)
+        - full_refresh_every: Partial updates between full refreshes (default: 10, minimum: 1)
+        - busy_timeout: Seconds to wait for the e-ink BUSY pin (default: 10, minimum: 1)
+        - render_scale: Supersampling factor 1, 2 or 4 (default: 4 = best quality, slowest)
+        - state_dir: Directory for state kept across restarts (default: state)
+        - daily_budget: SolarEdge requests per day to stay under (default: 280, API limit: 300)
     """
 
     # Required credentials
@@ -42,10 +64,21 @@ class Config:
 
     # Optional operational settings with defaults
     poll_interval: int = 5
+    poll_min: int = 5
+    poll_max: int = 5
     sleep_start_hour: int = 0
     sleep_end_hour: int = 6
+    sleep_mode: str = "fixed"
+    sunrise_offset: int = 0
+    sunset_offset: int = 30
     debug: bool = False
     log_level: str = "INFO"
+    refresh_mode: str = "full"
+    full_refresh_every: int = 10
+    busy_timeout: int = 10
+    render_scale: int = 4
+    state_dir: str = "state"
+    daily_budget: int = 280
 
     # Optional forecast configuration (all 5 must be present to enable forecast screen)
     forecast_lat: Optional[float] = None
@@ -84,6 +117,23 @@ class Config:
         except ValueError:
             errors.append(f"  - SOLAREDGE_POLL_INTERVAL: Must be an integer (got '{poll_str}')")
 
+        # Adaptive polling range (equal values disable adaptive polling)
+        poll_min_str = os.environ.get("SOLAREDGE_POLL_MIN", str(self.poll_interval))
+        try:
+            self.poll_min = int(poll_min_str)
+            if self.poll_min < 1:
+                errors.append("  - SOLAREDGE_POLL_MIN: Must be >= 1 minute")
+        except ValueError:
+            errors.append(f"  - SOLAREDGE_POLL_MIN: Must be an integer (got '{poll_min_str}')")
+
+        poll_max_str = os.environ.get("SOLAREDGE_POLL_MAX", str(max(self.poll_interval, self.poll_min)))
+        try:
+            self.poll_max = int(poll_max_str)
+            if self.poll_max < self.poll_min:
+                errors.append("  - SOLAREDGE_POLL_MAX: Must be >= SOLAREDGE_POLL_MIN")
+        except ValueError:
+            errors.append(f"  - SOLAREDGE_POLL_MAX: Must be an integer (got '{poll_max_str}')")
+
         # Load and validate sleep start hour
         start_str = os.environ.get("SOLAREDGE_SLEEP_START", "0")
         try:
@@ -102,6 +152,23 @@ class Config:
         except ValueError:
             errors.append(f"  - SOLAREDGE_SLEEP_END: Must be an integer (got '{end_str}')")
 
+        self.sleep_mode = os.environ.get("SOLAREDGE_SLEEP_MODE", "fixed").strip().lower()
+        if self.sleep_mode not in SLEEP_MODES:
+            errors.append(f"  - SOLAREDGE_SLEEP_MODE: Must be one of {', '.join(SLEEP_MODES)} (got '{self.sleep_mode}')")
+        elif self.sleep_mode == "sun" and (
+            self._load_optional_float("FORECAST_LAT") is None or self._load_optional_float("FORECAST_LON") is None
+        ):
+            errors.append("  - SOLAREDGE_SLEEP_MODE: 'sun' requires FORECAST_LAT and FORECAST_LON")
+
+        for key, attr in (("SOLAREDGE_SUNRISE_OFFSET", "sunrise_offset"), ("SOLAREDGE_SUNSET_OFFSET", "sunset_offset")):
+            offset_str = os.environ.get(key, str(getattr(self, attr)))
+            try:
+                setattr(self, attr, int(offset_str))
+                if not (-180 <= getattr(self, attr) <= 180):
+                    errors.append(f"  - {key}: Must be -180 to 180 minutes")
+            except ValueError:
+                errors.append(f"  - {key}: Must be an integer (got '{offset_str}')")
+
         # Parse boolean (CRITICAL: avoid bool() trap where "false" is truthy)
         debug_str = os.environ.get("SOLAREDGE_DEBUG", "false").lower()
         self.debug = debug_str in ("true", "1", "yes", "on")
@@ -114,6 +181,49 @@ class Config:
         else:
             errors.append(f"  - SOLAREDGE_LOG_LEVEL: Must be one of DEBUG, INFO, WARNING, ERROR, CRITICAL (got '{log_level_str}')")
 
+        # Load and validate e-ink refresh mode
+        refresh_mode_str = os.environ.get("SOLAREDGE_REFRESH_MODE", "full").lower()
+        if refresh_mode_str in ("full", "partial"):
+            self.refresh_mode = refresh_mode_str
+        else:
+            errors.append(f"  - SOLAREDGE_REFRESH_MODE: Must be 'full' or 'partial' (got '{refresh_mode_str}')")
+
+        full_every_str = os.environ.get("SOLAREDGE_FULL_REFRESH_EVERY", "10")
+        try:
+            self.full_refresh_every = int(full_every_str)
+            if self.full_refresh_every < 1:
+                errors.append("  - SOLAREDGE_FULL_REFRESH_EVERY: Must be >= 1")
+        except ValueError:
+            errors.append(f"  - SOLAREDGE_FULL_REFRESH_EVERY: Must be an integer (got '{full_every_str}')")
+
+        busy_timeout_str = os.environ.get("SOLAREDGE_BUSY_TIMEOUT", "10")
+        try:
+            self.busy_timeout = int(busy_timeout_str)
+            if self.busy_timeout < 1:
+                errors.append("  - SOLAREDGE_BUSY_TIMEOUT: Must be >= 1 second")
+        except ValueError:
+            errors.append(f"  - SOLAREDGE_BUSY_TIMEOUT: Must be an integer (got '{busy_timeout_str}')")
+
+        render_scale_str = os.environ.get("SOLAREDGE_RENDER_SCALE", "4")
+        try:
+            self.render_scale = int(render_scale_str)
+            if self.render_scale not in (1, 2, 4):
+                errors.append("  - SOLAREDGE_RENDER_SCALE: Must be 1, 2 or 4")
+        except ValueError:
+            errors.append(f"  - SOLAREDGE_RENDER_SCALE: Must be an integer (got '{render_scale_str}')")
+
+        self.state_dir = os.environ.get("SOLAREDGE_STATE_DIR", "state").strip()
+        if not self.state_dir:
+            errors.append("  - SOLAREDGE_STATE_DIR: Must not be empty")
+
+        budget_str = os.environ.get("SOLAREDGE_DAILY_BUDGET", "280")
+        try:
+            self.daily_budget = int(budget_str)
+            if self.daily_budget < 1:
+                errors.append("  - SOLAREDGE_DAILY_BUDGET: Must be >= 1 request")
+        except ValueError:
+            errors.append(f"  - SOLAREDGE_DAILY_BUDGET: Must be an integer (got '{budget_str}')")
+
         # Report all errors at once
         if errors:
             error_msg = "ERROR: Configuration validation failed:\n" + "\n".join(errors)
@@ -140,10 +250,23 @@ class Config:
         masked_site = f"****{self.site_id[-4:]}" if len(self.site_id) >= 4 else "****"
         logging.info(f"  SOLAREDGE_SITE_ID: {masked_site}")
         logging.info(f"  SOLAREDGE_POLL_INTERVAL: {self.poll_interval} min")
-        logging.info(f"  SOLAREDGE_SLEEP_START: {self.sleep_start_hour}:00")
-        logging.info(f"  SOLAREDGE_SLEEP_END: {self.sleep_end_hour}:00")
+        logging.info(f"  SOLAREDGE_POLL_MIN/MAX: {self.poll_min}-{self.poll_max} min")
+        logging.info(f"  SOLAREDGE_SLEEP_MODE: {self.sleep_mode}")
+        if self.sleep_mode == "sun":
+            logging.info(f"  SOLAREDGE_SUNRISE_OFFSET: {self.sunrise_offset:+d} min")
+            logging.info(f"  SOLAREDGE_SUNSET_OFFSET: {self.sunset_offset:+d} min")
+        else:
+            logging.info(f"  SOLAREDGE_SLEEP_START: {self.sleep_start_hour}:00")
+            logging.info(f"  SOLAREDGE_SLEEP_END: {self.sleep_end_hour}:00")
         logging.info(f"  SOLAREDGE_DEBUG: {self.debug}")
         logging.info(f"  SOLAREDGE_LOG_LEVEL: {self.log_level}")
+        logging.info(f"  SOLAREDGE_REFRESH_MODE: {self.refresh_mode}")
+        if self.refresh_mode == "partial":
+            logging.info(f"  SOLAREDGE_FULL_REFRESH_EVERY: {self.full_refresh_every}")
+        logging.info(f"  SOLAREDGE_BUSY_TIMEOUT: {self.busy_timeout} s")
+        logging.info(f"  SOLAREDGE_RENDER_SCALE: {self.render_scale}x")
+        logging.info(f"  SOLAREDGE_STATE_DIR: {self.state_dir}")
+        logging.info(f"  SOLAREDGE_DAILY_BUDGET: {self.daily_budget} requests")
 
         # Log forecast configuration status
         if self.has_forecast_config():
@@ -182,6 +305,49 @@ class Config:
             logging.warning(f"{key}: Invalid integer value '{value}', ignoring")
             return None
 
+    def is_sleeping(self, now: datetime) -> bool:
+        """Return True if the aware local time now is inside the sleep window.
+
+        In sun mode the window runs from sunset + sunset_offset to
+        sunrise + sunrise_offset at the forecast location.
+        """
+        if self.sleep_mode == "sun":
+            return not is_daylight(now, self.forecast_lat, self.forecast_lon,
+                                   self.sunrise_offset, self.sunset_offset)
+        return is_sleep_hour(now.hour, self.sleep_start_hour, self.sleep_end_hour)
+
+    def sleep_ends_at(self, now: datetime) -> Optional[datetime]:
+        """Return when the sleep window now is in ends (call only while sleeping).
+
+        Args:
+            now: Aware local time
+
+        Returns:
+            Aware local wake-up time, or None if there is none within a day
+            (polar night in sun mode)
+        """
+        if self.sleep_mode == "sun":
+            for day in (now.date(), now.date() + timedelta(days=1)):
+                if is_polar_night(day, self.forecast_lat, self.forecast_lon):
+                    continue
+                wake = sun_times(day, self.forecast_lat, self.forecast_lon)[0] + timedelta(minutes=self.sunrise_offset)
+                if wake > now:
+                    return wake.astimezone(now.tzinfo)
+            return None  # Polar night: no sunrise in sight
+        wake = now.replace(hour=self.sleep_end_hour, minute=0, second=0, microsecond=0)
+        return wake if wake > now else wake + timedelta(days=1)
+
+    def is_sleep_hour(self, hour: int) -> bool:
+        """Return True if the given local hour (0-23) is inside the sleep window.
+
+        Hour granularity for the quota planner; in sun mode an hour counts as
+        sleeping if its midpoint is, using today's sunrise and sunset.
+        """
+        if self.sleep_mode == "sun":
+            return is_dark_hour(datetime.now(ZoneInfo(TIMEZONE)).date(), hour, self.forecast_lat, self.forecast_lon,
+                                self.sunrise_offset, self.sunset_offset)
+        return is_sleep_hour(hour, self.sleep_start_hour, self.sleep_end_hour)
+
     def has_forecast_config(self) -> bool:
         """Return True if all 5 forecast parameters are configured."""
         return all([
@@ -191,3 +357,34 @@ class Config:
             self.forecast_azimuth is not None,
             self.forecast_kwp is not None,
         ])
+
+
+def is_dark_hour(day: date, hour: int, lat: float, lon: float,
+                 sunrise_offset: int = 0, sunset_offset: int = 0) -> bool:
+    """
+    Return True if a local hour (0-23) of a day is inside the sun-mode sleep window.
+
+    The hour counts as sleeping if its midpoint is outside the shifted
+    sunrise-sunset window at (lat, lon).
+    """
+    midpoint = datetime.combine(day, time(hour, 30), tzinfo=ZoneInfo(TIMEZONE))
+    return not is_daylight(midpoint, lat, lon, sunrise_offset, sunset_offset)
+
+
+def is_sleep_hour(hour: int, start: int, end: int) -> bool:
+    """
+    Return True if hour (0-23) is inside the sleep window [start, end).
+
+    Handles midnight-crossing windows (e.g., 23 to 6). Returns False if
+    start == end (no sleep window).
+    """
+    # No sleep window if start == end
+    if start == end:
+        return False
+
+    # Handle midnight-crossing
+    if start <= end:
+        # Normal window: e.g., 0 to 6
+        return start <= hour < end
+    # Crosses midnight: e.g., 23 to 6 means (hour >= 23) or (hour < 6)
+    return hour >= start or hour < end
@@ -0,0 +1,65 @@
+"""
+Time budget shared by all requests of one poll.
+
+A Deadline is created when a poll starts and passed into every API call.
+Each request caps its timeout at the time left, retries only while there
+is time for the backoff plus another attempt, and gives up as soon as the
+deadline passes. That bounds a poll's worst-case latency no matter how
+many endpoints are slow.
+
+The deadline can also carry a cancel event (the fetcher's stop event):
+backoff waits return immediately when it is set, and no new attempt starts,
+so shutdown is not held up by retries.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class Deadline:
+    """Absolute point in time (monotonic clock) with optional cancellation."""
+
+    def __init__(self, seconds: float, cancel: Optional[threading.Event] = None):
+        """Start a deadline seconds from now.
+
+        Args:
+            seconds: Time budget
+            cancel: Event that aborts waits and further attempts when set
+        """
+        self._expires = time.monotonic() + seconds
+        self._cancel = cancel or threading.Event()
+
+    def remaining(self) -> float:
+        """Seconds left (0 if expired or cancelled)."""
+        if self._cancel.is_set():
+            return 0.0
+        return max(0.0, self._expires - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        """True if the cancel event is set."""
+        return self._cancel.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """True if no time is left or the deadline was cancelled."""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float) -> float:
+        """Per-request timeout: cap, shortened to the time left."""
+        return min(cap, self.remaining())
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Wait up to seconds (never beyond the deadline).
+
+        Returns:
+            True if the full wait elapsed, False if cancelled or the deadline
+            was reached first
+        """
+        remaining = self.remaining()
+        if seconds > remaining:
+            self._cancel.wait(remaining)
+            return False
+        return not self._cancel.wait(seconds)
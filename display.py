@@ -5,22 +5,39 @@ appropriate backend:
 - E-ink hardware (waveshare_epd) when available
 - PNG file output (to ./debug/) as fallback for development
 
-This is a STUB for Phase 4. Full rendering logic will be implemented later.
+Rendering is split into prepare() (downscale and pack, CPU only) and show()
+(SPI transfer and refresh). RenderAhead uses this split to prepare the next
+screen while the panel is busy with the current one.
+
+During the night sleep window the panel is put into deep sleep (controller
+off, SPI closed, 5V rail off). wake() brings it back through the short
+init path (reset, registers, LUT) without the flashing Clear, and the
+wake-to-first-frame latency is logged.
 """
 
+import hashlib
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from PIL import Image
 
-# Try to import e-ink driver (error stored for deferred logging)
-_EINK_IMPORT_ERROR = None
-try:
-    from waveshare_epd import epd2in13_V3
-    EINK_AVAILABLE = True
-except Exception as e:
-    EINK_AVAILABLE = False
-    _EINK_IMPORT_ERROR = f"{type(e).__name__}: {e}"
+
+def load_eink_driver():
+    """
+    Import the e-ink driver.
+
+    Done on first use rather than at module import: the driver pulls in the
+    GPIO and SPI libraries, which the PNG backend never needs.
+
+    Returns:
+        (epd2in13_V3 module, None), or (None, error message) if unavailable
+    """
+    try:
+        from waveshare_epd import epd2in13_V3
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    return epd2in13_V3, None
 
 
 class Display:
@@ -31,20 +48,53 @@ class Display:
     - PNG files if not (development mode)
     """
 
-    def __init__(self, debug_mode: bool = False):
+    def __init__(self, debug_mode: bool = False, refresh_mode: str = "full", full_refresh_every: int = 10,
+                 busy_timeout: float = 10, clear_on_init: bool = True):
         """Initialize display backend.
 
         Args:
             debug_mode: Force PNG backend even if e-ink available
+            refresh_mode: "full" (flashing full refresh every time) or
+                "partial" (update only changed row bands via the partial LUT)
+            full_refresh_every: In partial mode, do a full refresh after this
+                many partial updates to clear ghosting
+            busy_timeout: Seconds to wait for the panel's BUSY pin before
+                giving up on a refresh (prevents hanging on a stuck pin)
+            clear_on_init: Clear the panel after init; False when a restored
+                frame is shown right away (saves a full flashing refresh)
         """
         self.width = 250
         self.height = 122
-        self.scale_factor = 4  # 4x supersampling (render at 1000x488)
+        self.refresh_mode = refresh_mode
+        self.full_refresh_every = full_refresh_every
 
-        if not debug_mode and EINK_AVAILABLE:
-            self.epd = epd2in13_V3.EPD()
+        # Partial mode: frame currently held as base image in panel RAM, and
+        # partial updates done since the last full refresh
+        self._base_frame = None
+        self._partial_updates = 0
+
+        # Content hash of the last frame shown per screen name, and the name of
+        # the screen currently on the panel (None after clear/startup)
+        self._frame_hashes = {}
+        self._panel_screen = None
+        self.refreshes = 0
+        self.skipped_refreshes = 0
+        self._busy_timeouts = 0  # driver BUSY timeouts already logged
+
+        # Deep sleep state: panel known to be blank, panel asleep, and the
+        # monotonic time of the last wake() until its first frame is shown
+        self._cleared = False
+        self._asleep = False
+        self._woke_at = None
+
+        driver, import_error = (None, None) if debug_mode else load_eink_driver()
+        if driver is not None:
+            self.epd = driver.EPD()
+            self.epd.busy_timeout = busy_timeout
             self.epd.init()
-            self.epd.Clear(0xFF)
+            if clear_on_init:
+                self.epd.Clear(0xFF)
+                self._cleared = True
             self.backend = "eink"
             logging.info("Display: E-ink hardware initialized")
         else:
@@ -53,47 +103,314 @@ class Display:
             os.makedirs("debug", exist_ok=True)
             reason = "debug mode" if debug_mode else "driver not found"
             logging.info(f"Display: PNG backend ({reason})")
-            if _EINK_IMPORT_ERROR and not debug_mode:
-                logging.warning(f"E-ink driver import failed: {_EINK_IMPORT_ERROR}")
+            if import_error:
+                logging.warning(f"E-ink driver import failed: {import_error}")
 
-    def render(self, image, name: str = "screen"):
-        """Render image to display or save as PNG.
+    def prepare(self, image):
+        """Convert a rendered screen into a frame ready for show().
 
-        Uses LANCZOS resampling for high-quality downsampling to e-ink resolution.
+        This is the CPU-heavy half of rendering and touches no hardware, so it
+        can run in a worker thread while the panel is busy refreshing.
 
         Args:
-            image: PIL Image to render (1000x488 high-res)
+            image: PIL Image to render (canvas at the render scale, see downscale())
+
+        Returns:
+            Packed framebuffer (e-ink backend) or the image itself (PNG backend)
+        """
+        if self.backend == "eink":
+            return self.epd.getbuffer(downscale(image, self.width, self.height))
+        return image
+
+    def show(self, frame, name: str = "screen"):
+        """Send a frame from prepare() to the display or save it as PNG.
+
+        On e-ink this is only the SPI transfer and the panel refresh. Both are
+        skipped when the panel already shows this screen with identical
+        content (same frame hash), which is counted in skipped_refreshes.
+
+        Args:
+            frame: Frame returned by prepare()
             name: Base filename for PNG output
         """
+        frame_hash = self._frame_hash(frame)
+        if self._panel_screen == name and self._frame_hashes.get(name) == frame_hash:
+            self.skipped_refreshes += 1
+            logging.info(
+                f"Skipped refresh for '{name}' (frame unchanged, "
+                f"{self.skipped_refreshes} skipped / {self.refreshes} refreshed)"
+            )
+            return
+
+        self.wake()
         if self.backend == "eink":
-            # High-quality downsampling: 1-bit -> grayscale -> resize -> 1-bit
-            gray = image.convert('L')
-            scaled = gray.resize((self.width, self.height), Image.LANCZOS)
-            final = scaled.convert('1')
-            self.epd.display(self.epd.getbuffer(final))
-            logging.info(f"Rendered '{name}' to e-ink display")
+            if self.refresh_mode == "partial":
+                self._show_partial(frame, name)
+            else:
+                self.epd.display(frame)
+                logging.info(f"Rendered '{name}' to e-ink display (refresh {self.epd.last_busy_ms:.0f} ms)")
+            self._log_busy_timeouts()
         else:
             # Save high-res PNG to debug folder (for visual inspection)
             filename = f"debug/{name}_{datetime.now():%Y%m%d_%H%M%S}.png"
-            image.save(filename)
-            logging.info(f"Rendered '{name}' ({image.width}x{image.height}) to {filename}")
+            frame.save(filename)
+            logging.info(f"Rendered '{name}' ({frame.width}x{frame.height}) to {filename}")
+
+        self.refreshes += 1
+        self._frame_hashes[name] = frame_hash
+        self._panel_screen = name
+        self._cleared = False
+
+        if self._woke_at is not None:
+            logging.info(f"Wake to first frame: {(time.monotonic() - self._woke_at) * 1000:.0f} ms")
+            self._woke_at = None
+
+    def restore(self, frame: bytes, name: str) -> bool:
+        """Show a packed frame persisted by a previous run (e-ink only).
+
+        Args:
+            frame: Packed framebuffer from an earlier prepare()
+            name: Screen the frame belongs to
+
+        Returns:
+            True if the frame was shown, False if not applicable (PNG
+            backend or a frame of the wrong size)
+        """
+        if self.backend != "eink":
+            return False
+        if len(frame) != (self.epd.width + 7) // 8 * self.epd.height:
+            logging.warning(f"Ignoring restored frame of {len(frame)} bytes (wrong size)")
+            return False
+        self.show(frame, name)
+        return True
+
+    def _show_partial(self, frame, name: str):
+        """Show a frame through the partial LUT, writing only changed rows.
+
+        Falls back to a full refresh (which also stores the frame as the
+        panel's base image) on the first frame and every full_refresh_every
+        partial updates.
+        """
+        if self._base_frame is None or self._partial_updates >= self.full_refresh_every:
+            self.epd.init()  # Restore the full-refresh LUT
+            self.epd.displayPartBaseImage(frame)
+            self._partial_updates = 0
+            logging.info(f"Rendered '{name}' to e-ink display (full refresh {self.epd.last_busy_ms:.0f} ms)")
+        else:
+            bands = _dirty_bands(self._base_frame, frame, linewidth=(self.epd.width + 7) // 8)
+            if bands:
+                self.epd.displayPartialBands(frame, bands)
+                self._partial_updates += 1
+            rows = sum(end - start + 1 for start, end in bands)
+            logging.info(
+                f"Rendered '{name}' to e-ink display "
+                f"(partial: {len(bands)} bands, {rows} rows, refresh {self.epd.last_busy_ms:.0f} ms)"
+            )
+        self._base_frame = bytes(frame)
+
+    def _log_busy_timeouts(self):
+        """Warn about BUSY timeouts the driver hit since the last refresh (stuck pin, failing panel)."""
+        timeouts = self.epd.busy_timeouts
+        if timeouts > self._busy_timeouts:
+            logging.warning(
+                f"E-ink BUSY timeout: gave up after {self.epd.last_busy_ms:.0f} ms "
+                f"({timeouts - self._busy_timeouts} new, {timeouts} since start)"
+            )
+            self._busy_timeouts = timeouts
+
+    def _frame_hash(self, frame) -> bytes:
+        """Content hash of a frame (packed buffer or PNG-backend image)."""
+        data = frame if self.backend == "eink" else frame.tobytes()
+        return hashlib.blake2b(bytes(data), digest_size=16).digest()
+
+    def render(self, image, name: str = "screen"):
+        """Render image to display or save as PNG.
+
+        Args:
+            image: PIL Image to render, at the configured render scale (1000x488 at 4x)
+            name: Base filename for PNG output
+        """
+        self.show(self.prepare(image), name)
 
     def clear(self):
-        """Clear the display."""
+        """Clear the display (skipped if it is already blank)."""
+        self._panel_screen = None
+        if self._cleared:
+            return
         if self.backend == "eink" and self.epd:
+            self.wake()
+            if self._base_frame is not None:
+                self.epd.init()  # Restore the full-refresh LUT after partial updates
+                self._base_frame = None
             self.epd.Clear(0xFF)
             logging.info("Display cleared")
+        self._cleared = True
+
+    def deep_sleep(self):
+        """Put the panel into deep sleep for the night (no-op if already asleep).
+
+        The panel keeps showing its last image without power. Partial mode
+        starts over with a full refresh after wake(), since the controller's
+        base image does not survive the power-off.
+        """
+        if self._asleep:
+            return
+        if self.backend == "eink" and self.epd:
+            self.epd.sleep()  # Deep sleep command 0x10, then SPI close and 5V off
+        self._asleep = True
+        self._base_frame = None
+        self._woke_at = None
+        logging.info("Display in deep sleep")
+
+    def wake(self):
+        """Bring the panel out of deep sleep (no-op if awake).
+
+        Re-runs the driver init (reset, register setup, full-refresh LUT)
+        but not Clear, so waking does not flash the panel. The time until
+        the next frame is on the panel is logged by show().
+        """
+        if not self._asleep:
+            return
+        self._woke_at = time.monotonic()
+        if self.backend == "eink" and self.epd:
+            self.epd.init()
+            logging.info(f"Display woke from deep sleep (init {(time.monotonic() - self._woke_at) * 1000:.0f} ms)")
+        else:
+            logging.info("Display woke from deep sleep")
+        self._asleep = False
 
     def sleep(self):
         """Put e-ink display to sleep mode."""
-        if self.backend == "eink" and self.epd:
-            self.epd.sleep()
-            logging.info("Display sleeping")
+        self.deep_sleep()
 
     def __del__(self):
         """Clean up e-ink driver on shutdown."""
-        if hasattr(self, 'backend') and self.backend == "eink" and self.epd:
+        if hasattr(self, 'backend') and self.backend == "eink" and self.epd and not self._asleep:
             try:
                 self.epd.sleep()
             except Exception:
                 pass
+
+
+def downscale(image, width: int, height: int):
+    """Downscale a rendered canvas to panel resolution as a 1-bit image.
+
+    The filter depends on the supersampling factor of the canvas:
+    - 4x: LANCZOS (highest quality, most CPU)
+    - 2x: 2x2 box filter via Image.reduce (cheap)
+    - 1x: already native, returned as is
+
+    Args:
+        image: 1-bit canvas from rendering.canvas.new_canvas()
+        width: Panel width in pixels
+        height: Panel height in pixels
+
+    Returns:
+        1-bit PIL Image of size (width, height)
+    """
+    factor = image.width // width
+    if factor == 1:
+        return image
+    # 1-bit -> grayscale -> downscale -> 1-bit
+    gray = image.convert('L')
+    if factor == 4:
+        from PIL import Image  # Already loaded by whoever rendered the canvas
+
+        scaled = gray.resize((width, height), Image.LANCZOS)
+    else:
+        scaled = gray.reduce(factor)
+    return scaled.convert('1')
+
+
+def _dirty_bands(old: bytes, new: bytes, linewidth: int, merge_gap: int = 8) -> list:
+    """Find the panel row bands that differ between two packed framebuffers.
+
+    XORs both buffers and collects the rows with any set bit, then merges rows
+    closer than merge_gap into one band to save window setup commands.
+
+    Args:
+        old: Previous packed framebuffer
+        new: New packed framebuffer (same size)
+        linewidth: Bytes per panel row
+        merge_gap: Unchanged rows allowed inside a band
+
+    Returns:
+        List of (first_row, last_row) tuples, inclusive; empty if identical
+    """
+    diff = (int.from_bytes(old, "big") ^ int.from_bytes(new, "big")).to_bytes(len(new), "big")
+    bands = []
+    for row in range(len(new) // linewidth):
+        if not any(diff[row * linewidth:(row + 1) * linewidth]):
+            continue
+        if bands and row - bands[-1][1] <= merge_gap:
+            bands[-1] = (bands[-1][0], row)
+        else:
+            bands.append((row, row))
+    return bands
+
+
+class RenderAhead:
+    """Prepares the next screen's frame while the current one is on the panel.
+
+    A single worker thread renders and packs the upcoming screen during the
+    current screen's refresh (ReadBusy) and dwell time, so a screen switch only
+    costs the SPI transfer and the panel refresh.
+
+    Prepared frames are keyed by screen name and data object: if the data
+    changed in the meantime (a new poll landed), the frame is discarded and
+    the screen is rendered again from the fresh data.
+    """
+
+    def __init__(self, display: Display):
+        """Create the render-ahead stage for a display.
+
+        Args:
+            display: Display whose prepare() produces the frames
+        """
+        self.display = display
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+        self._pending = None  # (name, data, future)
+
+    def schedule(self, name: str, data, render_fn) -> None:
+        """Start preparing a screen in the background.
+
+        Args:
+            name: Screen name
+            data: Data object the screen is rendered from
+            render_fn: Screen render function taking data, returning an image
+        """
+        self.cancel()
+        future = self._pool.submit(lambda: self.display.prepare(render_fn(data)))
+        self._pending = (name, data, future)
+
+    def take(self, name: str, data):
+        """Return the prepared frame for (name, data), or None if not prepared.
+
+        Waits for the worker if it is still busy with that screen.
+        """
+        if self._pending is not None:
+            pending_name, pending_data, future = self._pending
+            if pending_name == name and pending_data is data:
+                self._pending = None
+                return future.result()
+        self.cancel()
+        return None
+
+    def cancel(self) -> None:
+        """Drop the prepared frame, waiting for a job still in progress.
+
+        Call before rendering outside the rotation (e.g. the error screen):
+        fonts are not safe to use from two threads at once.
+        """
+        if self._pending is not None:
+            _, _, future = self._pending
+            self._pending = None
+            try:
+                future.result()
+            except Exception as e:
+                logging.warning(f"Discarded render-ahead job failed: {e}")
+
+    def close(self) -> None:
+        """Stop the worker thread."""
+        self._pending = None
+        self._pool.shutdown(wait=False)
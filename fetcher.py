@@ -0,0 +1,344 @@
+"""Background data fetcher decoupled from the screen rotation.
+
+Polls the SolarEdge and Forecast.Solar APIs on its own schedule in a daemon
+thread and publishes every result as an immutable DataSnapshot. The display
+loop reads the latest snapshot each time it renders a screen, so a slow poll
+never stalls the rotation and a long rotation never delays a poll.
+
+Site data only changes when the inverter uploads (about every 15 minutes).
+Each poll first asks the site overview for lastUpdateTime and skips the
+data requests when nothing was uploaded since the last full poll.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Callable, Optional
+
+from deadline import Deadline
+from forecast_api import ForecastSolarAPI
+from models import BatteryData, DataSnapshot, ForecastData
+from quota import QuotaManager
+from scheduling import AdaptiveInterval, UploadPhaseTracker
+from solaredge_api import SolarEdgeAPI
+
+# Worker threads for concurrent fetching (one per independent endpoint)
+FETCH_WORKERS = 3
+
+# Time budget for a whole poll: requests shorten their timeouts and retries to fit
+POLL_DEADLINE_SECONDS = 45
+
+# Share of the poll budget the freshness check may use (one attempt, or a
+# quick retry after a fast failure), so a slow API leaves time for the data
+FRESHNESS_CHECK_SECONDS = 8
+
+# A full poll is made at least this often even without a new upload, in case
+# lastUpdateTime lags behind data the API already serves
+FULL_POLL_MAX_AGE_SECONDS = 3600
+
+
+def fetch_data(api: SolarEdgeAPI, has_battery: bool = False, forecast_api: ForecastSolarAPI = None,
+               deadline: Optional[Deadline] = None):
+    """
+    Fetch data from SolarEdge and Forecast.Solar APIs concurrently.
+
+    Independent requests run in parallel on a small thread pool, so a poll
+    takes about as long as the slowest endpoint instead of the sum of all
+    of them. Storage data is only requested once the power flow result is
+    in, since the battery screen needs both. Today's totals and the daily
+    history come from a single /energyDetails request.
+
+    All requests share the deadline, which bounds the poll's total latency.
+
+    Returns:
+        tuple: (energy_details, battery_data, history_data, forecast_data, power_flow) - any may be None on failure
+    """
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch") as pool:
+        summary_future = pool.submit(api.get_energy_summary, deadline=deadline)
+        power_flow_future = pool.submit(api.get_current_power_flow, deadline=deadline)
+        forecast_future = pool.submit(forecast_api.get_forecast, deadline=deadline) if forecast_api else None
+
+        # Storage depends on the power flow result, so it waits for that call only
+        power_flow = power_flow_future.result()
+        storage_future = None
+        if has_battery and power_flow:
+            storage_future = pool.submit(api.get_storage_data, deadline=deadline)
+
+        summary = summary_future.result()
+        storage = storage_future.result() if storage_future else None
+        raw_forecast = forecast_future.result() if forecast_future else None
+
+    energy_details, history_data = summary if summary else (None, None)
+    if energy_details:
+        logging.debug(f"Fetched energy details: {energy_details}")
+    if power_flow:
+        logging.debug(f"Fetched power flow: {power_flow}")
+
+    battery_data = None
+    if has_battery and power_flow:
+        battery_data = BatteryData(
+            state_of_charge=power_flow.state_of_charge,
+            status=power_flow.storage_status,
+            internal_temp=storage["internal_temp"] if storage else 0.0,
+            available_energy=storage["available_energy"] if storage else 0.0,
+            power=storage["power"] if storage else 0.0,
+        )
+        logging.debug(f"Fetched battery data: {battery_data}")
+
+    if history_data:
+        logging.debug(f"Fetched energy history: {len(history_data.dates)} days")
+
+    forecast_data = None
+    if raw_forecast:
+        actual_prod = energy_details.production if energy_details else 0.0
+        forecast_data = ForecastData(
+            today_kwh=raw_forecast.today_kwh,
+            tomorrow_kwh=raw_forecast.tomorrow_kwh,
+            actual_production=actual_prod,
+            fetched_at=raw_forecast.fetched_at,
+        )
+        logging.debug(f"Fetched forecast: today={forecast_data.today_kwh:.1f} kWh, tomorrow={forecast_data.tomorrow_kwh:.1f} kWh, actual={forecast_data.actual_production:.1f} kWh")
+
+    return energy_details, battery_data, history_data, forecast_data, power_flow
+
+
+class DataFetcher(threading.Thread):
+    """Daemon thread that polls the APIs and publishes DataSnapshots.
+
+    The current snapshot is swapped atomically as a whole (a single attribute
+    assignment), so readers never observe a half-updated set of values and
+    never need to take a lock.
+
+    Attributes:
+        api: SolarEdge API client
+        forecast_api: Forecast.Solar client, or None if forecast is disabled
+        has_battery: Whether battery data should be fetched
+        poll_interval_seconds: Seconds between poll starts (configured)
+        quota: Daily request ledger, or None for a fixed poll interval
+        upload_phase: Upload phase tracker aligning polls to the site's
+            uploads, or None to poll at the plain interval
+        adaptive: Activity-driven interval controller, or None for the
+            configured interval
+    """
+
+    def __init__(
+        self,
+        api: SolarEdgeAPI,
+        poll_interval_seconds: float,
+        has_battery: bool = False,
+        forecast_api: Optional[ForecastSolarAPI] = None,
+        pause_remaining: Optional[Callable[[], float]] = None,
+        quota: Optional[QuotaManager] = None,
+        on_publish: Optional[Callable[[DataSnapshot], None]] = None,
+        initial_snapshot: Optional[DataSnapshot] = None,
+        upload_phase: Optional[UploadPhaseTracker] = None,
+        adaptive: Optional[AdaptiveInterval] = None,
+    ):
+        """Create the fetcher thread (call start() to begin polling).
+
+        Args:
+            api: SolarEdge API client
+            poll_interval_seconds: Seconds between poll starts
+            has_battery: Whether the site has a battery
+            forecast_api: Forecast.Solar client, or None
+            pause_remaining: Optional callable returning the seconds polling
+                should stay paused (e.g. until the night sleep window ends),
+                0 while polling is active
+            quota: Optional request ledger; the poll interval is stretched
+                when the configured one would exceed the daily budget
+            on_publish: Optional callable run with each published snapshot
+                (persists it and wakes the display loop)
+            initial_snapshot: Snapshot restored from a previous run, served
+                until the first poll replaces it
+            upload_phase: Optional tracker; polls are moved to just after the
+                site's expected uploads once their phase is known
+            adaptive: Optional controller replacing poll_interval_seconds
+                with an interval between its bounds, based on how fast PV
+                and load power change
+        """
+        super().__init__(name="fetcher", daemon=True)
+        self.api = api
+        self.forecast_api = forecast_api
+        self.has_battery = has_battery
+        self.poll_interval_seconds = poll_interval_seconds
+        self.quota = quota
+        self.upload_phase = upload_phase
+        self.adaptive = adaptive
+        self._pause_remaining = pause_remaining or (lambda: 0.0)
+        self._on_publish = on_publish or (lambda snapshot: None)
+        self._snapshot: Optional[DataSnapshot] = initial_snapshot
+        self._full_poll_at = 0.0  # monotonic time of the last successful full poll
+        self._full_poll_day: Optional[date] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def snapshot(self) -> Optional[DataSnapshot]:
+        """Latest published snapshot, or None before the first poll finished."""
+        return self._snapshot
+
+    def stop(self) -> None:
+        """Ask the thread to exit: cancels the running poll's retries and waits."""
+        self._stop_event.set()
+
+    def poll(self) -> DataSnapshot:
+        """Run one poll and build the next snapshot from it.
+
+        The site overview is checked first (bypassing the response cache,
+        within FRESHNESS_CHECK_SECONDS of the poll budget): if its
+        lastUpdateTime matches the previous snapshot's, the data requests are
+        skipped and only the forecast is refreshed. If the check fails, a
+        full poll is made with the time left.
+
+        Values that failed to fetch are carried over from the previous
+        snapshot. A poll counts as failed when today's energy details are
+        missing, matching what the energy screens need.
+        """
+        previous = self._snapshot or DataSnapshot()
+        # Shared time budget; stop() cancels it, aborting retries and backoff waits
+        deadline = Deadline(POLL_DEADLINE_SECONDS, cancel=self._stop_event)
+
+        check_deadline = Deadline(min(FRESHNESS_CHECK_SECONDS, deadline.remaining()), cancel=self._stop_event)
+        overview = self.api.get_site_overview(deadline=check_deadline, use_cache=False)
+        last_update_time = overview.last_update_time if overview else ""
+        if self.upload_phase is not None:
+            self.upload_phase.observe(last_update_time)
+        if self._upload_unchanged(previous, last_update_time):
+            logging.info(f"No new upload since {last_update_time}, skipping data requests")
+            return self._refresh_forecast(previous, deadline)
+
+        energy_details, battery_data, history_data, forecast_data, power_flow = fetch_data(
+            self.api, has_battery=self.has_battery, forecast_api=self.forecast_api, deadline=deadline
+        )
+        if self.adaptive is not None and power_flow:
+            self.adaptive.update(power_flow)
+
+        if energy_details is None:
+            return replace(
+                previous,
+                consecutive_failures=previous.consecutive_failures + 1,
+                api_state=self.api.breaker.state,
+            )
+
+        self._full_poll_at = time.monotonic()
+        self._full_poll_day = date.today()
+        logging.info(
+            f"Poll successful - Production: {energy_details.production:.2f} kWh, "
+            f"Consumption: {energy_details.consumption:.2f} kWh, "
+            f"Feed-in: {energy_details.feed_in:.2f} kWh, "
+            f"Purchased: {energy_details.purchased:.2f} kWh"
+        )
+        return DataSnapshot(
+            energy=energy_details,
+            battery=battery_data or previous.battery,
+            history=history_data or previous.history,
+            forecast=forecast_data or previous.forecast,
+            consecutive_failures=0,
+            api_state=self.api.breaker.state,
+            last_update_time=last_update_time,
+        )
+
+    def _upload_unchanged(self, previous: DataSnapshot, last_update_time: str) -> bool:
+        """True if the previous snapshot is still current and the data requests can be skipped.
+
+        Requires a successful previous poll with a known lastUpdateTime equal
+        to the current one, made today (today's totals reset at midnight) and
+        less than FULL_POLL_MAX_AGE_SECONDS ago.
+        """
+        if not last_update_time or previous.energy is None or previous.consecutive_failures:
+            return False
+        if last_update_time != previous.last_update_time or self._full_poll_day != date.today():
+            return False
+        return time.monotonic() - self._full_poll_at < FULL_POLL_MAX_AGE_SECONDS
+
+    def _refresh_forecast(self, previous: DataSnapshot, deadline: Deadline) -> DataSnapshot:
+        """Snapshot for a skipped poll: previous data, confirmed current, with a fresh forecast."""
+        forecast_data = previous.forecast
+        raw_forecast = self.forecast_api.get_forecast(deadline=deadline) if self.forecast_api else None
+        if raw_forecast:
+            forecast_data = ForecastData(
+                today_kwh=raw_forecast.today_kwh,
+                tomorrow_kwh=raw_forecast.tomorrow_kwh,
+                actual_production=previous.energy.production,
+                fetched_at=raw_forecast.fetched_at,
+            )
+        return replace(
+            previous,
+            forecast=forecast_data,
+            api_state=self.api.breaker.state,
+            fetched_at=datetime.now(),
+        )
+
+    def _publish(self, snapshot: DataSnapshot) -> None:
+        # Single reference assignment: readers see either the old or the new snapshot
+        self._snapshot = snapshot
+        self._on_publish(snapshot)
+
+    def run(self) -> None:
+        """Poll loop: poll, publish, wait for the next slot."""
+        next_poll = time.monotonic()  # Poll immediately on startup
+        paused = False
+
+        while not self._stop_event.is_set():
+            pause = self._pause_remaining()
+            if pause > 0:
+                paused = True
+                self._stop_event.wait(pause)
+                continue
+            if paused:
+                paused = False
+                next_poll = time.monotonic()  # Force immediate poll after wake
+
+            delay = next_poll - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+                continue
+
+            logging.info("Starting poll cycle")
+            used_before = self.quota.used_today() if self.quota else 0
+            try:
+                snapshot = self.poll()
+            except Exception as e:
+                logging.error(f"Poll raised unexpectedly: {type(e).__name__}: {e}")
+                previous = self._snapshot or DataSnapshot()
+                snapshot = replace(
+                    previous,
+                    consecutive_failures=previous.consecutive_failures + 1,
+                    api_state=self.api.breaker.state,
+                )
+            if snapshot.consecutive_failures:
+                logging.warning(f"Poll failed (consecutive failures: {snapshot.consecutive_failures})")
+            self._publish(snapshot)
+
+            # Schedule next poll
+            interval = self._next_interval(used_before)
+            aligned = self.upload_phase.delay_until_poll(interval) if self.upload_phase else None
+            if aligned is not None:
+                next_poll = time.monotonic() + aligned
+                continue
+            next_poll += interval
+
+            # If we fell behind (slow poll), reset to now + interval
+            if next_poll < time.monotonic():
+                logging.warning("Poll took longer than interval, resetting schedule")
+                next_poll = time.monotonic() + interval
+
+    def _next_interval(self, used_before: int) -> float:
+        """Interval until the next poll: configured or adaptive, stretched to fit the daily budget."""
+        base = self.adaptive.interval() if self.adaptive is not None else self.poll_interval_seconds
+        if self.quota is None:
+            return base
+
+        used = self.quota.used_today()
+        # A day rollover during the poll makes the difference negative; skip that sample
+        if used >= used_before:
+            self.quota.record_poll(used - used_before)
+        interval = self.quota.plan_interval(base)
+        if interval > base:
+            logging.info(
+                f"API quota: {used}/{self.quota.daily_budget} used today, "
+                f"stretching poll interval to {interval / 60:.1f} min"
+            )
+        return interval
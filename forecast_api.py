@@ -14,23 +14,41 @@ import time
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Optional, Callable, Any
-import requests
 
+from deadline import Deadline
 from models import ForecastData
 
 
 # Module-level cache for TTL decorator
 _cache = {}
 
+# Per-request timeout cap in seconds
+REQUEST_TIMEOUT = 10
 
-def ttl_cache(ttl_seconds: int = 3600) -> Callable:
+
+class Uncached(Exception):
+    """Raised inside a ttl_cache function to return result without caching it.
+
+    Used for failures caused only by the caller's time budget (not the
+    upstream API), so the next call tries again instead of keeping the
+    failure for the whole TTL.
+    """
+
+    def __init__(self, result=None):
+        super().__init__()
+        self.result = result
+
+
+def ttl_cache(ttl_seconds: int = 3600, ignore: tuple = ()) -> Callable:
     """Cache decorator with time-to-live (TTL).
 
     Caches function results (including None) for ttl_seconds. This prevents
-    hammering the API when it's rate-limited or failing.
+    hammering the API when it's rate-limited or failing. A function can raise
+    Uncached(result) to return result without storing it.
 
     Args:
         ttl_seconds: Cache lifetime in seconds (default: 3600 = 1 hour)
+        ignore: Keyword arguments left out of the cache key (e.g. "deadline")
 
     Returns:
         Decorated function that caches results
@@ -39,7 +57,8 @@ def ttl_cache(ttl_seconds: int = 3600) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             # Build cache key from function name + args + kwargs
-            cache_key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            key_kwargs = tuple(sorted((k, v) for k, v in kwargs.items() if k not in ignore))
+            cache_key = (func.__name__, args, key_kwargs)
 
             # Check cache
             if cache_key in _cache:
@@ -51,7 +70,10 @@ def ttl_cache(ttl_seconds: int = 3600) -> Callable:
 
             # Cache miss - call function
             logging.debug(f"Cache MISS for {func.__name__}")
-            result = func(*args, **kwargs)
+            try:
+                result = func(*args, **kwargs)
+            except Uncached as e:
+                return e.result
 
             # Store result with timestamp (even if None)
             _cache[cache_key] = (result, time.time())
@@ -94,17 +116,21 @@ class ForecastSolarAPI:
         self.kwp = kwp
         self.base_url = "https://api.forecast.solar"
 
-    @ttl_cache(ttl_seconds=3600)
-    def get_forecast(self) -> Optional[ForecastData]:
+    @ttl_cache(ttl_seconds=3600, ignore=("deadline",))
+    def get_forecast(self, deadline: Optional[Deadline] = None) -> Optional[ForecastData]:
         """Fetch solar production forecast for today and tomorrow.
 
         Makes HTTP request to Forecast.Solar API and returns forecasted kWh
         values. Results are cached for 1 hour - subsequent calls within the
         TTL period return cached data without hitting the API.
 
+        Args:
+            deadline: Poll time budget; caps the request timeout (optional)
+
         Returns:
             ForecastData with today_kwh and tomorrow_kwh on success
-            None on any failure (network error, rate limit, parse error)
+            None on any failure (network error, rate limit, parse error);
+            failures caused only by the poll deadline are not cached
         """
         # Build API URL
         url = (
@@ -112,9 +138,17 @@ class ForecastSolarAPI:
             f"{self.lat}/{self.lon}/{self.tilt}/{self.azimuth}/{self.kwp}"
         )
 
+        # 10s timeout, shortened to what is left of the poll's deadline
+        if deadline is not None and deadline.expired:
+            logging.warning("Forecast API skipped, poll deadline reached")
+            raise Uncached()
+        timeout = deadline.timeout(REQUEST_TIMEOUT) if deadline else REQUEST_TIMEOUT
+
+        # Imported on first use, not at startup (requests dominates import time)
+        import requests
+
         try:
-            # GET request with 10s timeout
-            response = requests.get(url, timeout=10)
+            response = requests.get(url, timeout=timeout)
 
             # Check for rate limiting specifically
             if response.status_code == 429:
@@ -146,7 +180,9 @@ class ForecastSolarAPI:
             )
 
         except requests.exceptions.Timeout:
-            logging.error("Forecast API timeout after 10s")
+            logging.error(f"Forecast API timeout after {timeout:.0f}s")
+            if timeout < REQUEST_TIMEOUT:
+                raise Uncached()  # Timed out on a shortened timeout: retry next poll
             return None
         except requests.exceptions.HTTPError as e:
             logging.error(f"Forecast API HTTP error {e.response.status_code}")
@@ -0,0 +1,106 @@
+"""
+Persistent cache of finished days for the history screens.
+
+Only today's value changes during the day, so days that are over are kept
+in a JSON file in the state directory and survive restarts. A poll then
+only has to fetch today plus any days the cache is missing, and the full
+EnergyHistory for any window (14, 30, 90, 365 days) is rebuilt from the
+cache without another network call.
+
+A day counts as finished once it was fetched at least SETTLE_HOURS after
+it ended, so data the inverter uploads late (after midnight) is not lost.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+
+from models import EnergyHistory
+from persistence import load_json, save_json
+
+# Hours after midnight before the previous day's totals are treated as final
+SETTLE_HOURS = 2
+
+# Finished days older than this are dropped from the cache
+MAX_DAYS = 366
+
+
+class HistoryCache:
+    """Daily production/consumption values keyed by date.
+
+    Attributes:
+        path: JSON file holding the finished days
+    """
+
+    def __init__(self, path):
+        """Load finished days from path (missing or corrupt file = empty cache).
+
+        Args:
+            path: JSON file in the state directory
+        """
+        self.path = path
+        stored = load_json(path, default={})
+        self._days = stored.get("days", {}) if isinstance(stored, dict) else {}
+        self._today = {}  # date -> (production, consumption), not yet final
+        if self._days:
+            logging.info(f"History cache: loaded {len(self._days)} finished days from {path}")
+
+    def fetch_start(self, today: date, days: int) -> date:
+        """First date that has to be fetched to fill a window ending today.
+
+        Args:
+            today: Last day of the window
+            days: Window length in days, including today
+
+        Returns:
+            Earliest date in the window that is not a finished cached day
+            (today if all earlier days are cached)
+        """
+        start = today - timedelta(days=days - 1)
+        day = start
+        while day < today and day.isoformat() in self._days:
+            day += timedelta(days=1)
+        return day
+
+    def update(self, production: dict, consumption: dict, fetched_at: datetime) -> None:
+        """Store fetched daily values, persisting the days that are over.
+
+        Args:
+            production: {"YYYY-MM-DD": kWh} for the fetched range
+            consumption: {"YYYY-MM-DD": kWh} for the fetched range
+            fetched_at: Time the values were fetched
+        """
+        settled_before = (fetched_at - timedelta(hours=SETTLE_HOURS)).date()
+        changed = False
+        self._today = {}
+
+        for day in sorted(set(production) | set(consumption)):
+            values = [production.get(day, 0.0), consumption.get(day, 0.0)]
+            if date.fromisoformat(day) < settled_before:
+                if self._days.get(day) != values:
+                    self._days[day] = values
+                    changed = True
+            else:
+                self._today[day] = values
+
+        if changed:
+            cutoff = (fetched_at.date() - timedelta(days=MAX_DAYS)).isoformat()
+            self._days = {d: v for d, v in self._days.items() if d >= cutoff}
+            save_json(self.path, {"days": self._days})
+
+    def build(self, today: date, days: int) -> EnergyHistory:
+        """Rebuild the history window from cached and latest fetched values.
+
+        Args:
+            today: Last day of the window
+            days: Window length in days, including today
+
+        Returns:
+            EnergyHistory for the window (missing days as 0.0)
+        """
+        dates = [(today - timedelta(days=days - 1 - i)).isoformat() for i in range(days)]
+        values = [self._today.get(d) or self._days.get(d) or [0.0, 0.0] for d in dates]
+        return EnergyHistory(
+            dates=dates,
+            production=[v[0] for v in values],
+            consumption=[v[1] for v in values],
+        )
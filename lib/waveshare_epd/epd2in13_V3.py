@@ -29,12 +29,16 @@
 
 
 import logging
+import time
 from . import epdconfig
 
 # Display resolution
 EPD_WIDTH       = 122
 EPD_HEIGHT      = 250
 
+# Upper bound for a single busy wait in seconds (a full refresh takes ~2 s)
+BUSY_TIMEOUT    = 10
+
 logger = logging.getLogger(__name__)
 
 class EPD:
@@ -45,6 +49,9 @@ class EPD:
         self.cs_pin = epdconfig.CS_PIN
         self.width = EPD_WIDTH
         self.height = EPD_HEIGHT
+        self.busy_timeout = BUSY_TIMEOUT
+        self.busy_timeouts = 0
+        self.last_busy_ms = 0.0
         
     lut_partial_update= [
         0x0,0x40,0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
@@ -137,9 +144,23 @@ class EPD:
     '''
     def ReadBusy(self):
         logger.debug("e-Paper busy")
+        # Wait for the BUSY falling edge when the platform supports it (no
+        # 10 ms wakeups), otherwise poll; give up after busy_timeout seconds
+        wait_release = getattr(epdconfig, 'wait_busy_release', None)
+        start = time.monotonic()
+        deadline = start + self.busy_timeout
         while(epdconfig.digital_read(self.busy_pin) == 1):      # 0: idle, 1: busy
-            epdconfig.delay_ms(10)  
-        logger.debug("e-Paper busy release")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.busy_timeouts += 1
+                logger.error("e-Paper busy timeout after %.1f s" % self.busy_timeout)
+                break
+            if wait_release is None:
+                epdconfig.delay_ms(10)
+            elif wait_release(remaining) and epdconfig.digital_read(self.busy_pin) == 1:
+                epdconfig.delay_ms(10)  # edge event lagging behind the pin
+        self.last_busy_ms = (time.monotonic() - start) * 1000
+        logger.debug("e-Paper busy release (%.0f ms)" % self.last_busy_ms)
 
     '''
     function : Turn On Display
@@ -168,8 +189,7 @@ class EPD:
     '''    
     def Lut(self, lut):
         self.send_command(0x32)
-        for i in range(0, 153):
-            self.send_data(lut[i])
+        self.send_data2(lut[0:153])
         self.ReadBusy()
     
     '''
@@ -298,9 +318,8 @@ class EPD:
             linewidth = int(self.width/8) + 1
 
         self.send_command(0x24)
-        for j in range(0, self.height):
-            for i in range(0, linewidth):
-                self.send_data(image[i + j * linewidth])   
+        # one DC/CS toggle for the whole frame instead of one per byte
+        self.send_data2(image[0:self.height * linewidth])
         self.TurnOnDisplay()
     
     '''
@@ -344,6 +363,54 @@ class EPD:
         self.send_data2(image)  
         self.TurnOnDisplayPart()
 
+    '''
+    function : Partial refresh that only writes changed row bands to RAM
+    parameter:
+        image : Image data (full framebuffer)
+        bands : list of (y_start, y_end) row ranges, inclusive
+    '''
+    def displayPartialBands(self, image, bands):
+        if self.width%8 == 0:
+            linewidth = int(self.width/8)
+        else:
+            linewidth = int(self.width/8) + 1
+
+        epdconfig.digital_write(self.reset_pin, 0)
+        epdconfig.delay_ms(1)
+        epdconfig.digital_write(self.reset_pin, 1)
+
+        self.SetLut(self.lut_partial_update)
+        self.send_command(0x37)
+        self.send_data(0x00)
+        self.send_data(0x00)
+        self.send_data(0x00)
+        self.send_data(0x00)
+        self.send_data(0x00)
+        self.send_data(0x40)
+        self.send_data(0x00)
+        self.send_data(0x00)
+        self.send_data(0x00)
+        self.send_data(0x00)
+
+        self.send_command(0x3C) #BorderWavefrom
+        self.send_data(0x80)
+
+        self.send_command(0x22)
+        self.send_data(0xC0)
+        self.send_command(0x20)
+        self.ReadBusy()
+
+        for y_start, y_end in bands:
+            self.SetWindow(0, y_start, self.width - 1, y_end)
+            self.SetCursor(0, y_start)
+            self.send_command(0x24) # WRITE_RAM
+            self.send_data2(image[y_start * linewidth:(y_end + 1) * linewidth])
+
+        # Restore the full window for the next full-frame write
+        self.SetWindow(0, 0, self.width - 1, self.height - 1)
+        self.SetCursor(0, 0)
+        self.TurnOnDisplayPart()
+
     '''
     function : Refresh a base image
     parameter:
@@ -53,6 +53,7 @@ class RaspberryPi:
         import gpiozero
         
         self.SPI = spidev.SpiDev()
+        self.SPI_BUFSIZ = self._spi_bufsiz()
         self.GPIO_RST_PIN    = gpiozero.LED(self.RST_PIN)
         self.GPIO_DC_PIN     = gpiozero.LED(self.DC_PIN)
         # self.GPIO_CS_PIN     = gpiozero.LED(self.CS_PIN)
@@ -98,11 +99,27 @@ class RaspberryPi:
     def delay_ms(self, delaytime):
         time.sleep(delaytime / 1000.0)
 
+    def wait_busy_release(self, timeout):
+        # gpiozero tracks pin edges through its pin factory (lgpio alerts), so
+        # this sleeps until BUSY goes low instead of polling; False on timeout
+        return self.GPIO_BUSY_PIN.wait_for_inactive(timeout)
+
     def spi_writebyte(self, data):
         self.SPI.writebytes(data)
 
     def spi_writebyte2(self, data):
-        self.SPI.writebytes2(data)
+        # one writebytes2 call per spidev buffer instead of one per byte
+        for i in range(0, len(data), self.SPI_BUFSIZ):
+            self.SPI.writebytes2(data[i:i + self.SPI_BUFSIZ])
+
+    @staticmethod
+    def _spi_bufsiz():
+        # spidev kernel transfer limit (default 4096 bytes)
+        try:
+            with open('/sys/module/spidev/parameters/bufsiz') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return 4096
 
     def DEV_SPI_write(self, data):
         self.DEV_SPI.DEV_SPI_SendData(data)
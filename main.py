@@ -3,10 +3,12 @@
 SolarEdge Off-Grid Monitor - Main Entry Point
 
 Production polling loop that:
-- Fetches SolarEdge data every 5 minutes (configurable)
-- Cycles through 4 display screens at 60 seconds each
-- Sleeps between midnight and 6 AM (configurable)
-- Shows error screen after 3 consecutive API failures
+- Fetches SolarEdge data every 5 minutes (configurable) in a background thread
+- Cycles through the display screens at 60 seconds each, always showing the
+  freshest data
+- Sleeps between midnight and 6 AM (configurable, or sunset to sunrise)
+- Shows error screen while the API is down (circuit breaker open) or after
+  3 consecutive failed polls
 - Clears display on graceful shutdown (SIGTERM/SIGINT)
 
 Run with: python3 main.py
@@ -19,8 +21,10 @@ Requires .env file with:
 import logging
 import signal
 import sys
+import threading
 import time
 from datetime import datetime
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 from pathlib import Path
@@ -33,137 +37,173 @@ from dotenv import load_dotenv
 # Load .env before importing Config (Config reads from environment)
 load_dotenv()
 
-from config import Config
+from config import Config, TIMEZONE
 from logging_setup import setup_logging
 from solaredge_api import SolarEdgeAPI
 from forecast_api import ForecastSolarAPI
-from display import Display
-from models import BatteryData, ForecastData
+from display import Display, RenderAhead
+from fetcher import DataFetcher
+from history_cache import HistoryCache
+from quota import QuotaManager
+from response_cache import ResponseCache
+from scheduling import AdaptiveInterval, UploadPhaseTracker
+from snapshot_store import SnapshotStore
 from screens import get_screens
-from screens.error import render_error_screen
 
 
 # Module-level state
 shutdown_flag = False
 
+# Set on shutdown and whenever the fetcher publishes a snapshot: every wait in
+# the main loop blocks on this one event, so an idle monitor does not wake up
+# until something is due
+wakeup = threading.Event()
 
-def signal_handler(signum, frame):
-    """Signal handler for graceful shutdown."""
+# Consecutive failed polls before the error screen replaces stale data
+MAX_FAILURES = 3
+
+# Longest wait after the sleep window for the first poll of the day (the
+# fetcher polls at once; a poll takes at most POLL_DEADLINE_SECONDS)
+WAKE_SNAPSHOT_TIMEOUT = 60
+
+# Longest single wait during the sleep window (re-checks the clock after
+# NTP corrections and DST changes)
+SLEEP_RECHECK_SECONDS = 3600
+
+
+def request_shutdown() -> None:
+    """Ask the main loop to exit; wakes any wait in progress."""
     global shutdown_flag
     shutdown_flag = True
+    wakeup.set()
+
+
+def signal_handler(signum, frame):
+    """Signal handler for graceful shutdown."""
     signal_name = signal.Signals(signum).name
     logging.info(f"Received signal {signal_name}, initiating graceful shutdown")
+    # Event.set() takes a lock the interrupted main thread may be holding
+    # inside Event.wait(); setting it from a helper thread cannot deadlock
+    threading.Thread(target=request_shutdown, name="shutdown", daemon=True).start()
 
 
 def is_sleep_time(config: Config) -> bool:
     """
     Check if current time is within configured sleep window.
 
-    Handles midnight-crossing sleep windows (e.g., 23:00 to 06:00).
-    Returns False if sleep_start == sleep_end (no sleep window).
+    Fixed mode handles midnight-crossing sleep windows (e.g., 23:00 to 06:00)
+    and returns False if sleep_start == sleep_end (no sleep window). Sun mode
+    sleeps from sunset to sunrise (plus offsets) at the forecast location.
 
     Timezone: Europe/Berlin (hardcoded per research recommendation)
     """
-    tz = ZoneInfo("Europe/Berlin")
-    now = datetime.now(tz)
-    hour = now.hour
+    now = datetime.now(ZoneInfo(TIMEZONE))
+    return config.is_sleeping(now)
 
-    start = config.sleep_start_hour
-    end = config.sleep_end_hour
 
-    # No sleep window if start == end
-    if start == end:
-        return False
+def sleep_remaining(config: Config) -> float:
+    """
+    Seconds until the sleep window ends (0 if not sleeping).
 
-    # Handle midnight-crossing
-    if start <= end:
-        # Normal window: e.g., 0 to 6
-        return start <= hour < end
-    else:
-        # Crosses midnight: e.g., 23 to 6 means (hour >= 23) or (hour < 6)
-        return hour >= start or hour < end
+    Capped at SLEEP_RECHECK_SECONDS, so a long night is a handful of
+    wake-ups instead of one per minute.
+    """
+    now = datetime.now(ZoneInfo(TIMEZONE))
+    if not config.is_sleeping(now):
+        return 0.0
+    wake = config.sleep_ends_at(now)
+    if wake is None:
+        return SLEEP_RECHECK_SECONDS
+    return min(max((wake - now).total_seconds(), 1.0), SLEEP_RECHECK_SECONDS)
 
 
 def interruptible_sleep(seconds: float) -> bool:
     """
-    Sleep for specified seconds, checking shutdown_flag every second.
+    Sleep for specified seconds, returning early only on shutdown.
+
+    Blocks on the wakeup event; wake-ups for published snapshots just
+    resume the wait for the remaining time.
 
     Returns:
         True if sleep completed normally
         False if interrupted by shutdown
     """
-    end_time = time.time() + seconds
-    while time.time() < end_time:
-        if shutdown_flag:
-            return False
-        time.sleep(min(1.0, end_time - time.time()))
-    return True
-
-
-def fetch_data(api: SolarEdgeAPI, has_battery: bool = False, forecast_api: ForecastSolarAPI = None):
-    """
-    Fetch data from SolarEdge API.
-
-    Returns:
-        tuple: (energy_details, battery_data, history_data, forecast_data) - any may be None on failure
-    """
-    energy_details = api.get_energy_details()
-    power_flow = api.get_current_power_flow()
-
-    if energy_details:
-        logging.debug(f"Fetched energy details: {energy_details}")
-    if power_flow:
-        logging.debug(f"Fetched power flow: {power_flow}")
-
-    battery_data = None
-    if has_battery and power_flow:
-        storage = api.get_storage_data()
-        battery_data = BatteryData(
-            state_of_charge=power_flow.state_of_charge,
-            status=power_flow.storage_status,
-            internal_temp=storage["internal_temp"] if storage else 0.0,
-            available_energy=storage["available_energy"] if storage else 0.0,
-            power=storage["power"] if storage else 0.0,
-        )
-        logging.debug(f"Fetched battery data: {battery_data}")
-
-    history_data = api.get_energy_history()
-    if history_data:
-        logging.debug(f"Fetched energy history: {len(history_data.dates)} days")
-
-    forecast_data = None
-    if forecast_api:
-        raw_forecast = forecast_api.get_forecast()
-        if raw_forecast:
-            actual_prod = energy_details.production if energy_details else 0.0
-            forecast_data = ForecastData(
-                today_kwh=raw_forecast.today_kwh,
-                tomorrow_kwh=raw_forecast.tomorrow_kwh,
-                actual_production=actual_prod,
-                fetched_at=raw_forecast.fetched_at,
-            )
-            logging.debug(f"Fetched forecast: today={forecast_data.today_kwh:.1f} kWh, tomorrow={forecast_data.tomorrow_kwh:.1f} kWh, actual={forecast_data.actual_production:.1f} kWh")
-
-    return energy_details, battery_data, history_data, forecast_data
-
-
-def run_screen_cycle(display: Display, cycle: list) -> None:
+    end_time = time.monotonic() + seconds
+    while not shutdown_flag:
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            return True
+        wakeup.wait(remaining)
+        wakeup.clear()
+    return False
+
+
+def wait_for_new_snapshot(fetcher: DataFetcher, stale, seconds: float) -> None:
+    """Block until the fetcher publishes a snapshot other than stale, shutdown is requested or seconds pass."""
+    end_time = time.monotonic() + seconds
+    while not shutdown_flag and fetcher.snapshot is stale:
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            logging.warning(f"No new snapshot {seconds:.0f} s after waking, showing the last one")
+            return
+        wakeup.wait(remaining)
+        wakeup.clear()
+
+
+def wait_for_wakeup(seconds: float) -> None:
+    """Block until a snapshot is published, shutdown is requested or seconds pass."""
+    if not shutdown_flag:  # The flag is set before the event, so no shutdown is missed
+        wakeup.wait(seconds)
+    wakeup.clear()
+
+
+def run_screen_cycle(display: Display, screens: list, fetcher: DataFetcher, render_ahead: RenderAhead,
+                     store: Optional[SnapshotStore] = None) -> None:
     """
     Cycle through screens, displaying each for 60 seconds.
 
-    Args:
-        cycle: list of (render_fn, data, name) tuples to display
+    Each screen is rendered from the fetcher's freshest snapshot at the moment
+    it comes up, so a poll finishing mid-rotation shows up on the next screen.
+    While a screen refreshes and dwells, the next one (wrapping around to the
+    first) is prepared in the background by render_ahead.
 
-    Breaks immediately if shutdown signal received during any sleep.
+    Args:
+        screens: list of (render_fn, data_key, name) tuples from get_screens()
+        fetcher: Background fetcher publishing DataSnapshots
+        render_ahead: Render-ahead stage preparing the upcoming frame
+        store: Optional store persisting the first screen's frame for the
+            next startup
+
+    Breaks immediately if shutdown signal received during any sleep, or if
+    the API has become unreachable (the main loop shows the error screen).
     """
-    for screen_fn, data, name in cycle:
+    for index, (screen_fn, data_key, name) in enumerate(screens):
         if shutdown_flag:
             break
 
-        # Render screen
-        image = screen_fn(data)
-        display.render(image, name)
+        snapshot = fetcher.snapshot
+        if snapshot.api_unavailable(MAX_FAILURES):
+            break
+
+        data = snapshot.data_for(data_key)
+        if data is None:
+            continue
+
+        # Use the frame prepared during the previous dwell, if still current
+        frame = render_ahead.take(name, data)
+        if frame is None:
+            frame = display.prepare(screen_fn(data))
+
+        # Prepare the next screen while this one refreshes and dwells
+        next_fn, next_key, next_name = screens[(index + 1) % len(screens)]
+        next_data = snapshot.data_for(next_key)
+        if next_data is not None:
+            render_ahead.schedule(next_name, next_data, next_fn)
+
+        display.show(frame, name)
         logging.info(f"Displaying screen: {name}")
+        if store is not None and index == 0 and display.backend == "eink":
+            store.save_frame(name, frame)
 
         # Wait 60 seconds (interruptible)
         if not interruptible_sleep(60):
@@ -173,6 +213,8 @@ def run_screen_cycle(display: Display, cycle: list) -> None:
 
 def main():
     """Main polling loop."""
+    started = time.monotonic()
+
     # Register signal handlers
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
@@ -195,10 +237,53 @@ def main():
     config.log_startup()
 
     # Create API client and display
-    api = SolarEdgeAPI(config.api_key, config.site_id)
-    display = Display(debug_mode=config.debug)
+    state_dir = Path(config.state_dir)
+    store = SnapshotStore(state_dir)
+    today = datetime.now(ZoneInfo(TIMEZONE)).date()
+    restored_frame = None if is_sleep_time(config) else store.load_frame(today)
+    restored_snapshot = store.load_snapshot(today)
+    history_cache = HistoryCache(state_dir / "history.json")
+    quota = QuotaManager(
+        state_dir / "quota.json",
+        daily_budget=config.daily_budget,
+        sleeping=config.is_sleep_hour,
+        tz=TIMEZONE,
+    )
+    api = SolarEdgeAPI(
+        config.api_key,
+        config.site_id,
+        history_cache=history_cache,
+        quota=quota,
+        cache=ResponseCache(state_dir / "responses.json"),
+    )
+    display = Display(
+        debug_mode=config.debug,
+        refresh_mode=config.refresh_mode,
+        full_refresh_every=config.full_refresh_every,
+        busy_timeout=config.busy_timeout,
+        clear_on_init=restored_frame is None,
+    )
+    render_ahead = RenderAhead(display)
     logging.info(f"Display initialized (backend: {display.backend})")
 
+    # Show the last frame of the previous run at once (no Clear flash, no
+    # waiting for the battery check and the first poll)
+    if restored_frame is not None:
+        name, frame = restored_frame
+        if display.restore(frame, name):
+            logging.info(f"Restored last frame '{name}' {time.monotonic() - started:.1f} s after start")
+        else:
+            display.clear()
+
+    # Render screens at the configured supersampling factor (imports PIL and
+    # the rendering package, deferred until the restored frame is shown)
+    from rendering.canvas import set_render_scale
+
+    set_render_scale(config.render_scale)
+
+    if restored_snapshot is not None:
+        logging.info(f"Restored data snapshot from {restored_snapshot.fetched_at:%H:%M:%S}, refreshing in background")
+
     # Detect battery at startup
     battery_detected = api.has_battery()
     logging.info(f"Battery detected: {battery_detected}")
@@ -223,16 +308,31 @@ def main():
     screen_names = [name for _, _, name in screens]
     logging.info(f"Screen rotation: {', '.join(screen_names)}")
 
-    # Initialize polling state
-    consecutive_failures = 0
-    MAX_FAILURES = 3
-    last_successful_energy = None
-    last_successful_battery = None
-    last_successful_history = None
-    last_successful_forecast = None
-    poll_interval_seconds = config.poll_interval * 60
+    def on_publish(snapshot):
+        # Runs in the fetcher thread after every poll
+        store.save_snapshot(snapshot)
+        wakeup.set()
+
+    # Start background polling (runs independently of the screen rotation)
+    adaptive = None
+    if config.poll_min < config.poll_max:
+        adaptive = AdaptiveInterval(config.poll_min * 60, config.poll_max * 60, config.poll_interval * 60)
+    fetcher = DataFetcher(
+        api,
+        poll_interval_seconds=config.poll_interval * 60,
+        has_battery=battery_detected,
+        forecast_api=forecast_api,
+        pause_remaining=lambda: sleep_remaining(config),
+        on_publish=on_publish,
+        initial_snapshot=restored_snapshot,
+        quota=quota,
+        upload_phase=UploadPhaseTracker(state_dir / "upload_phase.json"),
+        adaptive=adaptive,
+    )
+    fetcher.start()
+
     in_sleep = False
-    next_poll = time.monotonic()  # Poll immediately on startup
+    slept_snapshot = None
 
     try:
         while not shutdown_flag:
@@ -241,100 +341,55 @@ def main():
                 if not in_sleep:
                     logging.info("Entering sleep mode (display off until wake time)")
                     display.clear()
+                    display.deep_sleep()
                     in_sleep = True
-                # Sleep for 60 seconds then check again
-                interruptible_sleep(60)
+                    slept_snapshot = fetcher.snapshot
+                # Sleep until the window ends (or the next re-check)
+                interruptible_sleep(sleep_remaining(config))
                 continue
             else:
                 if in_sleep:
                     logging.info("Waking from sleep mode")
+                    display.wake()
                     in_sleep = False
-                    next_poll = time.monotonic()  # Force immediate poll after wake
-
-            # Check if it's time to poll
-            now = time.monotonic()
-            if now < next_poll:
-                interruptible_sleep(1)
+                    # Don't show yesterday's totals: wait for the first poll after waking
+                    wait_for_new_snapshot(fetcher, slept_snapshot, WAKE_SNAPSHOT_TIMEOUT)
+                    continue
+
+            wakeup.clear()
+            snapshot = fetcher.snapshot
+            if snapshot is None or (snapshot.energy is None and not snapshot.api_unavailable(MAX_FAILURES)):
+                # Nothing to show yet: wait for the next published snapshot
+                wait_for_wakeup(60)
                 continue
 
-            # Fetch data
-            logging.info("Starting poll cycle")
-            energy_details, battery_data, history_data, forecast_data = fetch_data(api, has_battery=battery_detected, forecast_api=forecast_api)
-
-            if energy_details is not None:
-                # Successful poll
-                consecutive_failures = 0
-                last_successful_energy = energy_details
-                if battery_data is not None:
-                    last_successful_battery = battery_data
-                if history_data is not None:
-                    last_successful_history = history_data
-                if forecast_data is not None:
-                    last_successful_forecast = forecast_data
-                logging.info(
-                    f"Poll successful - Production: {energy_details.production:.2f} kWh, "
-                    f"Consumption: {energy_details.consumption:.2f} kWh, "
-                    f"Feed-in: {energy_details.feed_in:.2f} kWh, "
-                    f"Purchased: {energy_details.purchased:.2f} kWh"
+            if snapshot.api_unavailable(MAX_FAILURES):
+                # Show error screen while the API is down (breaker open) or after threshold
+                logging.error(
+                    f"API unreachable ({snapshot.consecutive_failures} consecutive failures, "
+                    f"circuit {snapshot.api_state}), displaying error screen"
                 )
+                from screens.error import render_error_screen
 
-                # Build screen cycle with appropriate data per screen
-                cycle = []
-                for render_fn, data_key, name in screens:
-                    if data_key == "energy":
-                        cycle.append((render_fn, energy_details, name))
-                    elif data_key == "battery" and battery_data:
-                        cycle.append((render_fn, battery_data, name))
-                    elif data_key == "history" and (history_data or last_successful_history):
-                        cycle.append((render_fn, history_data or last_successful_history, name))
-                    elif data_key == "forecast" and forecast_data:
-                        cycle.append((render_fn, forecast_data, name))
-
-                run_screen_cycle(display, cycle)
+                # The rotation may have left a render-ahead job running
+                render_ahead.cancel()
+                error_image = render_error_screen()
+                display.render(error_image, "error")
+                interruptible_sleep(60)
+                continue
 
-            else:
-                # Poll failed
-                consecutive_failures += 1
-                logging.warning(
-                    f"Poll failed (consecutive failures: {consecutive_failures}/{MAX_FAILURES})"
-                )
+            if snapshot.consecutive_failures > 0:
+                # Show stale data before threshold
+                logging.info("Showing stale data from last successful poll")
 
-                if consecutive_failures >= MAX_FAILURES:
-                    # Show error screen after threshold
-                    logging.error(
-                        f"API unreachable after {MAX_FAILURES} consecutive failures, "
-                        f"displaying error screen"
-                    )
-                    error_image = render_error_screen()
-                    display.render(error_image, "error")
-                elif last_successful_energy is not None:
-                    # Show stale data before threshold
-                    logging.info("Showing stale data from last successful poll")
-                    stale_cycle = []
-                    for render_fn, data_key, name in screens:
-                        if data_key == "energy":
-                            stale_cycle.append((render_fn, last_successful_energy, name))
-                        elif data_key == "battery" and last_successful_battery:
-                            stale_cycle.append((render_fn, last_successful_battery, name))
-                        elif data_key == "history" and last_successful_history:
-                            stale_cycle.append((render_fn, last_successful_history, name))
-                        elif data_key == "forecast" and last_successful_forecast:
-                            stale_cycle.append((render_fn, last_successful_forecast, name))
-                    run_screen_cycle(display, stale_cycle)
-
-            # Schedule next poll
-            next_poll += poll_interval_seconds
-
-            # If we fell behind (long cycle), reset to now + interval
-            if next_poll < time.monotonic():
-                logging.warning(
-                    "Poll cycle took longer than interval, resetting schedule"
-                )
-                next_poll = time.monotonic() + poll_interval_seconds
+            run_screen_cycle(display, screens, fetcher, render_ahead, store)
 
     finally:
         # Always runs: clean shutdown
         logging.info("Shutting down, clearing display")
+        fetcher.stop()
+        fetcher.join(timeout=1.0)  # In-flight requests are abandoned (daemon thread)
+        render_ahead.close()
         display.clear()
         display.sleep()
         logging.info("Shutdown complete")
@@ -7,8 +7,9 @@ instances to ensure data consistency throughout the application.
 All models include a fetched_at timestamp to track when the data was retrieved.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -136,3 +137,89 @@ class ForecastData:
     tomorrow_kwh: float
     actual_production: float = 0.0
     fetched_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    """Latest known data for all screens, published by the background fetcher.
+
+    A new snapshot replaces the previous one as a whole after every poll, so
+    readers always see a consistent set of values. Any field may be None if
+    that data has never been fetched successfully; after a failed poll the
+    previous values are carried over.
+
+    Fields:
+        energy: Today's energy totals (energy screens)
+        battery: Battery state (Hausakku screen)
+        history: Daily energy history (Verlauf screens)
+        forecast: Production forecast (Prognose screen)
+        consecutive_failures: Number of failed polls since the last success
+        api_state: SolarEdge circuit breaker state after the poll
+            ("closed", "open" or "half_open")
+        last_update_time: Site's lastUpdateTime (latest inverter upload)
+            the data was fetched after, "" if unknown
+        fetched_at: Timestamp of the poll that produced this snapshot
+    """
+    energy: Optional[EnergyDetails] = None
+    battery: Optional[BatteryData] = None
+    history: Optional[EnergyHistory] = None
+    forecast: Optional[ForecastData] = None
+    consecutive_failures: int = 0
+    api_state: str = "closed"
+    last_update_time: str = ""
+    fetched_at: datetime = field(default_factory=datetime.now)
+
+    def api_unavailable(self, max_failures: int) -> bool:
+        """True if the error screen should replace stale data.
+
+        That is the case when the circuit breaker is open (the API is known to
+        be down) and the latest poll failed, or after max_failures failed polls.
+        """
+        if self.consecutive_failures >= max_failures:
+            return True
+        return self.api_state == "open" and self.consecutive_failures > 0
+
+    def data_for(self, data_key: str):
+        """Return the data object for a screen's data_key (see screens.get_screens)."""
+        return {
+            "energy": self.energy,
+            "battery": self.battery,
+            "history": self.history,
+            "forecast": self.forecast,
+        }.get(data_key)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (datetimes as ISO strings), see from_dict()."""
+        def encode(value):
+            if isinstance(value, datetime):
+                return value.isoformat()
+            if isinstance(value, dict):
+                return {k: encode(v) for k, v in value.items()}
+            return value
+
+        return encode(asdict(self))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DataSnapshot":
+        """Rebuild a snapshot from to_dict() output.
+
+        Raises:
+            KeyError, TypeError, ValueError: If data is not a valid snapshot
+        """
+        def decode(model, values):
+            if values is None:
+                return None
+            values = dict(values)
+            values["fetched_at"] = datetime.fromisoformat(values["fetched_at"])
+            return model(**values)
+
+        return cls(
+            energy=decode(EnergyDetails, data["energy"]),
+            battery=decode(BatteryData, data["battery"]),
+            history=decode(EnergyHistory, data["history"]),
+            forecast=decode(ForecastData, data["forecast"]),
+            consecutive_failures=int(data["consecutive_failures"]),
+            api_state=str(data["api_state"]),
+            last_update_time=str(data["last_update_time"]),
+            fetched_at=datetime.fromisoformat(data["fetched_at"]),
+        )
@@ -0,0 +1,104 @@
+"""
+Small JSON (and binary) state files that survive restarts.
+
+State (history cache, quota ledger, ...) lives as JSON files in the state
+directory (SOLAREDGE_STATE_DIR, default ./state). Writes go to a temporary
+file in the same directory and are renamed over the target, so a power cut
+mid-write leaves either the old or the new file, never a truncated one.
+
+Loading never raises: a missing or corrupt file logs a warning and returns
+the default, so the monitor starts fresh instead of crashing.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+def load_json(path, default: Any = None) -> Any:
+    """
+    Load a JSON state file.
+
+    Args:
+        path: File path
+        default: Value returned if the file is missing or unreadable
+
+    Returns:
+        Parsed JSON, or default
+    """
+    path = Path(path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable state file {path}: {e}")
+        return default
+
+
+def save_json(path, data: Any) -> bool:
+    """
+    Atomically write a JSON state file, creating its directory if needed.
+
+    Args:
+        path: File path
+        data: JSON-serializable data
+
+    Returns:
+        True on success, False if the file could not be written (logged)
+    """
+    def write(f):
+        f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    return _atomic_write(path, write)
+
+
+def load_bytes(path) -> Optional[bytes]:
+    """
+    Load a binary state file.
+
+    Returns:
+        File contents, or None if the file is missing or unreadable
+    """
+    path = Path(path)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logging.warning(f"Ignoring unreadable state file {path}: {e}")
+        return None
+
+
+def save_bytes(path, data: bytes) -> bool:
+    """
+    Atomically write a binary state file (e.g. a packed framebuffer).
+
+    Returns:
+        True on success, False if the file could not be written (logged)
+    """
+    return _atomic_write(path, lambda f: f.write(bytes(data)))
+
+
+def _atomic_write(path, write) -> bool:
+    """Write a file through write(binary_file) to a temp file, fsync and rename it over path."""
+    path = Path(path)
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logging.warning(f"Failed to write state file {path}: {e}")
+        if tmp_name and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        return False
@@ -0,0 +1,307 @@
+"""
+SolarEdge API quota ledger and budget-aware poll planner.
+
+SolarEdge allows 300 requests per API key and day. The ledger counts every
+request per endpoint, persisted in the state directory so restarts do not
+forget what was already spent, and resets at local midnight.
+
+Before each poll the fetcher asks plan_interval() how long to wait. The
+planner projects the day's use from the measured calls per poll and the
+awake time left until midnight (the sleep window makes no requests). If the
+configured interval would overshoot the budget it stretches the interval
+just enough to land on it; once there is room again it shrinks back to the
+configured interval.
+
+Dry run (estimate daily calls for a configuration, no requests made):
+    python3 quota.py --poll-interval 5 --battery
+    python3 quota.py --sleep-mode sun --lat 48.14 --lon 11.58 --date 2026-06-21
+"""
+
+import argparse
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+from dotenv import load_dotenv
+
+from config import SLEEP_MODES, TIMEZONE, is_dark_hour, is_sleep_hour
+from persistence import load_json, save_json
+
+# Requests per API key and day allowed by SolarEdge
+DAILY_LIMIT = 300
+
+# Requests per poll before any poll was measured: the overview freshness check
+# plus energy summary, power flow and storage on polls that see a new upload
+DEFAULT_CALLS_PER_POLL = 3
+
+# Typical time between inverter uploads; polls in between only check the overview
+UPLOAD_INTERVAL_MINUTES = 15
+
+# Weight of the latest poll in the calls-per-poll moving average
+CALLS_EWMA_WEIGHT = 0.3
+
+
+def awake_seconds_until_midnight(now: datetime, sleeping: Callable[[int], bool]) -> float:
+    """
+    Seconds from now until local midnight that are outside the sleep window.
+
+    Args:
+        now: Current local time
+        sleeping: Callable returning True for hours (0-23) in the sleep window
+
+    Returns:
+        Awake seconds left today
+    """
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    awake = 0.0
+    t = now
+    while t < midnight:
+        next_hour = (t + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+        if not sleeping(t.hour):
+            awake += (min(next_hour, midnight) - t).total_seconds()
+        t = next_hour
+    return awake
+
+
+class QuotaManager:
+    """Per-endpoint request ledger with daily budget planning.
+
+    record() is called from the API client's worker threads, so the ledger
+    is guarded by a lock.
+
+    Attributes:
+        path: JSON ledger file in the state directory
+        daily_budget: Requests per day the monitor may use (<= DAILY_LIMIT)
+        calls_per_poll: Moving average of requests per poll
+    """
+
+    def __init__(
+        self,
+        path,
+        daily_budget: int = DAILY_LIMIT,
+        sleeping: Optional[Callable[[int], bool]] = None,
+        tz: str = TIMEZONE,
+    ):
+        """Load today's ledger from path (a ledger from another day is discarded).
+
+        Args:
+            path: JSON ledger file
+            daily_budget: Requests per day to stay under
+            sleeping: Callable returning True for local hours (0-23) without polling
+            tz: Timezone whose midnight starts a new quota day
+        """
+        self.path = path
+        self.daily_budget = daily_budget
+        self.calls_per_poll = float(DEFAULT_CALLS_PER_POLL)
+        self._sleeping = sleeping or (lambda hour: False)
+        self._tz = ZoneInfo(tz)
+        self._lock = threading.Lock()
+
+        stored = load_json(path, default={})
+        self._day = self._today()
+        self._endpoints = {}
+        if isinstance(stored, dict) and stored.get("day") == self._day:
+            self._endpoints = dict(stored.get("endpoints", {}))
+            self.calls_per_poll = float(stored.get("calls_per_poll", self.calls_per_poll))
+            logging.info(f"API quota: {self.used_today()} requests already used today")
+
+    def _now(self) -> datetime:
+        return datetime.now(self._tz)
+
+    def _today(self) -> str:
+        return self._now().strftime("%Y-%m-%d")
+
+    def _roll_day(self) -> None:
+        # Caller holds the lock
+        today = self._today()
+        if today != self._day:
+            logging.info(f"API quota: new day, {sum(self._endpoints.values())} requests used on {self._day}")
+            self._day = today
+            self._endpoints = {}
+
+    def record(self, endpoint: str, count: int = 1) -> None:
+        """Count requests to an endpoint (e.g. "energyDetails")."""
+        with self._lock:
+            self._roll_day()
+            self._endpoints[endpoint] = self._endpoints.get(endpoint, 0) + count
+
+    def used_today(self) -> int:
+        """Requests counted today across all endpoints."""
+        with self._lock:
+            self._roll_day()
+            return sum(self._endpoints.values())
+
+    def record_poll(self, calls: int) -> None:
+        """Feed the request count of a finished poll into the average and persist the ledger."""
+        with self._lock:
+            self.calls_per_poll += CALLS_EWMA_WEIGHT * (calls - self.calls_per_poll)
+            self._roll_day()
+            data = {"day": self._day, "endpoints": self._endpoints, "calls_per_poll": round(self.calls_per_poll, 3)}
+        save_json(self.path, data)
+
+    def projected_use(self, interval_seconds: float) -> float:
+        """Requests expected by midnight when polling every interval_seconds from now."""
+        awake = awake_seconds_until_midnight(self._now(), self._sleeping)
+        return self.used_today() + (awake / interval_seconds) * self.calls_per_poll
+
+    def plan_interval(self, base_interval_seconds: float) -> float:
+        """
+        Poll interval that keeps today's use within the budget.
+
+        Args:
+            base_interval_seconds: Configured poll interval
+
+        Returns:
+            base_interval_seconds if it fits the budget, otherwise the
+            stretched interval that spreads the remaining requests evenly
+            over the awake time left (until midnight if the budget is spent)
+        """
+        if self.projected_use(base_interval_seconds) <= self.daily_budget:
+            return base_interval_seconds
+
+        now = self._now()
+        awake = awake_seconds_until_midnight(now, self._sleeping)
+        remaining = self.daily_budget - self.used_today()
+
+        if remaining < self.calls_per_poll:
+            # Budget spent: wait for the new quota day
+            midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            return max(base_interval_seconds, (midnight - now).total_seconds() + 60)
+
+        affordable_polls = remaining / self.calls_per_poll
+        return max(base_interval_seconds, awake / affordable_polls)
+
+
+def estimate_daily_calls(poll_interval_minutes: float, sleeping: Callable[[int], bool],
+                         has_battery: bool, calls_per_poll: Optional[float] = None) -> dict:
+    """
+    Estimate a full day's requests for a configuration (dry run).
+
+    Args:
+        poll_interval_minutes: Configured poll interval
+        sleeping: Callable returning True for hours (0-23) in the sleep window
+        has_battery: Whether storage data is fetched each poll
+        calls_per_poll: Override the per-poll request count
+
+    Returns:
+        dict with awake_hours, polls, calls_per_poll and daily_calls
+    """
+    awake_hours = sum(1 for hour in range(24) if not sleeping(hour))
+    if calls_per_poll is None:
+        # Overview check every poll; data requests only when a new upload landed
+        data_calls = 2 + (1 if has_battery else 0)  # energy summary, power flow, storage
+        calls_per_poll = 1 + data_calls * min(1.0, poll_interval_minutes / UPLOAD_INTERVAL_MINUTES)
+    polls = awake_hours * 60 / poll_interval_minutes
+    return {
+        "awake_hours": awake_hours,
+        "polls": polls,
+        "calls_per_poll": calls_per_poll,
+        "daily_calls": polls * calls_per_poll + 1,  # +1: inventory check at startup
+    }
+
+
+def interval_within_budget(budget: int, sleeping: Callable[[int], bool], has_battery: bool,
+                           calls_per_poll: Optional[float] = None, tolerance: float = 0.05) -> Optional[float]:
+    """
+    Shortest poll interval whose estimated daily calls fit the budget (dry run).
+
+    Solved by bisection on estimate_daily_calls(), since the calls per poll
+    themselves depend on the interval.
+
+    Args:
+        budget: Daily request budget
+        sleeping: Callable returning True for hours (0-23) in the sleep window
+        has_battery: Whether storage data is fetched each poll
+        calls_per_poll: Override the per-poll request count
+        tolerance: Precision of the result in minutes
+
+    Returns:
+        Interval in minutes, or None if not even one poll per awake day fits
+    """
+    def fits(minutes):
+        return estimate_daily_calls(minutes, sleeping, has_battery, calls_per_poll)["daily_calls"] <= budget
+
+    awake_minutes = sum(60 for hour in range(24) if not sleeping(hour))
+    low, high = tolerance, max(awake_minutes, tolerance)
+    if not fits(high):
+        return None
+    while high - low > tolerance:
+        middle = (low + high) / 2
+        if fits(middle):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def positive_minutes(value: str) -> float:
+    """argparse type: a poll interval in minutes greater than 0."""
+    minutes = float(value)
+    if minutes <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0 (got {value})")
+    return minutes
+
+
+def main(argv=None) -> int:
+    """Dry-run CLI: print the estimated daily request count for a configuration."""
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Estimate daily SolarEdge API requests (no requests are made)")
+    parser.add_argument("--poll-interval", type=positive_minutes, default=float(os.environ.get("SOLAREDGE_POLL_INTERVAL", "5")),
+                        help="Poll interval in minutes (default: SOLAREDGE_POLL_INTERVAL or 5)")
+    parser.add_argument("--sleep-start", type=int, default=int(os.environ.get("SOLAREDGE_SLEEP_START", "0")),
+                        help="Sleep window start hour (default: SOLAREDGE_SLEEP_START or 0)")
+    parser.add_argument("--sleep-end", type=int, default=int(os.environ.get("SOLAREDGE_SLEEP_END", "6")),
+                        help="Sleep window end hour (default: SOLAREDGE_SLEEP_END or 6)")
+    parser.add_argument("--sleep-mode", choices=SLEEP_MODES, default=os.environ.get("SOLAREDGE_SLEEP_MODE", "fixed"),
+                        help="Sleep window: fixed hours or sunset to sunrise (default: SOLAREDGE_SLEEP_MODE or fixed)")
+    parser.add_argument("--lat", type=float, default=os.environ.get("FORECAST_LAT"),
+                        help="Latitude for --sleep-mode sun (default: FORECAST_LAT)")
+    parser.add_argument("--lon", type=float, default=os.environ.get("FORECAST_LON"),
+                        help="Longitude for --sleep-mode sun (default: FORECAST_LON)")
+    parser.add_argument("--sunrise-offset", type=int, default=int(os.environ.get("SOLAREDGE_SUNRISE_OFFSET", "0")),
+                        help="Minutes after sunrise to wake (default: SOLAREDGE_SUNRISE_OFFSET or 0)")
+    parser.add_argument("--sunset-offset", type=int, default=int(os.environ.get("SOLAREDGE_SUNSET_OFFSET", "30")),
+                        help="Minutes after sunset to sleep (default: SOLAREDGE_SUNSET_OFFSET or 30)")
+    parser.add_argument("--date", type=date.fromisoformat, default=None,
+                        help="Day for --sleep-mode sun (YYYY-MM-DD, default: today)")
+    parser.add_argument("--budget", type=int, default=int(os.environ.get("SOLAREDGE_DAILY_BUDGET", "280")),
+                        help="Daily request budget (default: SOLAREDGE_DAILY_BUDGET or 280)")
+    parser.add_argument("--battery", action="store_true", help="Site has a battery (storage data per poll)")
+    parser.add_argument("--calls-per-poll", type=float, default=None, help="Override requests per poll")
+    args = parser.parse_args(argv)
+
+    if args.sleep_mode == "sun":
+        if args.lat is None or args.lon is None:
+            parser.error("--sleep-mode sun requires --lat and --lon (or FORECAST_LAT and FORECAST_LON)")
+        day = args.date or datetime.now(ZoneInfo(TIMEZONE)).date()
+
+        def sleeping(hour):
+            return is_dark_hour(day, hour, args.lat, args.lon, args.sunrise_offset, args.sunset_offset)
+    else:
+        def sleeping(hour):
+            return is_sleep_hour(hour, args.sleep_start, args.sleep_end)
+
+    est = estimate_daily_calls(args.poll_interval, sleeping, args.battery, args.calls_per_poll)
+    if args.sleep_mode == "sun":
+        print(f"Sleep window:    sunset to sunrise on {day}")
+    print(f"Awake hours:     {est['awake_hours']}")
+    print(f"Polls per day:   {est['polls']:.0f} (every {args.poll_interval:g} min)")
+    print(f"Calls per poll:  {est['calls_per_poll']:g}")
+    print(f"Daily calls:     {est['daily_calls']:.0f} (budget {args.budget}, limit {DAILY_LIMIT})")
+
+    if est["daily_calls"] <= args.budget:
+        print("Within budget: the configured interval is used all day.")
+        return 0
+    needed = interval_within_budget(args.budget, sleeping, args.battery, args.calls_per_poll)
+    if needed is None:
+        print("Over budget: the budget does not cover even one poll a day.")
+    else:
+        print(f"Over budget: polling will be stretched to about every {needed:.1f} min.")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,19 +3,34 @@ Rendering utilities for e-ink display output.
 
 This package provides shared building blocks for screen renderers:
 - Font loading with caching and fallback
+- Render canvas with configurable supersampling (1x, 2x, 4x)
 - Geometric icon drawing (battery, house, grid, sun)
 - Horizontal bar chart drawing with percentage display
+- Cached static screen templates (headline, labels, bar outlines)
+- LRU cache of text bounding boxes and rasterized text masks
 """
 
 from rendering.fonts import load_font
+from rendering.canvas import new_canvas, set_render_scale, get_render_scale
 from rendering.icons import draw_battery_icon, draw_house_icon, draw_grid_icon, draw_sun_icon
-from rendering.bars import draw_horizontal_bar
+from rendering.bars import draw_horizontal_bar, draw_bar_outline, draw_bar_fill
+from rendering.templates import get_template, measure_text
+from rendering.text import text_cache_info, clear_text_cache
 
 __all__ = [
     'load_font',
+    'new_canvas',
+    'set_render_scale',
+    'get_render_scale',
     'draw_battery_icon',
     'draw_house_icon',
     'draw_grid_icon',
     'draw_sun_icon',
     'draw_horizontal_bar',
+    'draw_bar_outline',
+    'draw_bar_fill',
+    'get_template',
+    'measure_text',
+    'text_cache_info',
+    'clear_text_cache',
 ]
@@ -20,11 +20,35 @@ def draw_horizontal_bar(draw: ImageDraw.Draw, bbox: tuple, percentage: float, fo
         label: Optional label to prefix before percentage (e.g., "Eigenverbrauch" → "Eigenverbrauch 75%")
         legend: Optional pre-formatted legend text (overrides label if provided)
     """
-    x0, y0, x1, y1 = bbox
+    draw_bar_outline(draw, bbox)
+    draw_bar_fill(draw, bbox, percentage, font, label=label, legend=legend)
+
 
-    # Draw outline rectangle
+def draw_bar_outline(draw: ImageDraw.Draw, bbox: tuple) -> None:
+    """
+    Draw the static outline of a horizontal bar (part of screen templates).
+
+    Args:
+        draw: PIL ImageDraw instance
+        bbox: Tuple of (x0, y0, x1, y1) defining bar bounds
+    """
     draw.rectangle(bbox, outline=0, width=4)
 
+
+def draw_bar_fill(draw: ImageDraw.Draw, bbox: tuple, percentage: float, font, label: str = "", legend: str = "") -> None:
+    """
+    Draw the dynamic part of a horizontal bar: fill and legend text below it.
+
+    Args:
+        draw: PIL ImageDraw instance
+        bbox: Tuple of (x0, y0, x1, y1) defining bar bounds
+        percentage: Fill percentage (0-100)
+        font: PIL font object for percentage text
+        label: Optional label to prefix before percentage
+        legend: Optional pre-formatted legend text (overrides label if provided)
+    """
+    x0, y0, x1, y1 = bbox
+
     # Clamp percentage to valid range
     percentage = max(0.0, min(100.0, percentage))
 
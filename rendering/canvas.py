@@ -0,0 +1,119 @@
+"""
+Render canvas with a configurable supersampling factor.
+
+Screens lay out in logical 1000x488 coordinates (4x the 250x122 panel). The
+render scale sets how many pixels the canvas really has:
+
+- 4: 1000x488, downscaled with LANCZOS (highest quality, default)
+- 2: 500x244, downscaled with a 2x2 box filter (Image.reduce)
+- 1: 250x122, native panel resolution, no downscaling
+
+CanvasDraw maps logical coordinates, line widths and font sizes onto the real
+canvas, so screen code is the same at every scale. At scale 4 the mapping is
+the identity and output is unchanged.
+"""
+
+from PIL import Image, ImageDraw
+
+from rendering.fonts import scale_font
+from rendering.text import draw_text, text_bbox
+
+# Logical canvas every screen lays out in
+CANVAS_W, CANVAS_H = 1000, 488
+LOGICAL_SCALE = 4
+
+RENDER_SCALES = (1, 2, 4)
+
+# Module-level render scale, set once at startup
+_render_scale = LOGICAL_SCALE
+
+
+def set_render_scale(scale: int) -> None:
+    """Set the supersampling factor used by new_canvas() (1, 2 or 4)."""
+    global _render_scale
+    if scale not in RENDER_SCALES:
+        raise ValueError(f"Render scale must be one of {RENDER_SCALES} (got {scale})")
+    _render_scale = scale
+
+
+def get_render_scale() -> int:
+    """Return the current supersampling factor."""
+    return _render_scale
+
+
+def canvas_size() -> tuple:
+    """Return the real (width, height) of a canvas at the current scale."""
+    return (CANVAS_W * _render_scale // LOGICAL_SCALE, CANVAS_H * _render_scale // LOGICAL_SCALE)
+
+
+def new_canvas() -> tuple:
+    """
+    Create a blank white 1-bit canvas at the current render scale.
+
+    Returns:
+        (image, draw) where draw is a CanvasDraw taking logical coordinates
+    """
+    img = Image.new('1', canvas_size(), 1)
+    return img, CanvasDraw(img)
+
+
+class CanvasDraw:
+    """ImageDraw wrapper that takes logical (1000x488) coordinates.
+
+    Supports the drawing calls used by screens and rendering helpers: text,
+    textbbox, rectangle, line, polygon and ellipse. textbbox returns logical
+    coordinates, so layout arithmetic in screens works unchanged. Plain
+    text() and textbbox() calls go through the text cache (rendering.text).
+    """
+
+    def __init__(self, image: Image.Image):
+        self._image = image
+        self._draw = ImageDraw.Draw(image)
+        self._factor = image.width / CANVAS_W
+
+    def _scale(self, value):
+        return int(round(value * self._factor))
+
+    def _xy(self, xy):
+        """Scale a flat coordinate sequence or a sequence of (x, y) points."""
+        if self._factor == 1:
+            return xy
+        return [
+            tuple(self._scale(v) for v in item) if isinstance(item, (tuple, list)) else self._scale(item)
+            for item in xy
+        ]
+
+    def _width(self, width):
+        if self._factor == 1 or not width:
+            return width
+        return max(1, self._scale(width))
+
+    def _font(self, font):
+        return font if self._factor == 1 else scale_font(font, self._factor)
+
+    def text(self, xy, text, fill=None, font=None, **kwargs):
+        if kwargs or font is None or fill is None:
+            self._draw.text(self._xy(xy), text, fill=fill, font=self._font(font), **kwargs)
+        else:
+            draw_text(self._image, self._xy(xy), text, fill, self._font(font))
+
+    def textbbox(self, xy, text, font=None, **kwargs):
+        if kwargs or font is None:
+            bbox = self._draw.textbbox(self._xy(xy), text, font=self._font(font), **kwargs)
+        else:
+            bbox = text_bbox(self._xy(xy), text, self._font(font))
+        if self._factor == 1:
+            return bbox
+        return tuple(int(round(v / self._factor)) for v in bbox)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self._draw.rectangle(self._xy(xy), fill=fill, outline=outline, width=self._width(width))
+
+    def line(self, xy, fill=None, width=0):
+        self._draw.line(self._xy(xy), fill=fill, width=self._width(width))
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        self._draw.polygon(self._xy(xy), fill=fill, outline=outline, width=self._width(width))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self._draw.ellipse(self._xy(xy), fill=fill, outline=outline, width=self._width(width))
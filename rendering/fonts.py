@@ -60,3 +60,19 @@ def load_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
     default_font = ImageFont.load_default()
     _FONT_CACHE[cache_key] = default_font
     return default_font
+
+
+def scale_font(font, factor: float):
+    """
+    Return the same TrueType font at a scaled size (cached via load_font).
+
+    Used to render logical font sizes onto a smaller canvas. The PIL default
+    font has no scalable size and is returned unchanged.
+
+    Args:
+        font: Font returned by load_font()
+        factor: Size multiplier (e.g. 0.5 for a half-size canvas)
+    """
+    if not hasattr(font, "path"):
+        return font
+    return load_font(Path(font.path).name, max(1, int(round(font.size * factor))))
@@ -0,0 +1,62 @@
+"""
+Pre-rendered static screen templates.
+
+The static parts of a screen (headline, fixed labels, bar outlines) and the
+layout positions derived from measuring them are rasterized once per screen
+and canvas size. Each render copies the template and draws only the dynamic
+values on top.
+
+Screens pass anything their static layout depends on (e.g. the height of the
+big value text, which positions the value+bar group) as template key, so a
+template never goes stale.
+"""
+
+from PIL import Image
+
+from rendering.canvas import CanvasDraw, canvas_size
+
+# Module-level cache: (name, canvas size, key) -> (template image, layout dict)
+_TEMPLATE_CACHE = {}
+
+# Scratch canvases for measuring text without drawing, one per canvas size
+_MEASURE_DRAWS = {}
+
+
+def get_template(name: str, build, *key) -> tuple:
+    """
+    Return a fresh copy of a cached screen template and its layout.
+
+    Args:
+        name: Template name (the screen name)
+        build: Callable taking *key and returning (image, layout dict); called
+            once per name, canvas size and key
+        *key: Hashable inputs the static layout depends on
+
+    Returns:
+        (image, draw, layout): a copy of the template to draw on, a CanvasDraw
+        for it, and the layout dict produced by build (do not modify)
+    """
+    cache_key = (name, canvas_size(), key)
+    if cache_key not in _TEMPLATE_CACHE:
+        _TEMPLATE_CACHE[cache_key] = build(*key)
+    template, layout = _TEMPLATE_CACHE[cache_key]
+    img = template.copy()
+    return img, CanvasDraw(img), layout
+
+
+def measure_text(xy: tuple, text: str, font) -> tuple:
+    """
+    Measure text in logical coordinates without a target image.
+
+    Args:
+        xy: Logical draw position
+        text: Text to measure
+        font: Font from load_font()
+
+    Returns:
+        Logical bounding box (x0, y0, x1, y1), as CanvasDraw.textbbox
+    """
+    size = canvas_size()
+    if size not in _MEASURE_DRAWS:
+        _MEASURE_DRAWS[size] = CanvasDraw(Image.new('1', size, 1))
+    return _MEASURE_DRAWS[size].textbbox(xy, text, font=font)
@@ -0,0 +1,98 @@
+"""
+Text metric and glyph mask cache.
+
+load_font() caches font objects, but every draw.text() and textbbox() call
+still lays out and rasterizes the string through FreeType. Screens measure
+and draw the same strings over and over ("kWh", "%", fixed labels, and values
+that change only a few times a day), so both results are memoized here:
+
+- text_bbox(): bounding box of a string at the origin, shifted to the
+  requested position
+- draw_text(): pastes a cached 1-bit mask of the whole string
+
+Both caches are keyed by (font, string) (the font object already fixes file
+and size, as load_font returns one object per pair) and bounded with LRU
+eviction. Whole strings are cached rather than single glyphs so kerning and
+sub-pixel advances stay exactly as FreeType lays them out; output is
+pixel-identical to ImageDraw.text().
+"""
+
+from functools import lru_cache
+
+from PIL import Image, ImageDraw
+
+# Maximum number of cached strings per cache (bboxes, masks)
+TEXT_CACHE_SIZE = 512
+
+
+def _cacheable(font) -> bool:
+    # The PIL default bitmap font has no size and is rare; only cache TrueType
+    return hasattr(font, "getmask2")
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _origin_bbox(font, text: str) -> tuple:
+    return ImageDraw.Draw(Image.new('1', (1, 1))).textbbox((0, 0), text, font=font)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _mask(font, text: str) -> tuple:
+    # Rasterize once near the origin; integer draw positions do not change
+    # how FreeType renders the string, so the mask can be pasted anywhere.
+    # Glyphs may extend left of / above the draw position, hence the offset.
+    x0, y0, x1, y1 = _origin_bbox(font, text)
+    ox, oy = min(x0, 0), min(y0, 0)
+    mask = Image.new('1', (max(1, x1 - ox), max(1, y1 - oy)), 0)
+    ImageDraw.Draw(mask).text((-ox, -oy), text, fill=1, font=font)
+    return mask, ox, oy
+
+
+def text_bbox(xy: tuple, text: str, font) -> tuple:
+    """
+    Bounding box of text drawn at xy, as ImageDraw.textbbox (cached).
+
+    Args:
+        xy: Integer draw position (x, y)
+        text: Text to measure
+        font: Font from load_font()
+
+    Returns:
+        Bounding box (x0, y0, x1, y1)
+    """
+    x, y = xy
+    if not _cacheable(font) or x != int(x) or y != int(y):
+        return ImageDraw.Draw(Image.new('1', (1, 1))).textbbox(xy, text, font=font)
+    x0, y0, x1, y1 = _origin_bbox(font, text)
+    return (x0 + x, y0 + y, x1 + x, y1 + y)
+
+
+def draw_text(image: Image.Image, xy: tuple, text: str, fill, font) -> None:
+    """
+    Draw text onto an image from a cached mask, as ImageDraw.text.
+
+    Args:
+        image: Target image (cached for mode '1', drawn directly otherwise)
+        xy: Integer draw position (x, y)
+        text: Text to draw
+        fill: Ink colour
+        font: Font from load_font()
+    """
+    x, y = xy
+    if not text:
+        return
+    if not _cacheable(font) or image.mode != '1' or x != int(x) or y != int(y):
+        ImageDraw.Draw(image).text(xy, text, fill=fill, font=font)
+        return
+    mask, ox, oy = _mask(font, text)
+    image.paste(fill, (int(x) + ox, int(y) + oy), mask)
+
+
+def text_cache_info() -> dict:
+    """Hit/miss statistics of the bbox and mask caches (for logging and benchmarks)."""
+    return {"bbox": _origin_bbox.cache_info(), "mask": _mask.cache_info()}
+
+
+def clear_text_cache() -> None:
+    """Drop all cached bboxes and masks."""
+    _origin_bbox.cache_clear()
+    _mask.cache_clear()
@@ -0,0 +1,131 @@
+"""
+Persistent per-endpoint cache of SolarEdge API responses.
+
+Responses are kept in a JSON file in the state directory, so a restart (or
+the startup inventory check) is served from disk instead of the network.
+Each endpoint has its own policy of (ttl, stale) seconds:
+
+- younger than ttl: fresh, returned without a request
+- older than ttl but younger than ttl + stale: returned immediately, and
+  refreshed in the background (stale-while-revalidate)
+- older: treated as missing
+
+Endpoints without a policy are never cached. Only data that rarely
+changes (the inventory) has one: caching live data would rewrite the file
+on every poll (SD card wear) to help only right after a restart, and the
+site overview is the freshness check, which must always go to the network.
+Finished history days have their own cache (history_cache.py).
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from persistence import load_json, save_json
+
+# Endpoint name (last path segment) -> (ttl seconds, stale-while-revalidate seconds)
+CACHE_POLICIES = {
+    "inventory": (24 * 3600, 30 * 24 * 3600),
+}
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+def endpoint_name(endpoint: str) -> str:
+    """Policy/ledger name of an endpoint path ("/site/1/overview" -> "overview")."""
+    return endpoint.rstrip("/").rsplit("/", 1)[-1]
+
+
+class ResponseCache:
+    """Thread-safe response cache persisted as one atomically written JSON file.
+
+    Attributes:
+        path: JSON file in the state directory
+        policies: Endpoint name -> (ttl, stale) seconds
+    """
+
+    def __init__(self, path, policies: Optional[dict] = None):
+        """Load cached responses from path (missing or corrupt file = empty cache).
+
+        Args:
+            path: JSON file in the state directory
+            policies: Override CACHE_POLICIES
+        """
+        self.path = path
+        self.policies = CACHE_POLICIES if policies is None else policies
+        self._lock = threading.Lock()
+        self._revalidating = set()
+        stored = load_json(path, default={})
+        self._entries = stored.get("entries", {}) if isinstance(stored, dict) else {}
+        self._prune(time.time())
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[dict]) -> str:
+        """Cache key for a request (the API key is never part of it)."""
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "api_key")
+        return endpoint + "?" + "&".join(f"{k}={v}" for k, v in items)
+
+    def cacheable(self, endpoint: str) -> bool:
+        """True if the endpoint has a cache policy."""
+        return endpoint_name(endpoint) in self.policies
+
+    def get(self, endpoint: str, key: str) -> tuple:
+        """
+        Look up a cached response.
+
+        Returns:
+            (data, "fresh"), (data, "stale") within the stale-while-revalidate
+            window, or (None, None) if missing or expired
+        """
+        policy = self.policies.get(endpoint_name(endpoint))
+        if policy is None:
+            return None, None
+        ttl, stale = policy
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None, None
+        age = time.time() - entry["stored_at"]
+        if age < ttl:
+            return entry["data"], FRESH
+        if age < ttl + stale:
+            return entry["data"], STALE
+        return None, None
+
+    def put(self, endpoint: str, key: str, data) -> None:
+        """Store a successful response and persist the cache."""
+        if not self.cacheable(endpoint):
+            return
+        now = time.time()
+        with self._lock:
+            self._entries[key] = {"stored_at": now, "data": data}
+            self._prune(now)
+            snapshot = {"entries": dict(self._entries)}
+        save_json(self.path, snapshot)
+
+    def start_revalidation(self, key: str) -> bool:
+        """Claim a background refresh for key; False if one is already running."""
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def end_revalidation(self, key: str) -> None:
+        """Release a refresh claimed with start_revalidation()."""
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def _prune(self, now: float) -> None:
+        # Caller holds the lock (or is __init__): drop entries past ttl + stale
+        def alive(key, entry):
+            ttl, stale = self.policies.get(endpoint_name(key.split("?", 1)[0]), (0, 0))
+            return now - entry.get("stored_at", 0) < ttl + stale
+
+        expired = [k for k, e in self._entries.items() if not alive(k, e)]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            logging.debug(f"Response cache: pruned {len(expired)} expired entries")
@@ -0,0 +1,238 @@
+"""
+Poll scheduling: activity-adaptive interval, aligned to the site's uploads.
+
+AdaptiveInterval picks the poll interval from how fast PV production and
+consumption are changing: the longest configured interval while power is
+flat (night edges, overcast days), the shortest while a cloud front moves
+through. The quota planner can still stretch the result, so the daily
+budget is spent where the values actually change.
+
+SolarEdge inverters upload their data in 15-minute buckets, at an offset
+(phase) within each quarter hour that stays the same for a site. A poll
+right after an upload sees the new data at once; a poll just before one
+fetches nothing new, and the new data then waits almost a full interval
+before it is shown.
+
+UploadPhaseTracker learns the phase from the lastUpdateTime values the
+polls observe and moves each poll to the first expected upload landing
+(plus a margin for the API to catch up) at or after the planned time, so
+polls are never more frequent than the quota planner allows. If an aligned
+poll finds no new upload, it checks once more shortly after. Until enough
+consistent samples are collected, or if the site uploads irregularly, the
+planned interval is used unchanged.
+"""
+
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from models import PowerFlow
+from persistence import load_json, save_json
+
+# SolarEdge upload bucket length
+UPLOAD_PERIOD_SECONDS = 15 * 60
+
+# Time after lastUpdateTime before the new data is served by the API
+LANDING_MARGIN_SECONDS = 60
+
+# Upload phases kept, and needed before polls are aligned
+MAX_SAMPLES = 32
+MIN_SAMPLES = 3
+
+# Mean resultant length of the phase samples (1 = identical, 0 = uniform)
+# below which uploads are treated as irregular and polls are not aligned
+MIN_CONCENTRATION = 0.8
+
+# Shortest wait before the next poll (a poll that ran late into a landing)
+MIN_DELAY_SECONDS = 30
+
+# Recheck after an aligned poll found no new upload (late upload)
+LATE_RETRY_SECONDS = 2 * 60
+
+# Power change per upload period (kW, largest of PV and load) at or below
+# which the site counts as calm (longest interval), and at or above which it
+# counts as busy (shortest interval)
+CALM_KW = 0.1
+BUSY_KW = 1.0
+
+# Weight of the latest sample in the activity moving average
+ACTIVITY_EWMA_WEIGHT = 0.5
+
+# Power flow samples closer together than this are ignored (cached response);
+# after a gap longer than MAX_SAMPLE_GAP_SECONDS (pause, outage) the
+# next sample only starts a new baseline
+MIN_SAMPLE_GAP_SECONDS = 60
+MAX_SAMPLE_GAP_SECONDS = 60 * 60
+
+
+class AdaptiveInterval:
+    """Poll interval controller driven by the rate of change of PV and load power.
+
+    Attributes:
+        min_seconds: Interval while power is changing fast
+        max_seconds: Interval while power is flat
+        activity: Smoothed power change per upload period in kW (None before
+            two samples were seen)
+    """
+
+    def __init__(self, min_seconds: float, max_seconds: float, start_seconds: float):
+        """Create the controller.
+
+        Args:
+            min_seconds: Shortest interval (SOLAREDGE_POLL_MIN)
+            max_seconds: Longest interval (SOLAREDGE_POLL_MAX)
+            start_seconds: Interval until activity is known (SOLAREDGE_POLL_INTERVAL)
+        """
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.activity: Optional[float] = None
+        self._start_seconds = min(max(start_seconds, min_seconds), max_seconds)
+        self._last: Optional[PowerFlow] = None
+
+    def update(self, power_flow: PowerFlow) -> None:
+        """Feed the power flow fetched by a poll."""
+        last = self._last
+        if last is not None:
+            gap = (power_flow.fetched_at - last.fetched_at).total_seconds()
+            if gap < MIN_SAMPLE_GAP_SECONDS:
+                return
+            if gap <= MAX_SAMPLE_GAP_SECONDS:
+                change = max(abs(power_flow.pv_power - last.pv_power), abs(power_flow.load_power - last.load_power))
+                rate = change * UPLOAD_PERIOD_SECONDS / gap
+                if self.activity is None:
+                    self.activity = rate
+                else:
+                    self.activity += ACTIVITY_EWMA_WEIGHT * (rate - self.activity)
+                logging.debug(f"Power activity {self.activity:.2f} kW/15min, poll interval {self.interval() / 60:.1f} min")
+        self._last = power_flow
+
+    def interval(self) -> float:
+        """
+        Poll interval for the current activity.
+
+        Returns:
+            max_seconds when calm, min_seconds when busy, geometrically
+            interpolated in between (start interval while activity is unknown)
+        """
+        if self.activity is None:
+            return self._start_seconds
+        t = min(max((self.activity - CALM_KW) / (BUSY_KW - CALM_KW), 0.0), 1.0)
+        return self.max_seconds * (self.min_seconds / self.max_seconds) ** t
+
+
+def upload_phase(last_update_time: str) -> Optional[float]:
+    """
+    Seconds into the 15-minute bucket of a lastUpdateTime.
+
+    Time zone offsets are whole quarter hours, so the phase of the site's
+    local time equals the phase of the epoch clock.
+
+    Args:
+        last_update_time: "YYYY-MM-DD HH:MM:SS" as returned by the API
+
+    Returns:
+        Phase in seconds (0 to UPLOAD_PERIOD_SECONDS), or None if unparsable
+    """
+    try:
+        t = datetime.strptime(last_update_time, "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+    return float((t.hour * 3600 + t.minute * 60 + t.second) % UPLOAD_PERIOD_SECONDS)
+
+
+class UploadPhaseTracker:
+    """Learns when a site's uploads land and times polls just after them.
+
+    Attributes:
+        path: JSON file in the state directory holding the phase samples
+    """
+
+    def __init__(self, path):
+        """Load phase samples from path (missing or corrupt file = no samples).
+
+        Args:
+            path: JSON file in the state directory
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        stored = load_json(path, default={})
+        self._samples = list(stored.get("samples", []))[-MAX_SAMPLES:] if isinstance(stored, dict) else []
+        self._last_seen = stored.get("last_update_time", "") if isinstance(stored, dict) else ""
+        self._misses = 0  # consecutive polls without a new upload
+
+    def observe(self, last_update_time: str) -> bool:
+        """
+        Record the lastUpdateTime seen by a poll.
+
+        Args:
+            last_update_time: Site overview lastUpdateTime ("" if the check failed)
+
+        Returns:
+            True if it is a new upload
+        """
+        phase = upload_phase(last_update_time)
+        with self._lock:
+            if phase is None:
+                return False
+            if last_update_time == self._last_seen:
+                self._misses += 1
+                return False
+            self._misses = 0
+            self._last_seen = last_update_time
+            self._samples = (self._samples + [phase])[-MAX_SAMPLES:]
+            data = {"last_update_time": last_update_time, "samples": self._samples}
+        save_json(self.path, data)
+        return True
+
+    def phase(self) -> Optional[float]:
+        """Learned upload phase in seconds, or None if not known (yet) or irregular."""
+        with self._lock:
+            samples = list(self._samples)
+        if len(samples) < MIN_SAMPLES:
+            return None
+        # Circular mean: phases 10 s and 890 s are 20 s apart, not 880 s
+        angles = [2 * math.pi * p / UPLOAD_PERIOD_SECONDS for p in samples]
+        x = sum(math.cos(a) for a in angles) / len(angles)
+        y = sum(math.sin(a) for a in angles) / len(angles)
+        if math.hypot(x, y) < MIN_CONCENTRATION:
+            return None
+        return (math.atan2(y, x) % (2 * math.pi)) * UPLOAD_PERIOD_SECONDS / (2 * math.pi)
+
+    def delay_until_poll(self, interval_seconds: float, now: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before the next poll.
+
+        Args:
+            interval_seconds: Planned interval (configured or stretched by the quota)
+            now: Current epoch time (default: time.time())
+
+        Returns:
+            Time until the first upload landing at or after the planned time,
+            LATE_RETRY_SECONDS (but never less than the planned interval)
+            after the first poll that missed an expected upload, or None if
+            the phase is unknown (poll at the plain interval)
+        """
+        phase = self.phase()
+        if phase is None:
+            return None
+
+        # Only the first miss is retried: without production (evening) the
+        # inverter stops uploading and every poll misses
+        with self._lock:
+            late = self._misses == 1
+        if late:
+            # The planned interval may be stretched by the quota planner
+            delay = max(LATE_RETRY_SECONDS, interval_seconds)
+            logging.info(f"No new upload yet, checking again in {delay:.0f}s")
+            return delay
+
+        now = time.time() if now is None else now
+        offset = (phase + LANDING_MARGIN_SECONDS) % UPLOAD_PERIOD_SECONDS
+        earliest = now + max(interval_seconds, MIN_DELAY_SECONDS)
+        landing = math.ceil((earliest - offset) / UPLOAD_PERIOD_SECONDS) * UPLOAD_PERIOD_SECONDS + offset
+        delay = landing - now
+        logging.debug(f"Next poll aligned to upload phase {phase:.0f}s in {delay:.0f}s")
+        return delay
@@ -1,18 +1,33 @@
-from screens.production import render_production_screen
-from screens.consumption import render_consumption_screen
-from screens.feed_in import render_feed_in_screen
-from screens.purchased import render_purchased_screen
-from screens.battery import render_battery_screen
-from screens.history import render_history_production_screen, render_history_consumption_screen
-from screens.forecast import render_forecast_screen
-
-# Legacy screen list (energy screens only)
-SCREENS = [
-    render_production_screen,
-    render_consumption_screen,
-    render_feed_in_screen,
-    render_purchased_screen,
-]
+"""Display screens.
+
+The screen modules (and with them PIL and the rendering package) are
+imported on first use, so a restart can show the restored frame before
+any of the rendering code is loaded.
+"""
+
+import importlib
+
+# Legacy module-level names -> defining module
+_RENDER_FUNCTIONS = {
+    "render_production_screen": "screens.production",
+    "render_consumption_screen": "screens.consumption",
+    "render_feed_in_screen": "screens.feed_in",
+    "render_purchased_screen": "screens.purchased",
+    "render_battery_screen": "screens.battery",
+    "render_history_production_screen": "screens.history",
+    "render_history_consumption_screen": "screens.history",
+    "render_forecast_screen": "screens.forecast",
+}
+
+
+def __getattr__(name):
+    # Imports the render functions (and the legacy SCREENS list) on first access
+    if name in _RENDER_FUNCTIONS:
+        return getattr(importlib.import_module(_RENDER_FUNCTIONS[name]), name)
+    if name == "SCREENS":
+        # Legacy screen list (energy screens only)
+        return [fn for fn, data_key, _ in get_screens() if data_key == "energy"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_screens(has_battery=False, has_forecast_config=False):
@@ -29,6 +44,12 @@ def get_screens(has_battery=False, has_forecast_config=False):
         has_battery: Whether the site has a battery installed
         has_forecast_config: Whether all 5 FORECAST_* env vars are set
     """
+    from screens.production import render_production_screen
+    from screens.consumption import render_consumption_screen
+    from screens.feed_in import render_feed_in_screen
+    from screens.purchased import render_purchased_screen
+    from screens.history import render_history_production_screen, render_history_consumption_screen
+
     screens = [
         (render_production_screen, "energy", "Produktion"),
         (render_consumption_screen, "energy", "Verbrauch"),
@@ -36,8 +57,12 @@ def get_screens(has_battery=False, has_forecast_config=False):
         (render_purchased_screen, "energy", "Bezug"),
     ]
     if has_battery:
+        from screens.battery import render_battery_screen
+
         screens.append((render_battery_screen, "battery", "Hausakku"))
     if has_forecast_config:
+        from screens.forecast import render_forecast_screen
+
         screens.append((render_forecast_screen, "forecast", "Prognose"))
     screens.append((render_history_production_screen, "history", "Verlauf Produktion"))
     screens.append((render_history_consumption_screen, "history", "Verlauf Verbrauch"))
@@ -5,8 +5,10 @@ Displays a simple error message when API is unavailable or other failures occur.
 Used by the main polling loop after consecutive API failures.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
+from rendering.canvas import new_canvas
 from rendering.fonts import load_font
+from rendering.templates import get_template
 
 # Canvas and layout constants (matching other screens)
 CANVAS_W = 1000
@@ -21,20 +23,9 @@ def render_error_screen(message: str = "API nicht erreichbar") -> Image.Image:
         message: Error message to display (default: "API nicht erreichbar")
 
     Returns:
-        PIL Image in mode '1' (1-bit monochrome), size 1000x488
+        PIL Image in mode '1' (1-bit monochrome), size 1000x488 at the default 4x render scale
     """
-    # Create white background (1 = white in mode '1')
-    img = Image.new('1', (CANVAS_W, CANVAS_H), 1)
-    draw = ImageDraw.Draw(img)
-
-    # Draw headline "Fehler" at top-left
-    headline_font = load_font("Arial.ttf", 60)
-    headline_text = "Fehler"
-    draw.text((MARGIN, MARGIN), headline_text, font=headline_font, fill=0)
-
-    # Calculate headline bottom boundary for message centering
-    headline_bbox = draw.textbbox((MARGIN, MARGIN), headline_text, font=headline_font)
-    headline_bottom = headline_bbox[3]
+    img, draw, layout = get_template("Fehler", _build_template)
 
     # Center the error message in the remaining area
     message_font = load_font("Arial.ttf", 48)
@@ -43,7 +34,7 @@ def render_error_screen(message: str = "API nicht erreichbar") -> Image.Image:
     message_height = message_bbox[3] - message_bbox[1]
 
     # Calculate available vertical space below headline
-    available_top = headline_bottom
+    available_top = layout["headline_bottom"]
     available_bottom = CANVAS_H - MARGIN
     available_height = available_bottom - available_top
 
@@ -54,3 +45,22 @@ def render_error_screen(message: str = "API nicht erreichbar") -> Image.Image:
     draw.text((message_x, message_y), message, font=message_font, fill=0)
 
     return img
+
+
+def _build_template() -> tuple:
+    """Draw the "Fehler" headline on a white canvas.
+
+    Returns:
+        (image, layout) where layout holds headline_bottom
+    """
+    # Create white background (1 = white in mode '1')
+    img, draw = new_canvas()
+
+    # Draw headline "Fehler" at top-left
+    headline_font = load_font("Arial.ttf", 60)
+    headline_text = "Fehler"
+    draw.text((MARGIN, MARGIN), headline_text, font=headline_font, fill=0)
+
+    # Headline bottom boundary for message centering
+    headline_bbox = draw.textbbox((MARGIN, MARGIN), headline_text, font=headline_font)
+    return img, {"headline_bottom": headline_bbox[3]}
@@ -5,10 +5,12 @@ Shows total energy fed into the grid.
 Uses unified layout grid matching all other screens.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 from models import EnergyDetails
+from rendering.canvas import new_canvas
 from rendering.fonts import load_font
-from rendering.bars import draw_horizontal_bar
+from rendering.bars import draw_bar_outline, draw_bar_fill
+from rendering.templates import get_template, measure_text
 
 # Unified layout constants (shared across all screens)
 MARGIN = 5
@@ -23,17 +25,48 @@ def render_feed_in_screen(data: EnergyDetails) -> Image:
         data: EnergyDetails instance with energy data
 
     Returns:
-        1000x488 1-bit PIL Image ready for e-ink display
+        1-bit PIL Image at the render scale (1000x488 at 4x) ready for e-ink display
     """
-    img = Image.new('1', (CANVAS_W, CANVAS_H), 1)
-    draw = ImageDraw.Draw(img)
-
     # Fonts (unified across all screens)
-    label_font = load_font('Arial.ttf', 60)
     value_font = load_font('ArialBlack.ttf', 120)
     unit_font = load_font('Arial.ttf', 64)
     bar_font = load_font('Arial.ttf', 56)
 
+    value_text = f"{data.feed_in:.1f}"
+    value_h = measure_text((0, 0), value_text, value_font)[3]
+    img, draw, layout = get_template("Einspeisung", _build_template, value_h)
+
+    value_y = layout["value_y"]
+    draw.text((MARGIN, value_y), value_text, fill=0, font=value_font)
+    value_actual = draw.textbbox((MARGIN, value_y), value_text, font=value_font)
+
+    unit_text = "kWh"
+    unit_x = value_actual[2] + 20
+    unit_actual = draw.textbbox((unit_x, value_y), unit_text, font=unit_font)
+    unit_y = value_actual[3] - (unit_actual[3] - unit_actual[1])
+    draw.text((unit_x, unit_y), unit_text, fill=0, font=unit_font)
+
+    percentage = min(100.0, (data.feed_in / data.production) * 100.0) if data.production > 0 else 0.0
+    draw_bar_fill(draw, layout["bar_bbox"], percentage, bar_font, legend=f"{int(percentage)}% der Tagesproduktion")
+
+    return img
+
+
+def _build_template(value_h: int) -> tuple:
+    """
+    Draw the static parts of the Einspeisung screen and compute its layout.
+
+    Args:
+        value_h: Height of the big value text (from draw position to visual bottom)
+
+    Returns:
+        (image, layout) where layout holds value_y and bar_bbox
+    """
+    img, draw = new_canvas()
+
+    label_font = load_font('Arial.ttf', 60)
+    bar_font = load_font('Arial.ttf', 56)
+
     # --- HEADLINE: top-left ---
     label_text = "Einspeisung, heute"
     draw.text((MARGIN, MARGIN), label_text, fill=0, font=label_font)
@@ -41,10 +74,6 @@ def render_feed_in_screen(data: EnergyDetails) -> Image:
     label_bottom = label_bbox[3]
 
     # --- VALUE+BAR GROUP: vertically centered between headline and bottom ---
-    value_text = f"{data.feed_in:.1f}"
-    value_measure = draw.textbbox((0, 0), value_text, font=value_font)
-    value_h = value_measure[3]
-
     bar_h = 40
     gap_value_bar = 20
     gap_bar_label = 5
@@ -57,18 +86,8 @@ def render_feed_in_screen(data: EnergyDetails) -> Image:
     available_bottom = CANVAS_H - MARGIN - 110  # same as breakdown_y_start on other screens
     value_y = available_top + (available_bottom - available_top - group_h) // 2
 
-    draw.text((MARGIN, value_y), value_text, fill=0, font=value_font)
-    value_actual = draw.textbbox((MARGIN, value_y), value_text, font=value_font)
-
-    unit_text = "kWh"
-    unit_x = value_actual[2] + 20
-    unit_actual = draw.textbbox((unit_x, value_y), unit_text, font=unit_font)
-    unit_y = value_actual[3] - (unit_actual[3] - unit_actual[1])
-    draw.text((unit_x, unit_y), unit_text, fill=0, font=unit_font)
-
     bar_y = value_y + value_h + gap_value_bar
     bar_bbox = (MARGIN, bar_y, CANVAS_W - MARGIN, bar_y + bar_h)
-    percentage = min(100.0, (data.feed_in / data.production) * 100.0) if data.production > 0 else 0.0
-    draw_horizontal_bar(draw, bar_bbox, percentage, bar_font, legend=f"{int(percentage)}% der Tagesproduktion")
+    draw_bar_outline(draw, bar_bbox)
 
-    return img
+    return img, {"value_y": value_y, "bar_bbox": bar_bbox}
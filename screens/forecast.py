@@ -6,14 +6,19 @@ actual production vs forecast, and tomorrow's forecast with delta.
 """
 
 from datetime import datetime
-from PIL import Image, ImageDraw
+from PIL import Image
 from models import ForecastData
+from rendering.canvas import new_canvas
 from rendering.fonts import load_font
+from rendering.templates import get_template, measure_text
 
 # Unified layout constants (shared across all screens)
 MARGIN = 5
 CANVAS_W, CANVAS_H = 1000, 488
 
+# Bottom breakdown area: sticky to bottom
+BREAKDOWN_Y_START = CANVAS_H - MARGIN - 110
+
 
 def render_forecast_screen(data: ForecastData) -> Image:
     """
@@ -23,48 +28,21 @@ def render_forecast_screen(data: ForecastData) -> Image:
         data: ForecastData instance with forecast and actual production
 
     Returns:
-        1000x488 1-bit PIL Image ready for e-ink display
+        1-bit PIL Image at the render scale (1000x488 at 4x) ready for e-ink display
     """
-    img = Image.new('1', (CANVAS_W, CANVAS_H), 1)
-    draw = ImageDraw.Draw(img)
-
     # Fonts (unified across all screens)
-    label_font = load_font('Arial.ttf', 60)
     value_font = load_font('ArialBlack.ttf', 120)
     unit_font = load_font('Arial.ttf', 64)
     breakdown_value_font = load_font('Arial.ttf', 60)
     bar_font = load_font('Arial.ttf', 56)
     stale_font = load_font('Arial.ttf', 36)
 
-    # --- HEADLINE: top-left ---
-    label_text = "Prognose, heute"
-    draw.text((MARGIN, MARGIN), label_text, fill=0, font=label_font)
-    label_bbox = draw.textbbox((MARGIN, MARGIN), label_text, font=label_font)
-    label_bottom = label_bbox[3]
-
-    # --- BREAKDOWN: sticky to bottom ---
-    breakdown_y_start = CANVAS_H - MARGIN - 110
-
-    # --- VALUE+BAR GROUP: vertically centered between headline and breakdown ---
+    # The value height positions the value+bar group, so it keys the template
     value_text = f"{data.today_kwh:.1f}"
-    value_measure = draw.textbbox((0, 0), value_text, font=value_font)
-    value_h = value_measure[3]  # distance from draw position to visual bottom
-
-    bar_h = 40
-    gap_value_bar = 20
-    gap_bar_label = 5
-
-    # Bar label sizing — use fixed representative text for consistent group height
-    # (actual legend text computed later, matching how production.py uses "Eigenverbrauch 100%")
-    bar_label_text = "100% der Prognose erreicht"
-    bar_label_measure = draw.textbbox((0, 0), bar_label_text, font=bar_font)
-    bar_label_h = bar_label_measure[3]
-
-    group_h = value_h + gap_value_bar + bar_h + gap_bar_label + bar_label_h
-    available_top = label_bottom
-    available_bottom = breakdown_y_start
-    value_y = available_top + (available_bottom - available_top - group_h) // 2
+    value_h = measure_text((0, 0), value_text, value_font)[3]  # distance from draw position to visual bottom
+    img, draw, layout = get_template("Prognose", _build_template, value_h)
 
+    value_y = layout["value_y"]
     draw.text((MARGIN, value_y), value_text, fill=0, font=value_font)
     value_actual = draw.textbbox((MARGIN, value_y), value_text, font=value_font)
 
@@ -75,12 +53,9 @@ def render_forecast_screen(data: ForecastData) -> Image:
     unit_y = value_actual[3] - (unit_actual[3] - unit_actual[1])
     draw.text((unit_x, unit_y), unit_text, fill=0, font=unit_font)
 
-    # --- PROGRESS BAR: manual drawing for custom legend ---
-    bar_y = value_y + value_h + gap_value_bar
-    bar_x0, bar_x1 = MARGIN, CANVAS_W - MARGIN
-
-    # Draw outline
-    draw.rectangle((bar_x0, bar_y, bar_x1, bar_y + bar_h), outline=0, width=4)
+    # --- PROGRESS BAR: fill only, outline is part of the template ---
+    bar_x0, bar_y, bar_x1, bar_y1 = layout["bar_bbox"]
+    bar_h = bar_y1 - bar_y
 
     # Calculate fill
     if data.today_kwh > 0:
@@ -100,7 +75,7 @@ def render_forecast_screen(data: ForecastData) -> Image:
             draw.rectangle((notch_x0, notch_y0, notch_x1, notch_y1), fill=1, outline=0, width=2)
 
     # Bar legend below bar
-    legend_y = bar_y + bar_h + gap_bar_label
+    legend_y = bar_y + bar_h + layout["gap_bar_label"]
     if data.today_kwh > 0:
         legend_text = f"{int(percentage)}% der Prognose erreicht"
     else:
@@ -123,7 +98,7 @@ def render_forecast_screen(data: ForecastData) -> Image:
             tomorrow_width = tomorrow_bbox[2] - tomorrow_bbox[0]
             tomorrow_height = tomorrow_bbox[3] - tomorrow_bbox[1]
             tomorrow_x = (CANVAS_W - tomorrow_width) // 2
-            tomorrow_y = breakdown_y_start + (110 - tomorrow_height) // 2
+            tomorrow_y = BREAKDOWN_Y_START + (110 - tomorrow_height) // 2
             draw.text((tomorrow_x, tomorrow_y), tomorrow_text, fill=0, font=breakdown_value_font)
 
     # --- STALENESS INDICATOR: top-right if data > 2 hours old ---
@@ -136,3 +111,47 @@ def render_forecast_screen(data: ForecastData) -> Image:
         draw.text((stale_x, MARGIN), stale_text, fill=0, font=stale_font)
 
     return img
+
+
+def _build_template(value_h: int) -> tuple:
+    """
+    Draw the static parts of the Prognose screen and compute its layout.
+
+    Args:
+        value_h: Height of the big value text (from draw position to visual bottom)
+
+    Returns:
+        (image, layout) where layout holds value_y, bar_bbox and gap_bar_label
+    """
+    img, draw = new_canvas()
+
+    label_font = load_font('Arial.ttf', 60)
+    bar_font = load_font('Arial.ttf', 56)
+
+    # --- HEADLINE: top-left ---
+    label_text = "Prognose, heute"
+    draw.text((MARGIN, MARGIN), label_text, fill=0, font=label_font)
+    label_bbox = draw.textbbox((MARGIN, MARGIN), label_text, font=label_font)
+    label_bottom = label_bbox[3]
+
+    # --- VALUE+BAR GROUP: vertically centered between headline and breakdown ---
+    bar_h = 40
+    gap_value_bar = 20
+    gap_bar_label = 5
+
+    # Bar label sizing — use fixed representative text for consistent group height
+    # (actual legend text computed at render time, matching how production.py uses "Eigenverbrauch 100%")
+    bar_label_text = "100% der Prognose erreicht"
+    bar_label_measure = draw.textbbox((0, 0), bar_label_text, font=bar_font)
+    bar_label_h = bar_label_measure[3]
+
+    group_h = value_h + gap_value_bar + bar_h + gap_bar_label + bar_label_h
+    available_top = label_bottom
+    available_bottom = BREAKDOWN_Y_START
+    value_y = available_top + (available_bottom - available_top - group_h) // 2
+
+    bar_y = value_y + value_h + gap_value_bar
+    bar_bbox = (MARGIN, bar_y, CANVAS_W - MARGIN, bar_y + bar_h)
+    draw.rectangle(bar_bbox, outline=0, width=4)
+
+    return img, {"value_y": value_y, "bar_bbox": bar_bbox, "gap_bar_label": gap_bar_label}
@@ -5,9 +5,11 @@ Shows 14-day daily bar charts for production or consumption.
 Two public entry points share a single private renderer.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 from models import EnergyHistory
+from rendering.canvas import new_canvas
 from rendering.fonts import load_font
+from rendering.templates import get_template
 
 MARGIN = 5
 CANVAS_W, CANVAS_H = 1000, 488
@@ -29,9 +31,58 @@ def _render_history(data: EnergyHistory, values: list, label: str) -> Image:
         Sub-label "Letzte 2 Wochen" left + "max: X.X kWh" right (Arial 44)
         14 vertical bars proportional to max value
         Date labels (DD) below bars (Arial 36)
+
+    The headline, sub-label and bar geometry come from a cached template.
+    """
+    sub_font = load_font('Arial.ttf', 44)
+    date_font = load_font('Arial.ttf', 36)
+
+    num_bars = len(values)
+    img, draw, layout = get_template("history", _build_template, label, num_bars)
+
+    # --- SUB-LABEL: max value, right-aligned ---
+    max_val = max(values) if values else 0.0
+    max_text = f"max: {max_val:.1f} kWh"
+    max_bbox = draw.textbbox((0, 0), max_text, font=sub_font)
+    max_text_w = max_bbox[2] - max_bbox[0]
+    draw.text((CANVAS_W - MARGIN - max_text_w, layout["sub_y"]), max_text, fill=0, font=sub_font)
+
+    bar_bottom = layout["bar_bottom"]
+    bar_area_h = layout["bar_area_h"]
+    bar_width = layout["bar_width"]
+    gap = layout["gap"]
+    date_label_y = layout["date_label_y"]
+
+    for i, val in enumerate(values):
+        bar_x = MARGIN + i * (bar_width + gap)
+
+        # Draw bar (height proportional to max)
+        if val > 0 and max_val > 0:
+            bar_h = int((val / max_val) * bar_area_h)
+            bar_h = max(bar_h, 2)  # minimum visible height
+            draw.rectangle(
+                [bar_x, bar_bottom - bar_h, bar_x + bar_width, bar_bottom],
+                fill=0,
+            )
+
+        # Draw date label centered below bar
+        date_str = data.dates[i][-2:]  # DD from YYYY-MM-DD
+        date_bbox = draw.textbbox((0, 0), date_str, font=date_font)
+        date_w = date_bbox[2] - date_bbox[0]
+        date_x = bar_x + (bar_width - date_w) // 2
+        draw.text((date_x, date_label_y), date_str, fill=0, font=date_font)
+
+    return img
+
+
+def _build_template(label: str, num_bars: int) -> tuple:
+    """Draw the headline and sub-label and compute the bar geometry.
+
+    Returns:
+        (image, layout) where layout holds sub_y, date_label_y, bar_bottom,
+        bar_area_h, bar_width and gap
     """
-    img = Image.new('1', (CANVAS_W, CANVAS_H), 1)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas()
 
     headline_font = load_font('Arial.ttf', 60)
     sub_font = load_font('Arial.ttf', 44)
@@ -44,16 +95,9 @@ def _render_history(data: EnergyHistory, values: list, label: str) -> Image:
 
     # --- SUB-LABEL ---
     sub_y = headline_bottom + 8
-    max_val = max(values) if values else 0.0
-    max_text = f"max: {max_val:.1f} kWh"
     sub_label = "Letzte 2 Wochen"
-
     draw.text((MARGIN, sub_y), sub_label, fill=0, font=sub_font)
 
-    max_bbox = draw.textbbox((0, 0), max_text, font=sub_font)
-    max_text_w = max_bbox[2] - max_bbox[0]
-    draw.text((CANVAS_W - MARGIN - max_text_w, sub_y), max_text, fill=0, font=sub_font)
-
     sub_bbox = draw.textbbox((MARGIN, sub_y), sub_label, font=sub_font)
     sub_bottom = sub_bbox[3]
 
@@ -70,27 +114,15 @@ def _render_history(data: EnergyHistory, values: list, label: str) -> Image:
 
     # Bar geometry: 14 bars with 6px gaps
     content_width = CANVAS_W - 2 * MARGIN
-    num_bars = len(values)
     gap = 6
-    bar_width = (content_width - (num_bars - 1) * gap) // num_bars
-
-    for i, val in enumerate(values):
-        bar_x = MARGIN + i * (bar_width + gap)
-
-        # Draw bar (height proportional to max)
-        if val > 0 and max_val > 0:
-            bar_h = int((val / max_val) * bar_area_h)
-            bar_h = max(bar_h, 2)  # minimum visible height
-            draw.rectangle(
-                [bar_x, bar_bottom - bar_h, bar_x + bar_width, bar_bottom],
-                fill=0,
-            )
-
-        # Draw date label centered below bar
-        date_str = data.dates[i][-2:]  # DD from YYYY-MM-DD
-        date_bbox = draw.textbbox((0, 0), date_str, font=date_font)
-        date_w = date_bbox[2] - date_bbox[0]
-        date_x = bar_x + (bar_width - date_w) // 2
-        draw.text((date_x, date_label_y), date_str, fill=0, font=date_font)
-
-    return img
+    bar_width = (content_width - (num_bars - 1) * gap) // num_bars if num_bars else 0
+
+    layout = {
+        "sub_y": sub_y,
+        "date_label_y": date_label_y,
+        "bar_bottom": bar_bottom,
+        "bar_area_h": bar_area_h,
+        "bar_width": bar_width,
+        "gap": gap,
+    }
+    return img, layout
@@ -5,17 +5,25 @@ Shows total production with breakdown of where the energy went:
 - Eigenverbrauch (self-consumed)
 - In Akku (stored)
 - Ins Netz (fed to grid)
+
+Static parts (headline, column labels, bar outline) come from a cached
+template; each render only draws the values.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 from models import EnergyDetails
+from rendering.canvas import new_canvas
 from rendering.fonts import load_font
-from rendering.bars import draw_horizontal_bar
+from rendering.bars import draw_bar_outline, draw_bar_fill
+from rendering.templates import get_template, measure_text
 
 # Unified layout constants (shared across all screens)
 MARGIN = 5
 CANVAS_W, CANVAS_H = 1000, 488
 
+# Breakdown column labels, left to right
+COLUMN_LABELS = ("Verbraucht", "In Akku", "Ins Netz")
+
 
 def render_production_screen(data: EnergyDetails) -> Image:
     """
@@ -25,19 +33,66 @@ def render_production_screen(data: EnergyDetails) -> Image:
         data: EnergyDetails instance with energy data
 
     Returns:
-        1000x488 1-bit PIL Image ready for e-ink display
+        1-bit PIL Image at the render scale (1000x488 at 4x) ready for e-ink display
     """
-    img = Image.new('1', (CANVAS_W, CANVAS_H), 1)
-    draw = ImageDraw.Draw(img)
-
     # Fonts (unified across all screens)
-    label_font = load_font('Arial.ttf', 60)
     value_font = load_font('ArialBlack.ttf', 120)
     unit_font = load_font('Arial.ttf', 64)
-    breakdown_label_font = load_font('Arial.ttf', 52)
     breakdown_value_font = load_font('Arial.ttf', 60)
     bar_font = load_font('Arial.ttf', 56)
 
+    # The value height positions the value+bar group, so it keys the template
+    value_text = f"{data.production:.1f}"
+    value_h = measure_text((0, 0), value_text, value_font)[3]  # distance from draw position to visual bottom
+    img, draw, layout = get_template("Produktion", _build_template, value_h)
+
+    # --- VALUE + UNIT ---
+    value_y = layout["value_y"]
+    draw.text((MARGIN, value_y), value_text, fill=0, font=value_font)
+    value_actual = draw.textbbox((MARGIN, value_y), value_text, font=value_font)
+
+    unit_text = "kWh"
+    unit_x = value_actual[2] + 20
+    unit_actual = draw.textbbox((unit_x, value_y), unit_text, font=unit_font)
+    unit_y = value_actual[3] - (unit_actual[3] - unit_actual[1])
+    draw.text((unit_x, unit_y), unit_text, fill=0, font=unit_font)
+
+    # --- BAR ---
+    percentage = min(100.0, (data.self_consumption / data.production) * 100.0) if data.production > 0 else 0.0
+    draw_bar_fill(draw, layout["bar_bbox"], percentage, bar_font, label="Eigenverbrauch")
+
+    # --- 3-COLUMN BREAKDOWN VALUES ---
+    battery_energy = max(0.0, data.production - data.self_consumption - data.feed_in)
+    values = (
+        f"{data.self_consumption:.1f} kWh",  # Verbraucht
+        f"{battery_energy:.1f} kWh",  # In Akku
+        f"{data.feed_in:.1f} kWh",  # Ins Netz
+    )
+    for (col_x, value_y), value in zip(layout["columns"], values):
+        value_bbox = draw.textbbox((0, 0), value, font=breakdown_value_font)
+        value_width = value_bbox[2] - value_bbox[0]
+        draw.text((col_x - value_width // 2, value_y), value, fill=0, font=breakdown_value_font)
+
+    return img
+
+
+def _build_template(value_h: int) -> tuple:
+    """
+    Draw the static parts of the Produktion screen and compute its layout.
+
+    Args:
+        value_h: Height of the big value text (from draw position to visual bottom)
+
+    Returns:
+        (image, layout) where layout holds value_y, bar_bbox and per-column
+        (center x, value y) positions
+    """
+    img, draw = new_canvas()
+
+    label_font = load_font('Arial.ttf', 60)
+    breakdown_label_font = load_font('Arial.ttf', 52)
+    bar_font = load_font('Arial.ttf', 56)
+
     # --- HEADLINE: top-left ---
     label_text = "Produktion, heute"
     draw.text((MARGIN, MARGIN), label_text, fill=0, font=label_font)
@@ -49,10 +104,6 @@ def render_production_screen(data: EnergyDetails) -> Image:
     breakdown_y_start = CANVAS_H - MARGIN - 110
 
     # --- VALUE+BAR GROUP: vertically centered between headline and breakdown ---
-    value_text = f"{data.production:.1f}"
-    value_measure = draw.textbbox((0, 0), value_text, font=value_font)
-    value_h = value_measure[3]  # distance from draw position to visual bottom
-
     bar_h = 40
     gap_value_bar = 20
     gap_bar_label = 5
@@ -65,80 +116,24 @@ def render_production_screen(data: EnergyDetails) -> Image:
     available_bottom = breakdown_y_start
     value_y = available_top + (available_bottom - available_top - group_h) // 2
 
-    draw.text((MARGIN, value_y), value_text, fill=0, font=value_font)
-    value_actual = draw.textbbox((MARGIN, value_y), value_text, font=value_font)
-
-    unit_text = "kWh"
-    unit_x = value_actual[2] + 20
-    unit_actual = draw.textbbox((unit_x, value_y), unit_text, font=unit_font)
-    unit_y = value_actual[3] - (unit_actual[3] - unit_actual[1])
-    draw.text((unit_x, unit_y), unit_text, fill=0, font=unit_font)
-
     bar_y = value_y + value_h + gap_value_bar
     bar_bbox = (MARGIN, bar_y, CANVAS_W - MARGIN, bar_y + bar_h)
-    percentage = min(100.0, (data.self_consumption / data.production) * 100.0) if data.production > 0 else 0.0
-    draw_horizontal_bar(draw, bar_bbox, percentage, bar_font, label="Eigenverbrauch")
+    draw_bar_outline(draw, bar_bbox)
 
+    # --- 3-COLUMN BREAKDOWN LABELS: centered in each column ---
     content_width = CANVAS_W - 2 * MARGIN
     column_width = content_width // 3
 
-    battery_energy = max(0.0, data.production - data.self_consumption - data.feed_in)
+    columns = []
+    for i, label in enumerate(COLUMN_LABELS):
+        col_x = MARGIN + i * column_width + column_width // 2
 
-    # Column 1: "Eigenverbrauch" + self_consumption value
-    col1_x = MARGIN + column_width // 2
-
-    label1 = "Verbraucht"
-    label1_bbox = draw.textbbox((0, 0), label1, font=breakdown_label_font)
-    label1_width = label1_bbox[2] - label1_bbox[0]
-    label1_x = col1_x - label1_width // 2
-    draw.text((label1_x, breakdown_y_start), label1, fill=0, font=breakdown_label_font)
-
-    label1_measured = draw.textbbox((label1_x, breakdown_y_start), label1, font=breakdown_label_font)
-    label1_bottom = label1_measured[3]
-
-    value1 = f"{data.self_consumption:.1f} kWh"
-    value1_bbox = draw.textbbox((0, 0), value1, font=breakdown_value_font)
-    value1_width = value1_bbox[2] - value1_bbox[0]
-    value1_x = col1_x - value1_width // 2
-    value1_y = label1_bottom + 8
-    draw.text((value1_x, value1_y), value1, fill=0, font=breakdown_value_font)
-
-    # Column 2: "In Akku" + battery energy
-    col2_x = MARGIN + column_width + column_width // 2
-
-    label2 = "In Akku"
-    label2_bbox = draw.textbbox((0, 0), label2, font=breakdown_label_font)
-    label2_width = label2_bbox[2] - label2_bbox[0]
-    label2_x = col2_x - label2_width // 2
-    draw.text((label2_x, breakdown_y_start), label2, fill=0, font=breakdown_label_font)
-
-    label2_measured = draw.textbbox((label2_x, breakdown_y_start), label2, font=breakdown_label_font)
-    label2_bottom = label2_measured[3]
-
-    value2 = f"{battery_energy:.1f} kWh"
-    value2_bbox = draw.textbbox((0, 0), value2, font=breakdown_value_font)
-    value2_width = value2_bbox[2] - value2_bbox[0]
-    value2_x = col2_x - value2_width // 2
-    value2_y = label2_bottom + 8
-    draw.text((value2_x, value2_y), value2, fill=0, font=breakdown_value_font)
-
-    # Column 3: "Ins Netz" + feed_in value
-    col3_x = MARGIN + 2 * column_width + column_width // 2
-
-    label3 = "Ins Netz"
-    label3_bbox = draw.textbbox((0, 0), label3, font=breakdown_label_font)
-    label3_width = label3_bbox[2] - label3_bbox[0]
-    label3_x = col3_x - label3_width // 2
-    draw.text((label3_x, breakdown_y_start), label3, fill=0, font=breakdown_label_font)
-
-    label3_measured = draw.textbbox((label3_x, breakdown_y_start), label3, font=breakdown_label_font)
-    label3_bottom = label3_measured[3]
-
-    value3 = f"{data.feed_in:.1f} kWh"
-    value3_bbox = draw.textbbox((0, 0), value3, font=breakdown_value_font)
-    value3_width = value3_bbox[2] - value3_bbox[0]
-    value3_x = col3_x - value3_width // 2
-    value3_y = label3_bottom + 8
-    draw.text((value3_x, value3_y), value3, fill=0, font=breakdown_value_font)
+        label_bbox = draw.textbbox((0, 0), label, font=breakdown_label_font)
+        label_width = label_bbox[2] - label_bbox[0]
+        label_x = col_x - label_width // 2
+        draw.text((label_x, breakdown_y_start), label, fill=0, font=breakdown_label_font)
 
-    return img
+        label_measured = draw.textbbox((label_x, breakdown_y_start), label, font=breakdown_label_font)
+        columns.append((col_x, label_measured[3] + 8))
+
+    return img, {"value_y": value_y, "bar_bbox": bar_bbox, "columns": columns}
@@ -0,0 +1,98 @@
+"""
+Last data snapshot and displayed frame, kept for an instant startup.
+
+After a restart (or deploy.sh) the monitor would otherwise clear the panel
+and show nothing until the battery check and a full poll have finished.
+Instead the last successful DataSnapshot and the packed framebuffer of the
+first screen in the rotation are written to the state directory; at boot
+the frame goes straight to the panel and the snapshot seeds the fetcher,
+whose first poll then refreshes everything in the background.
+
+Only state saved on the same local day (TIMEZONE) is restored: yesterday's
+totals would be wrong for today.
+
+frame.bin holds a one-line JSON header (screen name, frame size, save time)
+followed by the packed framebuffer, so frame and metadata are replaced by a
+single atomic rename.
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from config import TIMEZONE
+from models import DataSnapshot
+from persistence import load_bytes, load_json, save_bytes, save_json
+
+
+class SnapshotStore:
+    """Persists the latest snapshot and frame (state/snapshot.json, state/frame.bin).
+
+    Attributes:
+        state_dir: State directory
+    """
+
+    def __init__(self, state_dir):
+        """Create the store.
+
+        Args:
+            state_dir: Directory for the state files
+        """
+        self.state_dir = Path(state_dir)
+        self._snapshot_path = self.state_dir / "snapshot.json"
+        self._frame_path = self.state_dir / "frame.bin"
+        self._saved_snapshot = None
+        self._saved_frame = None
+
+    def save_snapshot(self, snapshot: DataSnapshot) -> None:
+        """Persist a successful snapshot (failed or already saved ones are skipped)."""
+        if snapshot is self._saved_snapshot or snapshot.energy is None or snapshot.consecutive_failures:
+            return
+        if save_json(self._snapshot_path, snapshot.to_dict()):
+            self._saved_snapshot = snapshot
+
+    def load_snapshot(self, today: date) -> Optional[DataSnapshot]:
+        """Return the persisted snapshot if it was saved today, else None."""
+        data = load_json(self._snapshot_path)
+        if data is None:
+            return None
+        try:
+            snapshot = DataSnapshot.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Ignoring invalid snapshot state: {e}")
+            return None
+        # fetched_at is naive system local time
+        if snapshot.fetched_at.astimezone(ZoneInfo(TIMEZONE)).date() != today:
+            return None
+        return snapshot
+
+    def save_frame(self, name: str, frame: bytes) -> None:
+        """Persist a packed framebuffer shown on the panel (skipped if unchanged)."""
+        frame = bytes(frame)
+        if frame == self._saved_frame:
+            return
+        header = json.dumps({
+            "name": name,
+            "size": len(frame),
+            "saved_at": datetime.now(ZoneInfo(TIMEZONE)).isoformat(),
+        }).encode()
+        if save_bytes(self._frame_path, header + b"\n" + frame):
+            self._saved_frame = frame
+
+    def load_frame(self, today: date) -> Optional[Tuple[str, bytes]]:
+        """Return (screen name, packed frame) if saved today and intact, else None."""
+        data = load_bytes(self._frame_path)
+        if data is None:
+            return None
+        header, _, frame = data.partition(b"\n")
+        try:
+            meta = json.loads(header)
+            saved_at = datetime.fromisoformat(meta["saved_at"]).astimezone(ZoneInfo(TIMEZONE))
+            if saved_at.date() != today or len(frame) != meta["size"]:
+                return None
+            return str(meta["name"]), frame
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
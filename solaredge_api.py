@@ -6,18 +6,45 @@ and handled gracefully by returning None, allowing the application to continue
 with stale data rather than crashing.
 
 The client uses exponential backoff (2s, 4s, 8s) for transient failures and
-includes a 10-second timeout per request.
+includes a 10-second timeout per request. Every call takes an optional
+Deadline: timeouts and retries are cut short so a whole poll finishes within
+its time budget, and a cancelled deadline (shutdown) stops further attempts.
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
+from circuit_breaker import CircuitBreaker
+from deadline import Deadline
+from history_cache import HistoryCache
+from quota import QuotaManager
+from response_cache import FRESH, STALE, ResponseCache, endpoint_name
 from models import PowerFlow, EnergyDetails, EnergyHistory, SiteOverview
 
+# Retries per request after the first attempt (each one costs quota)
+MAX_RETRIES = 3
+
+# Backoff before retry n is RETRY_BACKOFF * 2**(n-1): 2s, 4s, 8s
+RETRY_BACKOFF = 2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Per-attempt timeout, and the least time worth starting an attempt with
+REQUEST_TIMEOUT = 10
+MIN_ATTEMPT_TIMEOUT = 1
+
+# Budget for calls made without a deadline (e.g. the startup inventory check):
+# enough for all attempts and backoffs
+DEFAULT_DEADLINE_SECONDS = (1 + MAX_RETRIES) * REQUEST_TIMEOUT + 14
+
+# Cheap endpoint used to probe the API while the circuit breaker is open
+PROBE_ENDPOINT = "/version/current"
+PROBE_TIMEOUT = 5
+
+# Meters requested for today's energy totals
+ENERGY_METERS = "Purchased,FeedIn,Production,SelfConsumption,Consumption"
+
 
 class SolarEdgeAPI:
     """Client for SolarEdge Monitoring API with automatic retry.
@@ -29,78 +56,221 @@ class SolarEdgeAPI:
         api_key: SolarEdge API key for authentication
         site_id: Site identifier for API requests
         base_url: Base URL for the SolarEdge Monitoring API
-        session: Requests session configured with retry logic
+        session: Requests session (connection pooling), created on first use
+        history_cache: Persistent cache of finished history days, or None
+        quota: Daily request ledger, or None
+        cache: Persistent response cache, or None
+        breaker: Circuit breaker failing requests fast during outages
     """
 
-    def __init__(self, api_key: str, site_id: str):
+    def __init__(self, api_key: str, site_id: str, history_cache: Optional[HistoryCache] = None,
+                 quota: Optional[QuotaManager] = None, cache: Optional[ResponseCache] = None):
         """Initialize API client with retry configuration.
 
         Args:
             api_key: SolarEdge API key
             site_id: Site identifier
+            history_cache: Optional persistent cache of finished days; when
+                set, get_energy_summary() only fetches days it is missing
+            quota: Optional request ledger; every HTTP attempt (including
+                retries) is counted against the daily quota
+            cache: Optional persistent response cache with per-endpoint TTLs
         """
         self.api_key = api_key
         self.site_id = site_id
+        self.history_cache = history_cache
+        self.quota = quota
+        self.cache = cache
         self.base_url = "https://monitoringapi.solaredge.com"
+        self.breaker = CircuitBreaker()
+
+        # Created on first request: importing requests (urllib3, certifi,
+        # charset_normalizer) is the largest part of startup, and a restart
+        # is usually served from the response cache
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Requests session, created on first use (retries are done by _request itself)."""
+        # The first poll's parallel requests and background revalidations can
+        # get here at the same time: create exactly one session
+        with self._session_lock:
+            if self._session is None:
+                import requests
+
+                self._session = requests.Session()
+            return self._session
+
+    def _request(self, endpoint: str, params: dict = None, deadline: Optional[Deadline] = None,
+                 use_cache: bool = True) -> Optional[dict]:
+        """Return an endpoint's response from the response cache or the network.
+
+        A fresh cached response is returned without a request. A stale one
+        (within its endpoint's stale-while-revalidate window) is returned
+        immediately while a background thread refreshes it.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/site/123/overview")
+            params: Additional query parameters (api_key added automatically)
+            deadline: Time budget for all attempts (default: enough for all retries)
+            use_cache: Set False to always go to the network (the response is
+                still stored for later cached calls)
 
-        # Configure retry: 3 attempts, exponential backoff (2s, 4s, 8s)
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
-
-        # Create session with retry adapter
-        self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-
-    def _request(self, endpoint: str, params: dict = None) -> Optional[dict]:
+        Returns:
+            dict: JSON response on success
+            None: On failure (see _fetch)
+        """
+        if self.cache is None or not self.cache.cacheable(endpoint):
+            return self._fetch(endpoint, params, deadline)
+
+        key = self.cache.key(endpoint, params)
+        if use_cache:
+            data, status = self.cache.get(endpoint, key)
+            if status == FRESH:
+                logging.debug(f"Response cache HIT: {endpoint}")
+                return data
+            if status == STALE:
+                logging.debug(f"Response cache STALE, revalidating: {endpoint}")
+                self._revalidate(endpoint, params, key)
+                return data
+
+        data = self._fetch(endpoint, params, deadline)
+        if data is not None:
+            self.cache.put(endpoint, key, data)
+        return data
+
+    def _revalidate(self, endpoint: str, params: Optional[dict], key: str) -> None:
+        """Refresh a stale cache entry in a background thread (one per key)."""
+        if not self.cache.start_revalidation(key):
+            return
+
+        def refresh():
+            try:
+                data = self._fetch(endpoint, dict(params or {}), None)
+                if data is not None:
+                    self.cache.put(endpoint, key, data)
+            finally:
+                self.cache.end_revalidation(key)
+
+        threading.Thread(target=refresh, name="revalidate", daemon=True).start()
+
+    def _fetch(self, endpoint: str, params: dict = None, deadline: Optional[Deadline] = None) -> Optional[dict]:
         """Execute API request with retry and error handling.
 
         Logs errors internally and returns None on failure, allowing the caller
-        to continue with stale data or handle the failure gracefully.
+        to continue with stale data or handle the failure gracefully. While the
+        circuit breaker is open the request fails fast without network traffic.
+
+        Transient failures (timeouts, connection errors, 429/5xx) are retried
+        with exponential backoff while the deadline leaves room for the wait
+        plus another attempt; each attempt's timeout is capped at the time left.
 
         Args:
             endpoint: API endpoint path (e.g., "/site/123/overview")
             params: Additional query parameters (api_key added automatically)
+            deadline: Time budget for all attempts (default: enough for all retries)
 
         Returns:
             dict: JSON response on success
-            None: On complete failure after retries
+            None: On complete failure after retries, deadline, or circuit open
         """
+        if not self.breaker.allow_request(self._probe):
+            logging.debug(f"Circuit open, skipping request: {endpoint}")
+            return None
+
+        import requests  # Deferred: see __init__
+
+        deadline = deadline or Deadline(DEFAULT_DEADLINE_SECONDS)
         url = f"{self.base_url}{endpoint}"
         params = params or {}
         params["api_key"] = self.api_key
 
+        attempts = 0
+        failed = True
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.Timeout:
-            logging.error(f"API timeout after 10s: {endpoint}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            logging.error(f"API HTTP error {e.response.status_code}: {endpoint}")
-            return None
+            while True:
+                timeout = deadline.timeout(REQUEST_TIMEOUT)
+                if timeout < MIN_ATTEMPT_TIMEOUT:
+                    reason = "cancelled" if deadline.cancelled else "deadline reached"
+                    logging.error(f"API request {reason} after {attempts} attempts: {endpoint}")
+                    return None
+
+                attempts += 1
+                retry_after = None
+                try:
+                    response = self.session.get(url, params=params, timeout=timeout)
+                    if response.status_code not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        data = response.json()
+                        failed = False
+                        return data
+                    logging.warning(f"API HTTP error {response.status_code} (attempt {attempts}): {endpoint}")
+                    retry_after = _retry_after_seconds(response)
+                except requests.exceptions.HTTPError as e:
+                    # Client errors (bad key, bad request) mean the API itself is up
+                    failed = False
+                    logging.error(f"API HTTP error {e.response.status_code}: {endpoint}")
+                    return None
+                except requests.exceptions.Timeout:
+                    logging.warning(f"API timeout after {timeout:.0f}s (attempt {attempts}): {endpoint}")
+                except requests.exceptions.ConnectionError as e:
+                    logging.warning(f"API connection failed (attempt {attempts}): {endpoint} - {e}")
+                except requests.exceptions.RequestException as e:
+                    logging.error(f"API request failed: {endpoint} - {e}")
+                    return None
+
+                if attempts > MAX_RETRIES:
+                    logging.error(f"API retries exhausted after {attempts} attempts: {endpoint}")
+                    return None
+
+                backoff = max(RETRY_BACKOFF * 2 ** (attempts - 1), retry_after or 0)
+                if deadline.remaining() < backoff + MIN_ATTEMPT_TIMEOUT:
+                    logging.error(f"API request gave up, no time left for retry {attempts}: {endpoint}")
+                    return None
+                if not deadline.sleep(backoff):
+                    logging.info(f"API request cancelled during backoff: {endpoint}")
+                    return None
+        finally:
+            if attempts:
+                if failed:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+                if self.quota is not None:
+                    self.quota.record(endpoint_name(endpoint), attempts)
+
+    def _probe(self) -> bool:
+        """Send one cheap request without retries to test if the API is back."""
+        import requests
+
+        try:
+            response = requests.get(
+                f"{self.base_url}{PROBE_ENDPOINT}", params={"api_key": self.api_key}, timeout=PROBE_TIMEOUT
+            )
+            return response.status_code < 500 and response.status_code != 429
         except requests.exceptions.RequestException as e:
-            logging.error(f"API request failed: {endpoint} - {e}")
-            return None
+            logging.info(f"API probe failed: {e}")
+            return False
+        finally:
+            if self.quota is not None:
+                self.quota.record(endpoint_name(PROBE_ENDPOINT))
 
-    def get_current_power_flow(self) -> Optional[PowerFlow]:
+    def get_current_power_flow(self, deadline: Optional[Deadline] = None) -> Optional[PowerFlow]:
         """Fetch current power flow between system elements.
 
         Retrieves real-time power measurements showing energy flow between
         the grid, PV panels, battery, and load.
 
+        Args:
+            deadline: Poll time budget shared with other requests (optional)
+
         Returns:
             PowerFlow: Current system state with power values in kW
             None: If API request fails after retries
         """
         endpoint = f"/site/{self.site_id}/currentPowerFlow"
-        data = self._request(endpoint)
+        data = self._request(endpoint, deadline=deadline)
 
         if data is None:
             logging.warning("Failed to fetch power flow")
@@ -129,12 +299,15 @@ class SolarEdgeAPI:
             logging.error(f"Failed to parse power flow response: {e}")
             return None
 
-    def get_energy_details(self) -> Optional[EnergyDetails]:
+    def get_energy_details(self, deadline: Optional[Deadline] = None) -> Optional[EnergyDetails]:
         """Fetch today's cumulative energy data.
 
         Retrieves aggregated energy measurements for the current day, including
         production, consumption, and grid interactions.
 
+        Args:
+            deadline: Poll time budget shared with other requests (optional)
+
         Returns:
             EnergyDetails: Today's energy totals in kWh
             None: If API request fails after retries
@@ -144,12 +317,12 @@ class SolarEdgeAPI:
         # Query today's data with all relevant meters
         today = datetime.now().strftime("%Y-%m-%d")
         params = {
-            "meters": "Purchased,FeedIn,Production,SelfConsumption,Consumption",
+            "meters": ENERGY_METERS,
             "startTime": f"{today} 00:00:00",
             "endTime": f"{today} 23:59:59"
         }
 
-        data = self._request(endpoint, params)
+        data = self._request(endpoint, params, deadline=deadline)
 
         if data is None:
             logging.warning("Failed to fetch energy details")
@@ -158,54 +331,43 @@ class SolarEdgeAPI:
         try:
             meters = data["energyDetails"]["meters"]
 
-            # Extract values by meter type and convert Wh to kWh
-            production = 0.0
-            self_consumption = 0.0
-            feed_in = 0.0
-            consumption = 0.0
-            purchased = 0.0
-
-            for meter in meters:
-                meter_type = meter.get("type", "")
-                values = meter.get("values", [])
-                # Sum all values for the day and convert Wh to kWh
-                total_wh = sum(v.get("value", 0) for v in values if v.get("value") is not None)
-                total_kwh = total_wh / 1000.0
-
-                if meter_type == "Production":
-                    production = total_kwh
-                elif meter_type == "SelfConsumption":
-                    self_consumption = total_kwh
-                elif meter_type == "FeedIn":
-                    feed_in = total_kwh
-                elif meter_type == "Consumption":
-                    consumption = total_kwh
-                elif meter_type == "Purchased":
-                    purchased = total_kwh
+            # Sum all values for the day and convert Wh to kWh
+            totals_kwh = {
+                meter.get("type", ""): sum(
+                    v.get("value", 0) for v in meter.get("values", []) if v.get("value") is not None
+                ) / 1000.0
+                for meter in meters
+            }
 
             return EnergyDetails(
-                production=production,
-                self_consumption=self_consumption,
-                feed_in=feed_in,
-                consumption=consumption,
-                purchased=purchased
+                production=totals_kwh.get("Production", 0.0),
+                self_consumption=totals_kwh.get("SelfConsumption", 0.0),
+                feed_in=totals_kwh.get("FeedIn", 0.0),
+                consumption=totals_kwh.get("Consumption", 0.0),
+                purchased=totals_kwh.get("Purchased", 0.0)
             )
         except (KeyError, ValueError, TypeError) as e:
             logging.error(f"Failed to parse energy details response: {e}")
             return None
 
-    def get_site_overview(self) -> Optional[SiteOverview]:
+    def get_site_overview(self, deadline: Optional[Deadline] = None, use_cache: bool = True) -> Optional[SiteOverview]:
         """Fetch site overview with historical data.
 
         Retrieves aggregate energy production statistics over various time periods,
-        from a single day to the lifetime of the installation.
+        from a single day to the lifetime of the installation. Its
+        lastUpdateTime tells when the inverter last uploaded data, which the
+        fetcher uses to skip polls that would return nothing new.
+
+        Args:
+            deadline: Poll time budget shared with other requests (optional)
+            use_cache: Set False to bypass the response cache (freshness checks)
 
         Returns:
             SiteOverview: Historical energy production data
             None: If API request fails after retries
         """
         endpoint = f"/site/{self.site_id}/overview"
-        data = self._request(endpoint)
+        data = self._request(endpoint, deadline=deadline, use_cache=use_cache)
 
         if data is None:
             logging.warning("Failed to fetch site overview")
@@ -225,16 +387,19 @@ class SolarEdgeAPI:
             logging.error(f"Failed to parse site overview response: {e}")
             return None
 
-    def has_battery(self) -> bool:
+    def has_battery(self, deadline: Optional[Deadline] = None) -> bool:
         """Check if site has a battery via inventory API.
 
         Called once at startup to determine whether to show the Akku screen.
 
+        Args:
+            deadline: Poll time budget shared with other requests (optional)
+
         Returns:
             True if site has at least one battery, False otherwise
         """
         endpoint = f"/site/{self.site_id}/inventory"
-        data = self._request(endpoint)
+        data = self._request(endpoint, deadline=deadline)
 
         if data is None:
             logging.warning("Failed to fetch inventory, assuming no battery")
@@ -247,7 +412,7 @@ class SolarEdgeAPI:
             logging.error(f"Failed to parse inventory response: {e}")
             return False
 
-    def get_energy_history(self, days: int = 14) -> Optional[EnergyHistory]:
+    def get_energy_history(self, days: int = 14, deadline: Optional[Deadline] = None) -> Optional[EnergyHistory]:
         """Fetch daily energy history for histogram screens.
 
         Calls /energyDetails with timeUnit=DAY over a 14-day range.
@@ -255,6 +420,7 @@ class SolarEdgeAPI:
 
         Args:
             days: Number of days of history (default 14)
+            deadline: Poll time budget shared with other requests (optional)
 
         Returns:
             EnergyHistory with daily values, or None on failure
@@ -270,7 +436,7 @@ class SolarEdgeAPI:
             "endTime": today.strftime("%Y-%m-%d 23:59:59"),
         }
 
-        data = self._request(endpoint, params)
+        data = self._request(endpoint, params, deadline=deadline)
 
         if data is None:
             logging.warning("Failed to fetch energy history")
@@ -316,12 +482,98 @@ class SolarEdgeAPI:
             logging.error(f"Failed to parse energy history response: {e}")
             return None
 
-    def get_storage_data(self) -> Optional[dict]:
+    def get_energy_summary(self, days: int = 14, deadline: Optional[Deadline] = None) -> Optional[tuple]:
+        """Fetch today's energy totals and the daily history in one request.
+
+        Calls /energyDetails once with timeUnit=DAY for all five meters. Today's
+        EnergyDetails come from the bucket for today, EnergyHistory from the
+        Production and Consumption buckets. This replaces separate
+        get_energy_details() and get_energy_history() calls, halving the
+        requests to the most quota-heavy endpoint.
+
+        With a history cache, only today and the days missing from the cache
+        are requested (usually just today), so the per-poll cost does not grow
+        with the window; the full history is rebuilt from the cache.
+
+        Args:
+            days: Number of days of history, including today (default 14)
+            deadline: Poll time budget shared with other requests (optional)
+
+        Returns:
+            (EnergyDetails, EnergyHistory) tuple, or None on failure
+        """
+        endpoint = f"/site/{self.site_id}/energyDetails"
+
+        now = datetime.now()
+        today = now.date()
+        if self.history_cache is not None:
+            start = self.history_cache.fetch_start(today, days)
+        else:
+            start = today - timedelta(days=days - 1)
+        params = {
+            "meters": ENERGY_METERS,
+            "timeUnit": "DAY",
+            "startTime": start.strftime("%Y-%m-%d 00:00:00"),
+            "endTime": today.strftime("%Y-%m-%d 23:59:59"),
+        }
+
+        data = self._request(endpoint, params, deadline=deadline)
+
+        if data is None:
+            logging.warning("Failed to fetch energy summary")
+            return None
+
+        try:
+            meters = data["energyDetails"]["meters"]
+
+            # Build date-indexed maps (kWh) for each meter type
+            by_type = {}
+            for meter in meters:
+                by_date = by_type.setdefault(meter.get("type", ""), {})
+                for entry in meter.get("values", []):
+                    date_str = entry.get("date", "")[:10]  # "YYYY-MM-DD"
+                    value_wh = entry.get("value")
+                    by_date[date_str] = (value_wh or 0) / 1000.0
+
+            today_str = today.strftime("%Y-%m-%d")
+
+            def today_kwh(meter_type: str) -> float:
+                return by_type.get(meter_type, {}).get(today_str, 0.0)
+
+            energy = EnergyDetails(
+                production=today_kwh("Production"),
+                self_consumption=today_kwh("SelfConsumption"),
+                feed_in=today_kwh("FeedIn"),
+                consumption=today_kwh("Consumption"),
+                purchased=today_kwh("Purchased"),
+            )
+
+            production_by_date = by_type.get("Production", {})
+            consumption_by_date = by_type.get("Consumption", {})
+            if self.history_cache is not None:
+                self.history_cache.update(production_by_date, consumption_by_date, now)
+                history = self.history_cache.build(today, days)
+            else:
+                dates = [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+                history = EnergyHistory(
+                    dates=dates,
+                    production=[production_by_date.get(d, 0.0) for d in dates],
+                    consumption=[consumption_by_date.get(d, 0.0) for d in dates],
+                )
+            return energy, history
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            logging.error(f"Failed to parse energy summary response: {e}")
+            return None
+
+    def get_storage_data(self, deadline: Optional[Deadline] = None) -> Optional[dict]:
         """Fetch latest battery telemetry from storageData API.
 
         Queries the last 2 hours to ensure we get at least one data point.
         Returns the most recent telemetry entry.
 
+        Args:
+            deadline: Poll time budget shared with other requests (optional)
+
         Returns:
             dict with internal_temp (°C), available_energy (kWh), power (kW)
             None on failure or no data
@@ -335,7 +587,7 @@ class SolarEdgeAPI:
             "endTime": now.strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        data = self._request(endpoint, params)
+        data = self._request(endpoint, params, deadline=deadline)
 
         if data is None:
             logging.warning("Failed to fetch storage data")
@@ -362,3 +614,11 @@ class SolarEdgeAPI:
         except (KeyError, ValueError, TypeError, IndexError) as e:
             logging.error(f"Failed to parse storage data response: {e}")
             return None
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header (429/503), or None."""
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
@@ -0,0 +1,147 @@
+"""
+Offline sunrise and sunset times for the sun-based sleep window.
+
+Uses the NOAA general solar position equations (fractional year, equation
+of time, declination), refined once at the event time, which is accurate
+to about a minute between the polar circles. No network access or extra
+dependency is needed.
+
+Print a location's times (e.g. to pick the offsets):
+    python3 sun.py --lat 48.14 --lon 11.58
+    python3 sun.py --lat 48.14 --lon 11.58 --year 2026
+"""
+
+import argparse
+import calendar
+import math
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Tuple
+from zoneinfo import ZoneInfo
+
+# Sun center 50' below the horizon: refraction plus the sun's radius
+SUNRISE_ZENITH = 90.833
+
+
+def _solar_terms(day: date, minutes_utc: float) -> Tuple[float, float]:
+    """Equation of time (minutes) and declination (radians) at a time of day."""
+    days_in_year = 366 if calendar.isleap(day.year) else 365
+    gamma = 2 * math.pi / days_in_year * (day.timetuple().tm_yday - 1 + (minutes_utc / 60 - 12) / 24)
+    eqtime = 229.18 * (
+        0.000075 + 0.001868 * math.cos(gamma) - 0.032077 * math.sin(gamma)
+        - 0.014615 * math.cos(2 * gamma) - 0.040849 * math.sin(2 * gamma)
+    )
+    decl = (
+        0.006918 - 0.399912 * math.cos(gamma) + 0.070257 * math.sin(gamma)
+        - 0.006758 * math.cos(2 * gamma) + 0.000907 * math.sin(2 * gamma)
+        - 0.002697 * math.cos(3 * gamma) + 0.00148 * math.sin(3 * gamma)
+    )
+    return eqtime, decl
+
+
+def _cos_hour_angle(lat: float, decl: float) -> float:
+    """Cosine of the sunrise hour angle (<= -1: sun never sets, >= 1: never rises)."""
+    return (
+        math.cos(math.radians(SUNRISE_ZENITH)) / (math.cos(math.radians(lat)) * math.cos(decl))
+        - math.tan(math.radians(lat)) * math.tan(decl)
+    )
+
+
+def _event_minutes(day: date, lat: float, lon: float, rising: bool) -> float:
+    """Sunrise or sunset in minutes after the day's 00:00 UTC (may be < 0 or > 1440)."""
+    minutes = 720 - 4 * lon  # Start from solar noon
+    for _ in range(2):  # Second pass evaluates the terms at the event itself
+        eqtime, decl = _solar_terms(day, minutes)
+        # Polar day: sun never sets (ha = 180); polar night: never rises (ha = 0)
+        ha = math.degrees(math.acos(min(1.0, max(-1.0, _cos_hour_angle(lat, decl)))))
+        minutes = 720 - 4 * (lon + ha if rising else lon - ha) - eqtime
+    return minutes
+
+
+def _noon_cos_hour_angle(day: date, lat: float, lon: float) -> float:
+    _, decl = _solar_terms(day, 720 - 4 * lon)
+    return _cos_hour_angle(lat, decl)
+
+
+def is_polar_day(day: date, lat: float, lon: float) -> bool:
+    """Return True if the sun does not set on a date (midnight sun)."""
+    return _noon_cos_hour_angle(day, lat, lon) <= -1
+
+
+def is_polar_night(day: date, lat: float, lon: float) -> bool:
+    """Return True if the sun does not rise on a date."""
+    return _noon_cos_hour_angle(day, lat, lon) >= 1
+
+
+def sun_times(day: date, lat: float, lon: float) -> Tuple[datetime, datetime]:
+    """
+    Sunrise and sunset on a date.
+
+    Args:
+        day: Local date
+        lat: Latitude in degrees (north positive)
+        lon: Longitude in degrees (east positive)
+
+    Returns:
+        (sunrise, sunset) as aware UTC datetimes. During polar day both
+        are solar midnight, 24 hours apart (see is_polar_day()); during
+        polar night both are solar noon (an empty window).
+    """
+    midnight = datetime.combine(day, time(0), tzinfo=timezone.utc)
+    sunrise = midnight + timedelta(minutes=_event_minutes(day, lat, lon, rising=True))
+    sunset = midnight + timedelta(minutes=_event_minutes(day, lat, lon, rising=False))
+    return sunrise, sunset
+
+
+def is_daylight(now: datetime, lat: float, lon: float,
+                sunrise_offset_minutes: int = 0, sunset_offset_minutes: int = 0) -> bool:
+    """
+    Return True if now is inside the day's (shifted) sunrise-sunset window.
+
+    During polar day it is always daylight: the window would otherwise start
+    at solar midnight, which falls after local midnight at most longitudes.
+    During polar night it never is, whatever the offsets.
+
+    Args:
+        now: Aware local datetime (its date selects the day)
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        sunrise_offset_minutes: Shift of the window start (negative = earlier)
+        sunset_offset_minutes: Shift of the window end (positive = later)
+    """
+    if is_polar_day(now.date(), lat, lon):
+        return True
+    if is_polar_night(now.date(), lat, lon):
+        return False
+    sunrise, sunset = sun_times(now.date(), lat, lon)
+    start = sunrise + timedelta(minutes=sunrise_offset_minutes)
+    end = sunset + timedelta(minutes=sunset_offset_minutes)
+    return start <= now < end
+
+
+def main(argv=None) -> int:
+    """CLI: print sunrise and sunset for a date, or the first of each month of a year."""
+    from config import TIMEZONE
+
+    parser = argparse.ArgumentParser(description="Print offline sunrise/sunset times")
+    parser.add_argument("--lat", type=float, required=True, help="Latitude in degrees")
+    parser.add_argument("--lon", type=float, required=True, help="Longitude in degrees")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="Date (YYYY-MM-DD, default: today)")
+    parser.add_argument("--year", type=int, default=None, help="Print the first day of each month of this year")
+    args = parser.parse_args(argv)
+
+    tz = ZoneInfo(TIMEZONE)
+    if args.year is not None:
+        days = [date(args.year, month, 1) for month in range(1, 13)]
+    else:
+        days = [args.date or datetime.now(tz).date()]
+
+    for day in days:
+        sunrise, sunset = sun_times(day, args.lat, args.lon)
+        length = (sunset - sunrise).total_seconds() / 3600
+        print(f"{day}  sunrise {sunrise.astimezone(tz):%H:%M}  sunset {sunset.astimezone(tz):%H:%M}  "
+              f"({length:.1f} h, {TIMEZONE})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
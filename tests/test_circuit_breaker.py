@@ -0,0 +1,101 @@
+"""Circuit breaker: closed -> open -> half-open transitions and cool-down doubling."""
+
+import pytest
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_fails_fast_during_cooldown_without_probing(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    probes = []
+    clock.now += 59
+    assert not breaker.allow_request(lambda: probes.append(1) or True)
+    assert probes == []
+    assert breaker.state == OPEN
+
+
+def test_successful_probe_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    clock.now += 60
+    assert breaker.allow_request(lambda: True)
+    assert breaker.state == CLOSED
+    assert breaker.allow_request(lambda: pytest.fail("closed breaker must not probe"))
+
+
+def test_concurrent_callers_fail_fast_while_half_open(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    clock.now += 60
+
+    def probe():
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow_request(lambda: pytest.fail("second probe while half-open"))
+        return True
+
+    assert breaker.allow_request(probe)
+
+
+def test_failed_probe_doubles_cooldown_up_to_max(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60, max_cooldown_seconds=200)
+    breaker.record_failure()
+    clock.now += 60
+    for cooldown in (120, 200, 200):
+        assert not breaker.allow_request(lambda: False)
+        assert breaker.state == OPEN
+        clock.now += cooldown - 1
+        assert not breaker.allow_request(lambda: pytest.fail("probed before the cool-down ended"))
+        clock.now += 1
+
+
+def test_close_resets_cooldown(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    clock.now += 60
+    breaker.allow_request(lambda: False)  # cool-down now 120 s
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    open_breaker(breaker)
+    clock.now += 60
+    assert breaker.allow_request(lambda: True)
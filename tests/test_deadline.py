@@ -0,0 +1,68 @@
+"""Deadline: timeout clamping, expiry and cancellation."""
+
+import threading
+import time
+
+import pytest
+
+import deadline as deadline_module
+from deadline import Deadline
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 500.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(deadline_module, "time", fake)
+    return fake
+
+
+def test_timeout_is_capped_then_shortened_to_time_left(clock):
+    deadline = Deadline(45)
+    assert deadline.timeout(10) == 10
+    clock.now += 40
+    assert deadline.timeout(10) == pytest.approx(5)
+    clock.now += 5
+    assert deadline.timeout(10) == 0
+
+
+def test_remaining_never_goes_negative(clock):
+    deadline = Deadline(10)
+    clock.now += 30
+    assert deadline.remaining() == 0
+    assert deadline.expired
+
+
+def test_cancel_expires_immediately(clock):
+    cancel = threading.Event()
+    deadline = Deadline(45, cancel=cancel)
+    assert not deadline.expired and not deadline.cancelled
+    cancel.set()
+    assert deadline.cancelled
+    assert deadline.expired
+    assert deadline.timeout(10) == 0
+
+
+def test_sleep_returns_early_when_cancelled():
+    cancel = threading.Event()
+    cancel.set()
+    start = time.monotonic()
+    assert Deadline(45, cancel=cancel).sleep(5) is False
+    assert time.monotonic() - start < 1
+
+
+def test_sleep_never_waits_past_the_deadline():
+    start = time.monotonic()
+    assert Deadline(0.05).sleep(5) is False
+    assert time.monotonic() - start < 1
+
+
+def test_sleep_within_the_deadline_completes():
+    assert Deadline(5).sleep(0.01) is True
@@ -0,0 +1,73 @@
+"""Quota planner: interval stretching and the dry-run budget bisection."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from config import TIMEZONE, is_sleep_hour
+from quota import QuotaManager, estimate_daily_calls, interval_within_budget
+
+
+def night(hour):
+    return is_sleep_hour(hour, 0, 6)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    def make(now, used=0, calls_per_poll=3.0, budget=280):
+        quota = QuotaManager(tmp_path / "quota.json", daily_budget=budget, sleeping=night)
+        monkeypatch.setattr(quota, "_now", lambda: now)
+        quota._day = quota._today()
+        quota.calls_per_poll = calls_per_poll
+        if used:
+            quota.record("energyDetails", used)
+        return quota
+    return make
+
+
+def at(hour, minute=0):
+    return datetime(2026, 6, 1, hour, minute, tzinfo=ZoneInfo(TIMEZONE))
+
+
+def test_configured_interval_kept_while_within_budget(manager):
+    quota = manager(at(18), used=100)
+    # 6 awake hours left: 36 polls * 3 calls = 108 more, 208 in total
+    assert quota.plan_interval(600) == 600
+
+
+def test_interval_stretched_to_spread_remaining_budget(manager):
+    quota = manager(at(18), used=100)
+    # 180 requests left = 60 polls over 6 awake hours
+    assert quota.plan_interval(300) == pytest.approx(6 * 3600 / 60)
+    assert quota.projected_use(quota.plan_interval(300)) == pytest.approx(280)
+
+
+def test_spent_budget_waits_for_the_next_quota_day(manager):
+    quota = manager(at(22, 30), used=279)
+    assert quota.plan_interval(300) == pytest.approx(90 * 60 + 60)
+
+
+def test_ledger_from_another_day_is_discarded(manager):
+    quota = manager(at(12), used=50)
+    quota._now = lambda: datetime(2026, 6, 2, 7, tzinfo=ZoneInfo(TIMEZONE))
+    assert quota.used_today() == 0
+
+
+def test_daily_estimate_gates_data_calls_on_uploads():
+    # 18 awake hours, overview every poll, 2 data calls once per 15-minute upload
+    est = estimate_daily_calls(5, night, has_battery=False)
+    assert est["awake_hours"] == 18
+    assert est["daily_calls"] == pytest.approx(18 * 12 * (1 + 2 * 5 / 15) + 1)
+
+
+@pytest.mark.parametrize("battery, expected", [(False, 8.0), (True, 15.5)])
+def test_bisection_finds_the_break_even_interval(battery, expected):
+    minutes = interval_within_budget(280, night, battery)
+    assert minutes == pytest.approx(expected, abs=0.1)
+    assert estimate_daily_calls(minutes, night, battery)["daily_calls"] <= 280
+    assert estimate_daily_calls(minutes - 0.1, night, battery)["daily_calls"] > 280
+
+
+def test_bisection_reports_an_unreachable_budget():
+    assert interval_within_budget(2, night, has_battery=False) is None
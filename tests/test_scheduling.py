@@ -0,0 +1,141 @@
+"""Poll scheduling: upload-phase learning and alignment, activity-adaptive interval."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from models import PowerFlow
+from scheduling import (
+    LANDING_MARGIN_SECONDS,
+    LATE_RETRY_SECONDS,
+    MIN_DELAY_SECONDS,
+    UPLOAD_PERIOD_SECONDS,
+    AdaptiveInterval,
+    UploadPhaseTracker,
+    upload_phase,
+)
+
+# 2026-06-01 00:00:00 UTC; a multiple of the upload period, so epoch phase = clock phase
+DAY_START = 1780272000.0
+
+
+def lut(minute, second):
+    """lastUpdateTime on the test day at hh:mm:ss (minute may exceed 59)."""
+    t = datetime(2026, 6, 1, 10) + timedelta(minutes=minute, seconds=second)
+    return t.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return UploadPhaseTracker(tmp_path / "upload_phase.json")
+
+
+def learn(tracker, second, uploads=3):
+    """Observe uploads landing `second` seconds into consecutive quarter hours."""
+    for i in range(uploads):
+        assert tracker.observe(lut(15 * i, second))
+
+
+def test_upload_phase_parses_last_update_time():
+    assert upload_phase("2026-06-01 10:17:30") == 150
+    assert upload_phase("") is None
+    assert upload_phase("garbage") is None
+
+
+def test_phase_unknown_until_enough_samples(tracker):
+    learn(tracker, 100, uploads=2)
+    assert tracker.phase() is None
+    assert tracker.delay_until_poll(300, now=DAY_START) is None
+    tracker.observe(lut(30, 100))
+    assert tracker.phase() == pytest.approx(100)
+
+
+def test_circular_mean_wraps_around_the_bucket_boundary(tracker):
+    # 890 s, 5 s and 10 s are 10-20 s apart, not 880 s apart
+    for minute, second in ((14, 50), (15, 5), (30, 10)):
+        tracker.observe(lut(minute, second))
+    assert tracker.phase() == pytest.approx(1.67, abs=0.1)
+
+
+def test_irregular_uploads_are_not_aligned(tracker):
+    for minute, second in ((0, 0), (20, 0), (40, 0), (55, 0)):  # phases 0, 300, 600, 0
+        tracker.observe(lut(minute, second))
+    assert tracker.phase() is None
+
+
+def test_repeated_last_update_time_is_not_a_new_sample(tracker):
+    learn(tracker, 100)
+    assert not tracker.observe(lut(30, 100))
+    assert not tracker.observe("")
+
+
+def test_samples_persist(tmp_path, tracker):
+    learn(tracker, 100)
+    assert UploadPhaseTracker(tmp_path / "upload_phase.json").phase() == pytest.approx(100)
+
+
+@pytest.mark.parametrize("interval", [60, 300, 900, 1000])
+@pytest.mark.parametrize("now_offset", [0, 150, 161, 899])
+def test_poll_lands_on_the_first_landing_after_the_planned_time(tracker, interval, now_offset):
+    learn(tracker, 100)
+    now = DAY_START + now_offset
+    delay = tracker.delay_until_poll(interval, now=now)
+    landing = now + delay
+    assert landing % UPLOAD_PERIOD_SECONDS == pytest.approx(100 + LANDING_MARGIN_SECONDS)
+    assert delay >= max(interval, MIN_DELAY_SECONDS)
+    assert delay < max(interval, MIN_DELAY_SECONDS) + UPLOAD_PERIOD_SECONDS
+
+
+def test_only_the_first_missed_upload_is_retried_early(tracker):
+    learn(tracker, 100)
+    tracker.observe(lut(30, 100))  # first miss
+    assert tracker.delay_until_poll(60, now=DAY_START) == LATE_RETRY_SECONDS
+    assert tracker.delay_until_poll(600, now=DAY_START) == 600  # never below the planned interval
+    tracker.observe(lut(30, 100))  # second miss: back to aligned polls
+    delay = tracker.delay_until_poll(60, now=DAY_START)
+    assert (DAY_START + delay) % UPLOAD_PERIOD_SECONDS == pytest.approx(100 + LANDING_MARGIN_SECONDS)
+
+
+def flow(minutes, pv, load):
+    return PowerFlow(
+        grid_power=0.0, load_power=load, pv_power=pv, storage_power=0.0,
+        storage_status="Idle", state_of_charge=0, off_grid=False,
+        fetched_at=datetime(2026, 6, 1, 12) + timedelta(minutes=minutes),
+    )
+
+
+def test_start_interval_is_clamped_to_the_range():
+    assert AdaptiveInterval(300, 1800, 60).interval() == 300
+    assert AdaptiveInterval(300, 1800, 3600).interval() == 1800
+    assert AdaptiveInterval(300, 1800, 600).interval() == 600
+
+
+def test_calm_power_polls_at_the_longest_interval():
+    adaptive = AdaptiveInterval(300, 1800, 600)
+    for i in range(4):
+        adaptive.update(flow(5 * i, pv=2.0, load=0.5))
+    assert adaptive.interval() == 1800
+
+
+def test_busy_power_polls_at_the_shortest_interval():
+    adaptive = AdaptiveInterval(300, 1800, 600)
+    for i in range(4):
+        adaptive.update(flow(5 * i, pv=4.0 * (i % 2), load=0.5))
+    assert adaptive.interval() == pytest.approx(300)
+
+
+def test_moderate_activity_interpolates_geometrically():
+    adaptive = AdaptiveInterval(300, 1800, 600)
+    adaptive.activity = 0.55  # halfway between CALM_KW and BUSY_KW
+    assert adaptive.interval() == pytest.approx((300 * 1800) ** 0.5)
+
+
+def test_cached_and_stale_samples_do_not_count_as_activity():
+    adaptive = AdaptiveInterval(300, 1800, 600)
+    adaptive.update(flow(0, pv=0.0, load=0.5))
+    adaptive.update(flow(0.5, pv=5.0, load=0.5))  # < MIN_SAMPLE_GAP_SECONDS: ignored
+    assert adaptive.activity is None
+    adaptive.update(flow(120, pv=5.0, load=0.5))  # > MAX_SAMPLE_GAP_SECONDS: new baseline only
+    assert adaptive.activity is None
+    adaptive.update(flow(125, pv=5.0, load=0.5))
+    assert adaptive.activity == 0
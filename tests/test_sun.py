@@ -0,0 +1,79 @@
+"""Sun-based sleep window: every day of a year at several latitudes."""
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from config import TIMEZONE, Config
+from sun import is_daylight, is_polar_day, sun_times
+
+TZ = ZoneInfo(TIMEZONE)
+
+# (name, lat, lon): south to north, all inside or near the configured time zone
+LOCATIONS = [
+    ("Valletta", 35.90, 14.51),
+    ("Munich", 48.14, 11.58),
+    ("Kiel", 54.32, 10.14),
+    ("Oslo", 59.91, 10.75),
+]
+
+TROMSO = (69.65, 18.96)
+
+
+def days_of(year):
+    day = date(year, 1, 1)
+    while day.year == year:
+        yield day
+        day += timedelta(days=1)
+
+
+def at(day, hour, minute=0):
+    return datetime.combine(day, time(hour, minute), tzinfo=TZ)
+
+
+@pytest.fixture
+def sun_config(monkeypatch):
+    def make(lat, lon):
+        monkeypatch.setenv("SOLAREDGE_API_KEY", "test")
+        monkeypatch.setenv("SOLAREDGE_SITE_ID", "1")
+        monkeypatch.setenv("SOLAREDGE_SLEEP_MODE", "sun")
+        monkeypatch.setenv("FORECAST_LAT", str(lat))
+        monkeypatch.setenv("FORECAST_LON", str(lon))
+        return Config()
+    return make
+
+
+@pytest.mark.parametrize("year", [2026, 2028])
+@pytest.mark.parametrize("name, lat, lon", LOCATIONS)
+def test_sleep_window_every_day(sun_config, name, lat, lon, year):
+    config = sun_config(lat, lon)
+    for day in days_of(year):
+        sunrise, sunset = sun_times(day, lat, lon)
+        assert sunrise < sunset, day
+        assert sunrise.astimezone(TZ).date() == day == sunset.astimezone(TZ).date(), day
+
+        assert not config.is_sleeping(at(day, 12)), day
+        assert config.is_sleeping(at(day, 2)), day
+
+        for now in (at(day, 2), at(day, 23, 45)):
+            if not config.is_sleeping(now):
+                continue
+            wake = config.sleep_ends_at(now)
+            assert wake is not None and wake > now, now
+            assert not config.is_sleeping(wake + timedelta(minutes=1)), now
+
+
+def test_midnight_sun_is_awake_all_day():
+    day = date(2026, 6, 21)
+    assert is_polar_day(day, *TROMSO)
+    for minutes in range(0, 24 * 60, 5):
+        now = at(day, 0) + timedelta(minutes=minutes)
+        assert is_daylight(now, *TROMSO, 0, 30), now
+
+
+def test_polar_night_has_no_wake_time(sun_config):
+    config = sun_config(*TROMSO)
+    now = at(date(2026, 12, 21), 12)
+    assert config.is_sleeping(now)
+    assert config.sleep_ends_at(now) is None